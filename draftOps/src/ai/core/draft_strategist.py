@@ -232,7 +232,7 @@ class DraftStrategist:
             
         # Look at last 5 picks for position concentration
         recent_picks = pick_history[-5:]
-        position_picks = len([p for p in recent_picks if p.get('position') == position])
+        position_picks = sum(1 for p in recent_picks if p.get('position') == position)
         
         # If 2+ of last 5 picks were this position, there's run pressure
         run_intensity = position_picks / len(recent_picks)
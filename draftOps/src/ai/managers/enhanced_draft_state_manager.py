@@ -11,7 +11,6 @@ for AI-driven draft decision making. This integration provides:
 - Automatic context injection from DraftState to LangGraph
 """
 
-import asyncio
 import logging
 from typing import Dict, Any, Optional, Callable, List
 from datetime import datetime
@@ -127,7 +126,7 @@ class EnhancedDraftStateManager(DraftStateManager):
                 
             # Trigger AI analysis for significant picks
             if self.ai_enabled and self.supervisor:
-                asyncio.create_task(self._analyze_pick_with_ai(pick_data))
+                self._spawn(self._analyze_pick_with_ai(pick_data))
                 
         def enhanced_state_callback(state_summary: Dict[str, Any]):
             # Call original callback first
@@ -136,7 +135,7 @@ class EnhancedDraftStateManager(DraftStateManager):
                 
             # Trigger AI analysis for state changes
             if self.ai_enabled and self.supervisor:
-                asyncio.create_task(self._analyze_state_with_ai(state_summary))
+                self._spawn(self._analyze_state_with_ai(state_summary))
                 
         # Set enhanced callbacks
         self.on_pick_processed = enhanced_pick_callback
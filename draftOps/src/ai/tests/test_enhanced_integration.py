@@ -14,6 +14,7 @@ from pathlib import Path
 # Add project root to path
 
 from ai.managers.enhanced_draft_state_manager import EnhancedDraftStateManager
+from websocket_protocol.state.draft_state import Pick
 
 
 async def test_enhanced_manager_initialization():
@@ -290,8 +291,8 @@ async def test_draft_context_injection():
         
         # Add some pick history
         manager.draft_state._pick_history = [
-            {'pick_number': 45, 'player_name': 'Travis Kelce', 'team_id': 'team_3'},
-            {'pick_number': 46, 'player_name': 'Patrick Mahomes', 'team_id': 'team_4'}
+            Pick(pick_number=45, player_id='15847', team_id='team_3', position='TE', timestamp=''),
+            Pick(pick_number=46, player_id='3139477', team_id='team_4', position='QB', timestamp='')
         ]
         
         print("[OK] Rich draft state configured")
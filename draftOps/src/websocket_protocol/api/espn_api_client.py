@@ -80,6 +80,10 @@ class ESPNApiClient:
         self.player_cache: Dict[str, ESPNPlayer] = {}
         self.cache_expiry = timedelta(hours=1)  # Cache for 1 hour
         
+        # IDs the API answered with 404; any other None (timeout, 5xx,
+        # parse error) may succeed on retry
+        self.not_found_ids: Set[str] = set()
+        
         
         self.logger = logging.getLogger(__name__)
         
@@ -168,11 +172,14 @@ class ESPNApiClient:
             if response.status == 200:
                 try:
                     data = await response.json()
+                    self.not_found_ids.discard(player_id)
                     return self._create_player_from_nfl_data(data, player_id)
                 except Exception as e:
                     self.logger.warning(f"JSON parsing failed for NFL API {player_id}: {e}")
                     return None
             else:
+                if response.status == 404:
+                    self.not_found_ids.add(player_id)
                 self.logger.debug(f"NFL API returned {response.status} for {player_id}")
                 return None
                 
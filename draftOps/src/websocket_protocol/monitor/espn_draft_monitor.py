@@ -1,11 +1,18 @@
 import asyncio
 import json
 import logging
+import random
+import re
+from collections import deque
 from datetime import datetime, timedelta
-from typing import Optional, Callable, Dict, Any, List
+from time import monotonic
+from typing import Optional, Callable, Deque, Dict, Any, List
 from enum import Enum
 from playwright.async_api import async_playwright, Page, Browser, WebSocket
 
+# Pick number embedded in JSON frames, tracked for state recovery
+_PICK_NUMBER_RE = re.compile(r'"pickNumber"\s*:\s*(\d+)')
+
 
 class ConnectionState(Enum):
     """Connection state enumeration."""
@@ -25,12 +32,24 @@ class ESPNDraftMonitor:
     """
     
     def __init__(self, headless: bool = False, log_level: int = logging.INFO, 
-                 enable_recovery: bool = True):
+                 enable_recovery: bool = True, max_logged_messages: Optional[int] = None,
+                 frame_log_path: Optional[str] = None, frame_queue_size: int = 1024):
         self.headless = headless
         self.page: Optional[Page] = None
         self.browser: Optional[Browser] = None
         self.websockets: List[WebSocket] = []
-        self.message_log: List[Dict[str, Any]] = []
+        # Every frame by default; long-running callers that never save the
+        # log can pass max_logged_messages to keep only the most recent frames
+        self.message_log: Deque[Dict[str, Any]] = deque(maxlen=max_logged_messages)
+        self._log_eviction_warned = False
+        
+        # Optional full frame capture: handlers enqueue without blocking and a
+        # background task appends one JSON line per frame to frame_log_path
+        self.frame_log_path = frame_log_path
+        self.frame_queue_size = frame_queue_size
+        self.dropped_frames = 0  # Frames not written because the queue was full
+        self._frame_queue: Optional[asyncio.Queue] = None
+        self._frame_writer_task: Optional[asyncio.Task] = None
         
         # Set up logging
         logging.basicConfig(level=log_level, format='%(asctime)s - %(levelname)s - %(message)s')
@@ -48,11 +67,16 @@ class ESPNDraftMonitor:
         self.reconnect_attempts = 0
         self.max_reconnect_attempts = 5
         self.reconnect_delays = [1, 2, 4, 8, 16]  # Exponential backoff in seconds
+        self.max_reconnect_delay = 30  # Cap on any single backoff delay
+        self.reconnect_jitter = 0.5  # Delays vary by +/- this fraction to spread out retries
         
         # Heartbeat monitoring
-        self.last_heartbeat_time: Optional[datetime] = None
+        # Monotonic seconds of the last frame; immune to wall-clock jumps
+        self.last_heartbeat_monotonic: Optional[float] = None
         self.heartbeat_timeout_seconds = 30  # No heartbeat for 30s = dead connection
+        self.heartbeat_check_interval_seconds = 5
         self.heartbeat_monitor_task: Optional[asyncio.Task] = None
+        self._pending_disconnect_task: Optional[asyncio.Task] = None  # Keeps the task referenced
         
         # State preservation for recovery
         self.last_known_pick: int = 0
@@ -67,8 +91,94 @@ class ESPNDraftMonitor:
         # Set up WebSocket monitoring
         self.page.on("websocket", self._on_websocket)
         
+        if self.frame_log_path:
+            self.start_frame_writer()
+        
         self.logger.info(f"Browser started (headless={self.headless})")
         
+    def start_frame_writer(self):
+        """Start the background task that appends captured frames to frame_log_path."""
+        if self._frame_writer_task and not self._frame_writer_task.done():
+            return
+        self._frame_queue = asyncio.Queue(maxsize=self.frame_queue_size)
+        self._frame_writer_task = asyncio.create_task(self._write_frames(self._frame_queue))
+        self.logger.info(f"Writing captured frames to {self.frame_log_path}")
+        
+    async def stop_frame_writer(self):
+        """Flush queued frames to disk and stop the writer task."""
+        if not self._frame_writer_task:
+            return
+        if not self._frame_writer_task.done():
+            # Wait for the queue to drain, unless the writer fails first
+            drained = asyncio.create_task(self._frame_queue.join())
+            await asyncio.wait({drained, self._frame_writer_task},
+                               return_when=asyncio.FIRST_COMPLETED)
+            drained.cancel()
+        self._frame_writer_task.cancel()
+        try:
+            await self._frame_writer_task
+        except asyncio.CancelledError:
+            pass
+        except Exception as e:
+            self.logger.error(f"Frame writer failed: {e}")
+        self._frame_writer_task = None
+        self._frame_queue = None
+        
+    async def _write_frames(self, queue: asyncio.Queue):
+        """
+        Append queued frames to frame_log_path as JSON lines until cancelled.
+        
+        File I/O runs in the default executor, so a slow disk never stalls
+        the event loop that delivers frames.
+        """
+        loop = asyncio.get_running_loop()
+        f = await loop.run_in_executor(None, open, self.frame_log_path, 'a')
+        pending = None
+        try:
+            while True:
+                record = await queue.get()
+                # Write everything already queued before flushing once
+                lines = [json.dumps(record)]
+                while not queue.empty():
+                    lines.append(json.dumps(queue.get_nowait()))
+                pending = loop.run_in_executor(None, self._append_lines, f, lines)
+                # Shielded so cancellation cannot close the file mid-write
+                await asyncio.shield(pending)
+                for _ in lines:
+                    queue.task_done()
+        finally:
+            if pending is not None and not pending.done():
+                await asyncio.wait({pending})
+            f.close()
+            
+    @staticmethod
+    def _append_lines(f, lines: List[str]):
+        """Write JSON lines to an open frame log and flush them (executor side)."""
+        f.write('\n'.join(lines) + '\n')
+        f.flush()
+                    
+    def _record_frame(self, message_data: Dict[str, Any]):
+        """Keep a frame in the in-memory log and hand it to the disk writer."""
+        message_log = self.message_log
+        if (not self._log_eviction_warned and message_log.maxlen is not None
+                and len(message_log) == message_log.maxlen):
+            self._log_eviction_warned = True
+            self.logger.warning(
+                "Message log full at %d frames; older frames are now dropped from memory "
+                "(set max_logged_messages=None or frame_log_path to keep them all)",
+                message_log.maxlen
+            )
+        message_log.append(message_data)
+        
+        if self._frame_queue is not None:
+            try:
+                self._frame_queue.put_nowait(message_data)
+            except asyncio.QueueFull:
+                # Never stall the frame handler; count and report the loss
+                self.dropped_frames += 1
+                if self.dropped_frames == 1 or self.dropped_frames % 1000 == 0:
+                    self.logger.warning("Frame writer queue full, %d frames dropped", self.dropped_frames)
+        
     async def connect_to_draft(self, draft_url: str) -> bool:
         """
         Connect to ESPN draft room and start monitoring WebSocket traffic.
@@ -126,41 +236,34 @@ class ESPNDraftMonitor:
         
     def _on_frame_received(self, websocket: WebSocket, payload: str):
         """Handle incoming WebSocket frames."""
+        now = datetime.now()
         message_data = {
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": now.isoformat(),
             "direction": "received",
             "websocket_url": websocket.url,
             "payload": payload
         }
         
-        self.message_log.append(message_data)
+        self._record_frame(message_data)
         
-        # Update heartbeat time for any message, especially PING/PONG
+        # Any frame counts as a heartbeat; stamping a float is all the
+        # per-frame work, the monitor task compares it on its own schedule
         if self.enable_recovery:
-            self.last_heartbeat_time = datetime.now()
+            self.last_heartbeat_monotonic = monotonic()
             
             # Track PING/PONG specifically
             if "PING" in payload or "PONG" in payload:
-                self.logger.debug(f"Heartbeat received: {payload[:50]}")
-            
-            # Track pick numbers for state recovery
-            if "pickNumber" in payload or "current_pick" in payload:
-                try:
-                    # Simple extraction - could be enhanced based on actual protocol
-                    if "pickNumber" in payload:
-                        import re
-                        match = re.search(r'"pickNumber":\s*(\d+)', payload)
-                        if match:
-                            self.last_known_pick = int(match.group(1))
-                except Exception:
-                    pass  # Non-critical, just for tracking
-        
-        # Try to parse as JSON for better logging
-        try:
-            parsed = json.loads(payload)
-            self.logger.info(f"[RECV] {websocket.url}: {json.dumps(parsed, indent=2)}")
-        except json.JSONDecodeError:
-            self.logger.info(f"[RECV] {websocket.url}: {payload}")
+                self.logger.debug("Heartbeat received: %s", payload[:50])
+            
+            # Track pick numbers for state recovery; the regex reads the
+            # number straight from the frame without decoding the JSON
+            match = _PICK_NUMBER_RE.search(payload)
+            if match:
+                self.last_known_pick = int(match.group(1))
+        
+        # Pretty-printing decodes JSON frames, so only do it when INFO is logged
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info("[RECV] %s: %s", websocket.url, self._format_payload(payload))
             
         if self.on_message_received:
             self.on_message_received("received", websocket, payload)
@@ -174,18 +277,30 @@ class ESPNDraftMonitor:
             "payload": payload
         }
         
-        self.message_log.append(message_data)
+        self._record_frame(message_data)
         
-        # Try to parse as JSON for better logging
-        try:
-            parsed = json.loads(payload)
-            self.logger.info(f"[SENT] {websocket.url}: {json.dumps(parsed, indent=2)}")
-        except json.JSONDecodeError:
-            self.logger.info(f"[SENT] {websocket.url}: {payload}")
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info("[SENT] %s: %s", websocket.url, self._format_payload(payload))
             
         if self.on_message_received:
             self.on_message_received("sent", websocket, payload)
             
+    @staticmethod
+    def _format_payload(payload: str) -> str:
+        """
+        Format a frame payload for logging, pretty-printing JSON frames.
+        
+        ESPN's draft protocol is plain text ("SELECTED 1 ...", "CLOCK ..."),
+        so only payloads that start like a JSON document are decoded.
+        """
+        if payload[:1] not in ('{', '['):
+            return payload
+            
+        try:
+            return json.dumps(json.loads(payload), indent=2)
+        except json.JSONDecodeError:
+            return payload
+            
     def _on_websocket_close(self, websocket: WebSocket):
         """Handle WebSocket close events."""
         self.logger.info(f"WebSocket closed: {websocket.url}")
@@ -198,7 +313,9 @@ class ESPNDraftMonitor:
             
         # Trigger recovery if enabled and this was our main connection
         if self.enable_recovery and self.connection_state == ConnectionState.CONNECTED:
-            asyncio.create_task(self.handle_disconnection("WebSocket closed"))
+            self._pending_disconnect_task = asyncio.create_task(
+                self.handle_disconnection("WebSocket closed")
+            )
             
     async def monitor_for_duration(self, duration_seconds: int):
         """Monitor WebSocket traffic for a specified duration."""
@@ -216,9 +333,9 @@ class ESPNDraftMonitor:
         Returns:
             bool: True if WebSocket connections were detected
         """
-        start_time = datetime.now()
+        deadline = monotonic() + timeout
         
-        while (datetime.now() - start_time).seconds < timeout:
+        while monotonic() < deadline:
             if self.websockets:
                 self.logger.info(f"Found {len(self.websockets)} WebSocket connection(s)")
                 return True
@@ -229,14 +346,14 @@ class ESPNDraftMonitor:
         return False
         
     def get_message_log(self) -> List[Dict[str, Any]]:
-        """Get all captured WebSocket messages."""
-        return self.message_log.copy()
+        """Get the captured WebSocket messages still held in the log."""
+        return list(self.message_log)
         
     def save_message_log(self, filename: str):
         """Save captured messages to JSON file."""
         try:
             with open(filename, 'w') as f:
-                json.dump(self.message_log, f, indent=2)
+                json.dump(list(self.message_log), f, indent=2)
             self.logger.info(f"Message log saved to {filename}")
         except Exception as e:
             self.logger.error(f"Failed to save message log: {e}")
@@ -261,6 +378,8 @@ class ESPNDraftMonitor:
             except asyncio.CancelledError:
                 pass
                 
+        await self.stop_frame_writer()
+                
         if self.browser:
             await self.browser.close()
             
@@ -286,7 +405,8 @@ class ESPNDraftMonitor:
         self.pre_disconnect_state = {
             'last_pick': self.last_known_pick,
             'message_count': len(self.message_log),
-            'timestamp': datetime.now().isoformat()
+            'timestamp': datetime.now().isoformat(),
+            'monotonic': monotonic()
         }
         
         # Attempt reconnection with backoff
@@ -320,9 +440,14 @@ class ESPNDraftMonitor:
                 delay = 1  # Default 1-second delay if no delays configured
             else:
                 delay = self.reconnect_delays[min(attempt - 1, len(self.reconnect_delays) - 1)]
+                
+            # Jitter keeps clients dropped by the same outage from retrying in lockstep
+            if delay > 0:
+                delay = min(delay, self.max_reconnect_delay)
+                delay *= 1 + random.uniform(-self.reconnect_jitter, self.reconnect_jitter)
             
             if delay > 0:
-                self.logger.info(f"Waiting {delay} seconds before reconnection attempt {attempt + 1}/{self.max_reconnect_attempts}")
+                self.logger.info(f"Waiting {delay:.2f} seconds before reconnection attempt {attempt + 1}/{self.max_reconnect_attempts}")
                 await asyncio.sleep(delay)
             
             self.logger.info(f"Reconnection attempt {attempt + 1}/{self.max_reconnect_attempts}")
@@ -342,7 +467,7 @@ class ESPNDraftMonitor:
                         if await self.wait_for_websockets(timeout=10):
                             self.connection_state = ConnectionState.CONNECTED
                             self.reconnect_attempts = 0
-                            self.last_heartbeat_time = datetime.now()
+                            self.last_heartbeat_monotonic = monotonic()
                             
                             # Restart heartbeat monitor after successful reconnection
                             if self.enable_recovery:
@@ -371,10 +496,10 @@ class ESPNDraftMonitor:
         Returns:
             bool: True if connection is healthy
         """
-        if not self.last_heartbeat_time:
+        if self.last_heartbeat_monotonic is None:
             return self.connection_state == ConnectionState.CONNECTED
             
-        time_since_heartbeat = (datetime.now() - self.last_heartbeat_time).total_seconds()
+        time_since_heartbeat = monotonic() - self.last_heartbeat_monotonic
         
         if time_since_heartbeat > self.heartbeat_timeout_seconds:
             self.logger.warning(f"No heartbeat for {time_since_heartbeat:.1f} seconds")
@@ -388,7 +513,7 @@ class ESPNDraftMonitor:
         
         while self.connection_state in [ConnectionState.CONNECTED, ConnectionState.CONNECTING]:
             try:
-                await asyncio.sleep(5)  # Check every 5 seconds
+                await asyncio.sleep(self.heartbeat_check_interval_seconds)
                 
                 if self.connection_state == ConnectionState.CONNECTED:
                     if not await self.validate_connection_health():
@@ -414,9 +539,14 @@ class ESPNDraftMonitor:
             
         self.logger.info("Resynchronizing state after reconnection")
         
-        # Calculate time disconnected
+        # Calculate time disconnected; the monotonic stamp is immune to clock
+        # changes, the ISO timestamp covers state recorded without one
+        disconnected_at = self.pre_disconnect_state.get('monotonic')
         disconnect_time = self.pre_disconnect_state.get('timestamp')
-        if disconnect_time:
+        if disconnected_at is not None:
+            disconnect_duration = monotonic() - disconnected_at
+            self.logger.info(f"Was disconnected for {disconnect_duration:.1f} seconds")
+        elif disconnect_time:
             try:
                 disconnect_duration = (datetime.now() - datetime.fromisoformat(disconnect_time)).total_seconds()
                 self.logger.info(f"Was disconnected for {disconnect_duration:.1f} seconds")
@@ -15,17 +15,53 @@ import json
 import logging
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Set
+from typing import Dict, List, Set, Optional
+
+from playwright.async_api import async_playwright, Browser, BrowserContext, Playwright
 
 from ..monitor.espn_draft_monitor import ESPNDraftMonitor
 from ..utils.player_id_extractor import PlayerIdExtractor
 
 
+# One Chromium process per headless mode, shared by every logger in the
+# process; each logger gets its own (cheap) browser context
+_shared_playwright: Optional[Playwright] = None
+_shared_browsers: Dict[bool, Browser] = {}
+
+
+async def get_shared_browser(headless: bool) -> Browser:
+    """Return the shared browser for this headless mode, launching it on first use."""
+    global _shared_playwright
+    
+    browser = _shared_browsers.get(headless)
+    if browser is None or not browser.is_connected():
+        if _shared_playwright is None:
+            _shared_playwright = await async_playwright().start()
+        browser = await _shared_playwright.chromium.launch(headless=headless)
+        _shared_browsers[headless] = browser
+    return browser
+
+
+async def close_shared_browsers():
+    """Close the shared browsers and stop Playwright."""
+    global _shared_playwright
+    
+    for browser in _shared_browsers.values():
+        await browser.close()
+    _shared_browsers.clear()
+    
+    if _shared_playwright is not None:
+        await _shared_playwright.stop()
+        _shared_playwright = None
+
+
 class PlayerIdDraftLogger:
     """Enhanced draft logger focused on player ID extraction and analysis."""
     
     def __init__(self, headless: bool = False):
+        self.headless = headless
         self.monitor = ESPNDraftMonitor(headless=headless)
+        self.context: Optional[BrowserContext] = None
         self.player_id_extractor = PlayerIdExtractor()
         self.draft_events = []
         self.player_picks = []  # Specific tracking for player selection events
@@ -188,6 +224,13 @@ class PlayerIdDraftLogger:
             
         return False
         
+    async def _open_page(self):
+        """Give the monitor a page in a fresh context on the shared browser."""
+        browser = await get_shared_browser(self.headless)
+        self.context = await browser.new_context()
+        self.monitor.page = await self.context.new_page()
+        self.monitor.page.on("websocket", self.monitor._on_websocket)
+        
     async def run_player_id_analysis(self, duration: int = 600):
         """
         Run the enhanced draft logger focused on player ID analysis.
@@ -212,6 +255,7 @@ class PlayerIdDraftLogger:
             mock_draft_url = "https://fantasy.espn.com/football/mockdraftlobby"
             print(f"[INFO] Opening ESPN mock draft lobby...")
             
+            await self._open_page()
             success = await self.monitor.connect_to_draft(mock_draft_url)
             if not success:
                 print("[ERROR] Failed to connect")
@@ -332,7 +376,11 @@ class PlayerIdDraftLogger:
         # Print comprehensive summary
         self._print_final_summary(reports_dir, timestamp)
         
+        # The browser is shared, so only this logger's context is closed
         await self.monitor.close()
+        if self.context:
+            await self.context.close()
+            self.context = None
         
     async def _generate_analysis_summary(self, reports_dir: Path, timestamp: str):
         """Generate a comprehensive analysis summary."""
@@ -404,7 +452,10 @@ class PlayerIdDraftLogger:
 async def main():
     """Main entry point."""
     logger = PlayerIdDraftLogger(headless=False)
-    await logger.run_player_id_analysis(duration=600)  # Run for 10 minutes
+    try:
+        await logger.run_player_id_analysis(duration=600)  # Run for 10 minutes
+    finally:
+        await close_shared_browsers()
 
 
 if __name__ == "__main__":
@@ -91,6 +91,10 @@ class PlayerResolver:
         
         # Runtime cache
         self.memory_cache: Dict[str, ResolvedPlayer] = {}
+        self.memory_cache_max = 8192  # Oldest entries are evicted first
+        
+        # One long-lived connection, so SQLite's page cache survives between lookups
+        self._conn: Optional[sqlite3.Connection] = None
         self.cache_expiry = timedelta(hours=6)  # Memory cache expires after 6 hours
         
         # Performance tracking
@@ -107,12 +111,33 @@ class PlayerResolver:
         # Initialize database
         self._init_database()
         
+    def _connect(self) -> sqlite3.Connection:
+        """Return the cache database connection, opening it on first use."""
+        if self._conn is None:
+            conn = sqlite3.connect(self.cache_db_path)
+            # WAL keeps readers unblocked while a resolution is being written;
+            # NORMAL sync is safe under WAL and avoids an fsync per cached player
+            conn.execute('PRAGMA synchronous=NORMAL')
+            conn.execute('PRAGMA cache_size=-64000')  # 64 MB page cache
+            conn.execute('PRAGMA temp_store=MEMORY')
+            self._conn = conn
+        return self._conn
+        
+    def close(self):
+        """Close the cache database connection."""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+        
     def _init_database(self):
         """Initialize SQLite database for player caching."""
         try:
-            conn = sqlite3.connect(self.cache_db_path)
+            conn = self._connect()
             cursor = conn.cursor()
             
+            # Journal mode is persistent, so setting it once per file is enough
+            cursor.execute('PRAGMA journal_mode=WAL')
+            
             cursor.execute('''
                 CREATE TABLE IF NOT EXISTS players (
                     player_id TEXT PRIMARY KEY,
@@ -144,7 +169,6 @@ class PlayerResolver:
             ''')
             
             conn.commit()
-            conn.close()
             
             self.logger.info(f"Database initialized: {self.cache_db_path}")
             
@@ -156,12 +180,15 @@ class PlayerResolver:
         """Async context manager entry."""
         self.api_client = ESPNApiClient(season=self.season)
         await self.api_client.__aenter__()
+        # Validation reuses the resolver's HTTP session
+        self.validator.api_client = self.api_client
         return self
         
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Async context manager exit."""
         if self.api_client:
             await self.api_client.__aexit__(exc_type, exc_val, exc_tb)
+        self.close()
             
     def extract_player_ids_from_message(self, websocket_payload: str, 
                                       websocket_url: str = "") -> List[str]:
@@ -203,8 +230,8 @@ class PlayerResolver:
         self.stats["total_resolutions"] += 1
         
         # Check memory cache first
-        if espn_id in self.memory_cache:
-            cached_player = self.memory_cache[espn_id]
+        cached_player = self.memory_cache.get(espn_id)
+        if cached_player is not None:
             if self._is_cache_valid(cached_player):
                 self.stats["cache_hits"] += 1
                 self.logger.debug(f"Memory cache hit for player {espn_id}")
@@ -213,7 +240,7 @@ class PlayerResolver:
         # Check database cache
         db_player = self._get_from_database(espn_id)
         if db_player and self._is_cache_valid(db_player):
-            self.memory_cache[espn_id] = db_player
+            self._cache_put(espn_id, db_player)
             self.stats["cache_hits"] += 1
             self.logger.debug(f"Database cache hit for player {espn_id}")
             return db_player
@@ -229,7 +256,7 @@ class PlayerResolver:
             resolved_player = ResolvedPlayer.from_espn_player(espn_player, "API")
             
             # Cache the result
-            self.memory_cache[espn_id] = resolved_player
+            self._cache_put(espn_id, resolved_player)
             self._save_to_database(resolved_player)
             
             self.logger.info(f"Resolved player {espn_id}: {resolved_player.full_name}")
@@ -239,18 +266,38 @@ class PlayerResolver:
             fallback_player = self.create_fallback_player(espn_id)
             
             # Cache the fallback briefly (shorter expiry)
-            self.memory_cache[espn_id] = fallback_player
+            self._cache_put(espn_id, fallback_player)
             
             self.stats["failed_resolutions"] += 1
             self.logger.warning(f"Could not resolve player ID: {espn_id}, using fallback")
             return fallback_player
             
-    async def batch_resolve_ids(self, espn_ids: List[str]) -> Dict[str, Optional[ResolvedPlayer]]:
+    def was_not_found(self, espn_id: str) -> bool:
+        """
+        Check whether the API reported an ID as not found.
+        
+        A None from resolution can also mean a timeout, a server error or no
+        API client at all; only IDs the API answered with 404 are final.
+        
+        Args:
+            espn_id: ESPN player ID string
+            
+        Returns:
+            True if the API said the player does not exist
+        """
+        return self.api_client is not None and espn_id in self.api_client.not_found_ids
+        
+    async def batch_resolve_ids(self, espn_ids: List[str],
+                                max_concurrent: int = 10) -> Dict[str, Optional[ResolvedPlayer]]:
         """
         Resolve multiple ESPN player IDs efficiently.
         
+        Cache hits are answered synchronously; only the misses go to the API,
+        as one concurrent batch capped at max_concurrent in-flight requests.
+        
         Args:
             espn_ids: List of ESPN player ID strings
+            max_concurrent: Maximum concurrent API requests for cache misses
             
         Returns:
             Dictionary mapping player IDs to ResolvedPlayer objects (or None)
@@ -261,32 +308,35 @@ class PlayerResolver:
         self.logger.info(f"Batch resolving {len(espn_ids)} player IDs")
         
         results = {}
+        memory_misses = []
         uncached_ids = []
         
-        # Check caches first
-        for espn_id in espn_ids:
-            # Memory cache
-            if espn_id in self.memory_cache:
-                cached = self.memory_cache[espn_id]
-                if self._is_cache_valid(cached):
-                    results[espn_id] = cached
-                    self.stats["cache_hits"] += 1
-                    continue
-                    
-            # Database cache
-            db_player = self._get_from_database(espn_id)
+        # Check memory cache first
+        for espn_id in dict.fromkeys(espn_ids):
+            cached = self.memory_cache.get(espn_id)
+            if cached is not None and self._is_cache_valid(cached):
+                results[espn_id] = cached
+                self.stats["cache_hits"] += 1
+            else:
+                memory_misses.append(espn_id)
+                
+        # Database cache, one query for all memory misses
+        db_players = self._get_many_from_database(memory_misses) if memory_misses else {}
+        for espn_id in memory_misses:
+            db_player = db_players.get(espn_id)
             if db_player and self._is_cache_valid(db_player):
                 results[espn_id] = db_player
-                self.memory_cache[espn_id] = db_player
+                self._cache_put(espn_id, db_player)
                 self.stats["cache_hits"] += 1
-                continue
-                
-            uncached_ids.append(espn_id)
+            else:
+                uncached_ids.append(espn_id)
             
         # Fetch uncached IDs from API
         if uncached_ids and self.api_client:
             self.logger.debug(f"Fetching {len(uncached_ids)} players from API")
-            api_results = await self.api_client.batch_get_players(uncached_ids)
+            api_results = await self.api_client.batch_get_players(
+                uncached_ids, max_concurrent=max_concurrent
+            )
             
             for espn_id, espn_player in api_results.items():
                 self.stats["api_calls"] += 1
@@ -294,7 +344,7 @@ class PlayerResolver:
                 if espn_player:
                     resolved = ResolvedPlayer.from_espn_player(espn_player, "API")
                     results[espn_id] = resolved
-                    self.memory_cache[espn_id] = resolved
+                    self._cache_put(espn_id, resolved)
                     self._save_to_database(resolved)
                 else:
                     results[espn_id] = None
@@ -307,7 +357,7 @@ class PlayerResolver:
                 
         self.stats["total_resolutions"] += len(espn_ids)
         
-        successful = len([r for r in results.values() if r is not None])
+        successful = sum(1 for r in results.values() if r is not None)
         self.logger.info(f"Batch resolution complete: {successful}/{len(espn_ids)} successful")
         
         return results
@@ -324,7 +374,7 @@ class PlayerResolver:
             List of ResolvedPlayer objects matching the name
         """
         try:
-            conn = sqlite3.connect(self.cache_db_path)
+            conn = self._connect()
             cursor = conn.cursor()
             
             # Simple LIKE search (could be enhanced with fuzzy string matching)
@@ -344,7 +394,6 @@ class PlayerResolver:
                   name.lower(), f"{name.lower()}%", limit))
             
             rows = cursor.fetchall()
-            conn.close()
             
             results = []
             for row in rows:
@@ -390,6 +439,13 @@ class PlayerResolver:
             resolution_source="Fallback - API unavailable"
         )
         
+    def _cache_put(self, espn_id: str, player: ResolvedPlayer) -> None:
+        """Store a player in the memory cache, evicting the oldest entry when full."""
+        self.memory_cache.pop(espn_id, None)
+        self.memory_cache[espn_id] = player
+        if len(self.memory_cache) > self.memory_cache_max:
+            del self.memory_cache[next(iter(self.memory_cache))]
+            
     def _is_cache_valid(self, player: ResolvedPlayer) -> bool:
         """Check if cached player data is still valid."""
         if not player.last_updated:
@@ -405,12 +461,11 @@ class PlayerResolver:
     def _get_from_database(self, espn_id: str) -> Optional[ResolvedPlayer]:
         """Get player from database cache."""
         try:
-            conn = sqlite3.connect(self.cache_db_path)
+            conn = self._connect()
             cursor = conn.cursor()
             
             cursor.execute('SELECT * FROM players WHERE player_id = ?', (espn_id,))
             row = cursor.fetchone()
-            conn.close()
             
             if row:
                 return self._row_to_resolved_player(row)
@@ -420,10 +475,32 @@ class PlayerResolver:
             
         return None
         
+    def _get_many_from_database(self, espn_ids: List[str]) -> Dict[str, ResolvedPlayer]:
+        """Get several players from the database cache with IN queries."""
+        players = {}
+        try:
+            conn = self._connect()
+            # Stay under SQLite's default limit of 999 bound parameters
+            for start in range(0, len(espn_ids), 900):
+                chunk = espn_ids[start:start + 900]
+                placeholders = ','.join('?' * len(chunk))
+                rows = conn.execute(
+                    f'SELECT * FROM players WHERE player_id IN ({placeholders})', chunk
+                ).fetchall()
+                for row in rows:
+                    player = self._row_to_resolved_player(row)
+                    if player:
+                        players[player.player_id] = player
+                        
+        except Exception as e:
+            self.logger.error(f"Database read error: {e}")
+            
+        return players
+        
     def _save_to_database(self, player: ResolvedPlayer):
         """Save player to database cache."""
         try:
-            conn = sqlite3.connect(self.cache_db_path)
+            conn = self._connect()
             cursor = conn.cursor()
             
             # Create data hash for change detection
@@ -445,9 +522,10 @@ class PlayerResolver:
             ))
             
             conn.commit()
-            conn.close()
             
         except Exception as e:
+            if self._conn is not None:
+                self._conn.rollback()
             self.logger.error(f"Database save error: {e}")
             
     def _row_to_resolved_player(self, row) -> Optional[ResolvedPlayer]:
@@ -493,11 +571,10 @@ class PlayerResolver:
     def get_cached_player_count(self) -> int:
         """Get total number of cached players in database."""
         try:
-            conn = sqlite3.connect(self.cache_db_path)
+            conn = self._connect()
             cursor = conn.cursor()
             cursor.execute('SELECT COUNT(*) FROM players')
             count = cursor.fetchone()[0]
-            conn.close()
             return count
         except:
             return 0
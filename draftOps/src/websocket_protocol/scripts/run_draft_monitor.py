@@ -18,7 +18,7 @@ from pathlib import Path
 from typing import Optional
 
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', '..'))
-from src.websocket_protocol.state.integration import DraftStateManager
+from src.websocket_protocol.state.integration import DraftStateManager, install_uvloop
 
 class LoggingOutput:
     """Custom output handler that separates console and file logging."""
@@ -519,4 +519,5 @@ async def main():
 
 
 if __name__ == "__main__":
+    install_uvloop()
     asyncio.run(main())
\ No newline at end of file
@@ -5,13 +5,14 @@ This package provides the core DraftState system that maintains accurate
 real-time draft state based on WebSocket messages from ESPN.
 """
 
-from .draft_state import DraftState, DraftStateSnapshot
+from .draft_state import DraftState, DraftStateSnapshot, Pick
 from .event_processor import DraftEventProcessor
 from .state_handlers import StateUpdateHandlers
 
 __all__ = [
     'DraftState',
     'DraftStateSnapshot', 
+    'Pick',
     'DraftEventProcessor',
     'StateUpdateHandlers'
 ]
\ No newline at end of file
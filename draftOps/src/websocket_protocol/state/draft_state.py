@@ -9,12 +9,14 @@ Implements the DraftState data structure specified in Sprint 1 with
 immutable state updates and comprehensive validation.
 """
 
+import asyncio
+import bisect
 import logging
 from dataclasses import dataclass, field, asdict
 from typing import Dict, List, Set, Optional, Any, Tuple, Union
 from datetime import datetime
 from enum import Enum
-import copy
+from collections import Counter
 
 # Player data model + name-normalization tables (source-root module).
 from data_loader import Player, normalize_player_name, ESPN_TO_ADP_DEFENSE, ESPN_TO_DEF_STATS
@@ -28,7 +30,27 @@ class DraftStatus(Enum):
     PAUSED = "PAUSED"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
+class Pick:
+    """Immutable record of a single draft pick."""
+    pick_number: int
+    player_id: str
+    team_id: str
+    position: str
+    timestamp: str
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert pick to dictionary for serialization."""
+        return {
+            'pick_number': self.pick_number,
+            'player_id': self.player_id,
+            'team_id': self.team_id,
+            'position': self.position,
+            'timestamp': self.timestamp
+        }
+
+
+@dataclass(frozen=True, slots=True)
 class DraftStateSnapshot:
     """Immutable snapshot of draft state at a point in time."""
     timestamp: str
@@ -41,7 +63,7 @@ class DraftStateSnapshot:
     time_remaining: float
     on_the_clock: str
     draft_status: DraftStatus
-    pick_history: tuple[Dict[str, Any], ...]
+    pick_history: tuple[Pick, ...]
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert snapshot to dictionary for serialization."""
@@ -59,10 +81,21 @@ class DraftStateSnapshot:
             'time_remaining': self.time_remaining,
             'on_the_clock': self.on_the_clock,
             'draft_status': self.draft_status.value,
-            'pick_history': list(self.pick_history)
+            'pick_history': [pick.to_dict() for pick in self.pick_history]
         }
 
 
+@dataclass(frozen=True, slots=True)
+class _SnapshotMark:
+    """Watermark into the pick log plus the scalar state at snapshot time."""
+    timestamp: str
+    pick_count: int
+    current_pick: int
+    time_remaining: float
+    on_the_clock: str
+    draft_status: DraftStatus
+
+
 class DraftState:
     """
     Real-time ESPN draft state management.
@@ -99,32 +132,42 @@ class DraftState:
         
         # Core state - mutable for performance, immutable updates via methods
         self._drafted_players: Set[str] = set()  # ESPN player IDs
-        self._available_players: List[str] = []  # ESPN player IDs
+        self._available_players: Dict[str, None] = {}  # ESPN player IDs, insertion-ordered set
         
         # Player data lookup (separate from ESPN draft tracking)
         self._player_database: List['Player'] = []  # All Player objects from CSV data
         self._player_lookup: Dict[str, 'Player'] = {}  # Name -> Player lookup
+        self._players_by_adp: List['Player'] = []  # _player_database sorted by ADP rank
+        self._players_by_position: Dict[str, List['Player']] = {}  # Position -> ADP-sorted players
         self._my_roster: Dict[str, List[str]] = {
             'QB': [], 'RB': [], 'WR': [], 'TE': [], 'K': [], 'DST': [], 'FLEX': [], 'BENCH': []
         }
         self._other_rosters: Dict[str, Dict[str, List[str]]] = {}
+        self._roster_version: int = 0  # Bumped whenever _my_roster changes
+        self._roster_sizes: Counter = Counter()  # team_id -> players rostered
         
         # Draft position state
         self._current_pick: int = 0
         self._picks_until_next: int = 0
+        self._picks_dirty: bool = False  # _picks_until_next is stale; recomputed on read
         self._time_remaining: float = 0.0
         self._on_the_clock: str = ""
         
         # Draft metadata
         self._draft_status: DraftStatus = DraftStatus.WAITING
-        self._pick_history: List[Dict[str, Any]] = []
+        self.status_changed = asyncio.Event()  # Set whenever draft_status changes
+        self._pick_history: List[Pick] = []
+        self._team_pick_indices: Dict[str, List[int]] = {}  # team_id -> indices into _pick_history
         
         # Snake draft order calculation
         self._draft_order: List[str] = []  # Team IDs in draft order
         self._my_pick_positions: List[int] = []  # Our pick positions
         
         # State management
-        self._state_snapshots: List[DraftStateSnapshot] = []
+        # Snapshots are watermarks into _pick_history (the delta log); rollback
+        # undoes the picks past the mark instead of restoring a full copy.
+        self._state_snapshots: List[_SnapshotMark] = []
+        self._pick_removed_from_pool: List[bool] = []  # Parallel to _pick_history
         self._max_snapshots: int = 100
         
         self.logger = logging.getLogger(__name__)
@@ -138,17 +181,39 @@ class DraftState:
     @property
     def available_players(self) -> List[str]:
         """Get list of available player IDs."""
-        return self._available_players.copy()
+        return list(self._available_players)
+        
+    @property
+    def available_count(self) -> int:
+        """Get number of available player IDs."""
+        return len(self._available_players)
+        
+    def is_drafted(self, player_id: str) -> bool:
+        """Check whether a player has been drafted."""
+        return player_id in self._drafted_players
+        
+    def is_available(self, player_id: str) -> bool:
+        """Check whether a player is in the available pool."""
+        return player_id in self._available_players
         
     @property
     def my_roster(self) -> Dict[str, List[str]]:
         """Get our team's roster."""
-        return copy.deepcopy(self._my_roster)
+        # Roster lists hold immutable ID strings, so copying each list is a full copy
+        return {pos: players.copy() for pos, players in self._my_roster.items()}
+        
+    @property
+    def roster_version(self) -> int:
+        """Get counter that changes whenever our roster changes."""
+        return self._roster_version
         
     @property 
     def other_rosters(self) -> Dict[str, Dict[str, List[str]]]:
         """Get other teams' rosters."""
-        return copy.deepcopy(self._other_rosters)
+        return {
+            team: {pos: players.copy() for pos, players in roster.items()}
+            for team, roster in self._other_rosters.items()
+        }
         
     @property
     def current_pick(self) -> int:
@@ -158,6 +223,8 @@ class DraftState:
     @property
     def picks_until_next(self) -> int:
         """Get picks until our next turn."""
+        if self._picks_dirty:
+            self._update_picks_until_next()
         return self._picks_until_next
         
     @property
@@ -178,7 +245,32 @@ class DraftState:
     @property
     def pick_history(self) -> List[Dict[str, Any]]:
         """Get complete pick history."""
-        return copy.deepcopy(self._pick_history)
+        return [pick.to_dict() for pick in self._pick_history]
+        
+    @property
+    def pick_count(self) -> int:
+        """Get number of picks in the history."""
+        return len(self._pick_history)
+        
+    def team_pick_count(self, team_id: str) -> int:
+        """Get number of picks in the history made by a team."""
+        return len(self._team_pick_indices.get(team_id, ()))
+        
+    def team_picks(self, team_id: str) -> List[Dict[str, Any]]:
+        """
+        Get the picks made by one team, in draft order.
+        
+        Args:
+            team_id: Team to look up
+            
+        Returns:
+            List of pick records (copies)
+        """
+        return [self._pick_history[i].to_dict() for i in self._team_pick_indices.get(team_id, ())]
+        
+    def roster_size(self, team_id: str) -> int:
+        """Get number of players on a team's roster."""
+        return self._roster_sizes[team_id]
         
     def initialize_player_pool(self, player_ids: List[str]) -> None:
         """
@@ -187,7 +279,7 @@ class DraftState:
         Args:
             player_ids: List of ESPN player IDs
         """
-        self._available_players = player_ids.copy()
+        self._available_players = dict.fromkeys(player_ids)
         self.logger.info(f"Initialized player pool with {len(player_ids)} ESPN player IDs")
         
     def load_player_database(self, players: List['Player']) -> None:
@@ -199,6 +291,13 @@ class DraftState:
         """
         self._player_database = players.copy()
         
+        # ADP order and position buckets are fixed once loaded, so sort once
+        # here instead of on every position or top-N query
+        self._players_by_adp = sorted(players, key=lambda p: p.adp_rank)
+        self._players_by_position = {}
+        for player in self._players_by_adp:
+            self._players_by_position.setdefault(player.position, []).append(player)
+        
         # Build comprehensive name lookup table
         self._player_lookup = {}
         for player in players:
@@ -263,16 +362,9 @@ class DraftState:
         Returns:
             List of available Player objects for the position
         """
-        available = []
-        for player in self._player_database:
-            if player.position == position:
-                # Check if player is not drafted (need ESPN ID to check this)
-                # For now, just return all players by position since we don't have ESPN->name mapping
-                available.append(player)
-                
-        # Sort by ADP rank
-        available.sort(key=lambda p: p.adp_rank)
-        return available
+        # Check if player is not drafted (need ESPN ID to check this)
+        # For now, just return all players by position since we don't have ESPN->name mapping
+        return list(self._players_by_position.get(position, ()))
         
     def get_top_available_players(self, limit: int = 10) -> List['Player']:
         """
@@ -286,9 +378,7 @@ class DraftState:
         """
         # Return all players from database sorted by ADP
         # TODO: Filter out drafted players when we have ESPN ID -> name mapping
-        available = self._player_database.copy()
-        available.sort(key=lambda p: p.adp_rank)
-        return available[:limit]
+        return self._players_by_adp[:limit]
         
     def is_player_drafted(self, player_name: str) -> bool:
         """
@@ -337,14 +427,13 @@ class DraftState:
                 self.logger.error(f"Invalid team position {my_position} >= team_count {self.team_count}")
                 return
                 
-            self._my_pick_positions = []
-            
-            for round_num in range(self.rounds):
-                if round_num % 2 == 0:  # Even rounds (0-indexed): normal order
-                    pick = round_num * self.team_count + my_position + 1
-                else:  # Odd rounds: reverse order
-                    pick = round_num * self.team_count + (self.team_count - my_position)
-                self._my_pick_positions.append(pick)
+            # Even rounds (0-indexed) run in draft order, odd rounds in reverse
+            forward_pick = my_position + 1
+            reverse_pick = self.team_count - my_position
+            self._my_pick_positions = [
+                round_num * self.team_count + (reverse_pick if round_num % 2 else forward_pick)
+                for round_num in range(self.rounds)
+            ]
                 
         self.logger.info(f"Set draft order, our picks: {self._my_pick_positions}")
         
@@ -374,36 +463,39 @@ class DraftState:
             # Take snapshot before change (for rollback capability)
             self._take_snapshot()
             
-            # Update state
-            self._drafted_players.add(player_id)
-            
-            # Remove ESPN player ID from available pool if present
-            if player_id in self._available_players:
-                self._available_players.remove(player_id)
-                
-            # Update roster
+            # Update roster first so an unknown position fails before any
+            # other state is touched (rollback only undoes logged picks)
             if team_id == self.my_team_id:
                 self._my_roster[position].append(player_id)
+                self._roster_version += 1
             else:
                 if team_id not in self._other_rosters:
-                    self._other_rosters[team_id] = {
-                        'QB': [], 'RB': [], 'WR': [], 'TE': [], 'K': [], 'DST': [], 'FLEX': [], 'BENCH': []
-                    }
+                    self._other_rosters[team_id] = self._empty_roster()
                 self._other_rosters[team_id][position].append(player_id)
+            self._roster_sizes[team_id] += 1
+            
+            # Update state
+            self._drafted_players.add(player_id)
+            
+            # Remove ESPN player ID from available pool if present
+            removed = player_id in self._available_players
+            if removed:
+                del self._available_players[player_id]
                 
-            # Update pick tracking
+            # Update pick tracking; picks_until_next is recomputed on next read
             self._current_pick = pick_number
-            self._update_picks_until_next()
+            self._picks_dirty = True
             
             # Add to history
-            pick_record = {
-                'pick_number': pick_number,
-                'player_id': player_id,
-                'team_id': team_id,
-                'position': position,
-                'timestamp': datetime.now().isoformat()
-            }
-            self._pick_history.append(pick_record)
+            self._pick_history.append(Pick(
+                pick_number=pick_number,
+                player_id=player_id,
+                team_id=team_id,
+                position=position,
+                timestamp=datetime.now().isoformat()
+            ))
+            self._pick_removed_from_pool.append(removed)
+            self._team_pick_indices.setdefault(team_id, []).append(len(self._pick_history) - 1)
             
             self.logger.info(f"Applied pick {pick_number}: Player {player_id} to team {team_id}")
             return True
@@ -431,12 +523,12 @@ class DraftState:
             self._on_the_clock = team_id
             self._time_remaining = time_limit
             
-            # Update picks until our next turn
-            self._update_picks_until_next()
+            # Picks until our next turn is recomputed on next read
+            self._picks_dirty = True
             
             # Update draft status
             if self._draft_status == DraftStatus.WAITING:
-                self._draft_status = DraftStatus.IN_PROGRESS
+                self._set_draft_status(DraftStatus.IN_PROGRESS)
                 
             self.logger.info(f"Pick {pick_number} started, team {team_id} on clock")
             return True
@@ -464,22 +556,27 @@ class DraftState:
             
     def _update_picks_until_next(self) -> None:
         """Calculate picks remaining until our next turn."""
-        if not self._my_pick_positions or self._current_pick >= max(self._my_pick_positions):
-            self._picks_until_next = 0
-            return
-            
-        # Find next pick position
-        for pick_pos in self._my_pick_positions:
-            if pick_pos > self._current_pick:
-                self._picks_until_next = pick_pos - self._current_pick
-                return
-                
-        self._picks_until_next = 0
-        
+        self._picks_until_next = self._picks_until_next_from(self._current_pick)
+        self._picks_dirty = False
+        
+    def _picks_until_next_from(self, current_pick: int) -> int:
+        """Picks from current_pick until our next turn (0 if none remain)."""
+        # _my_pick_positions is ascending, so the next pick is found by bisection
+        index = bisect.bisect_right(self._my_pick_positions, current_pick)
+        if index < len(self._my_pick_positions):
+            return self._my_pick_positions[index] - current_pick
+        return 0
+        
+    def _set_draft_status(self, status: DraftStatus) -> None:
+        """Update draft status and wake anything awaiting status_changed."""
+        if status != self._draft_status:
+            self._draft_status = status
+            self.status_changed.set()
+            
     def complete_draft(self) -> None:
         """Mark draft as completed."""
         self._take_snapshot()
-        self._draft_status = DraftStatus.COMPLETED
+        self._set_draft_status(DraftStatus.COMPLETED)
         self._on_the_clock = ""
         self._time_remaining = 0.0
         
@@ -509,13 +606,13 @@ class DraftState:
                 errors.append(f"Current pick ({self._current_pick}) is too far ahead of completed picks ({completed_picks})")
             
         # All drafted players should be out of available pool
-        overlap = self._drafted_players.intersection(set(self._available_players))
+        overlap = self._drafted_players.intersection(self._available_players)
         if overlap:
             errors.append(f"Players in both drafted and available: {overlap}")
             
         # Roster counts should be reasonable
         total_my_picks = sum(len(players) for players in self._my_roster.values())
-        expected_my_picks = sum(1 for pick in self._pick_history if pick['team_id'] == self.my_team_id)
+        expected_my_picks = self.team_pick_count(self.my_team_id)
         if total_my_picks != expected_my_picks:
             errors.append(f"My roster count ({total_my_picks}) != expected picks ({expected_my_picks})")
             
@@ -527,35 +624,33 @@ class DraftState:
             
         return is_valid, errors
         
+    @staticmethod
+    def _empty_roster() -> Dict[str, List[str]]:
+        """Build an empty roster keyed by lineup position."""
+        return {'QB': [], 'RB': [], 'WR': [], 'TE': [], 'K': [], 'DST': [], 'FLEX': [], 'BENCH': []}
+        
     def _take_snapshot(self) -> None:
-        """Take immutable snapshot of current state."""
-        snapshot = DraftStateSnapshot(
+        """Record a snapshot mark at the current end of the pick log."""
+        self._state_snapshots.append(_SnapshotMark(
             timestamp=datetime.now().isoformat(),
-            drafted_players=frozenset(self._drafted_players),
-            available_players=tuple(self._available_players),
-            my_roster={pos: tuple(players) for pos, players in self._my_roster.items()},
-            other_rosters={
-                team: {pos: tuple(players) for pos, players in roster.items()}
-                for team, roster in self._other_rosters.items()
-            },
+            pick_count=len(self._pick_history),
             current_pick=self._current_pick,
-            picks_until_next=self._picks_until_next,
             time_remaining=self._time_remaining,
             on_the_clock=self._on_the_clock,
-            draft_status=self._draft_status,
-            pick_history=tuple(self._pick_history)
-        )
-        
-        self._state_snapshots.append(snapshot)
+            draft_status=self._draft_status
+        ))
         
-        # Limit snapshot history with efficient cleanup
+        # Limit snapshot history; marks are tiny, the pick log itself is kept
         if len(self._state_snapshots) > self._max_snapshots:
-            self._state_snapshots = self._state_snapshots[1:]
+            del self._state_snapshots[0]
             
     def get_snapshot(self, index: int = -1) -> Optional[DraftStateSnapshot]:
         """
         Get state snapshot by index.
         
+        The snapshot is materialized from the pick log on demand, so it
+        costs O(picks) here rather than on every state change.
+        
         Args:
             index: Snapshot index (-1 for latest)
             
@@ -563,14 +658,50 @@ class DraftState:
             DraftStateSnapshot or None if invalid index
         """
         try:
-            return self._state_snapshots[index]
+            mark = self._state_snapshots[index]
         except (IndexError, TypeError):
             return None
             
+        picks = self._pick_history[:mark.pick_count]
+        later = range(mark.pick_count, len(self._pick_history))
+        
+        my_roster = {pos: [] for pos in self._my_roster}
+        other_rosters: Dict[str, Dict[str, List[str]]] = {}
+        for pick in picks:
+            if pick.team_id == self.my_team_id:
+                roster = my_roster
+            else:
+                roster = other_rosters.setdefault(pick.team_id, self._empty_roster())
+            roster.setdefault(pick.position, []).append(pick.player_id)
+            
+        available = list(self._available_players)
+        available.extend(
+            self._pick_history[i].player_id for i in later if self._pick_removed_from_pool[i]
+        )
+        
+        return DraftStateSnapshot(
+            timestamp=mark.timestamp,
+            drafted_players=frozenset(pick.player_id for pick in picks),
+            available_players=tuple(available),
+            my_roster={pos: tuple(players) for pos, players in my_roster.items()},
+            other_rosters={
+                team: {pos: tuple(players) for pos, players in roster.items()}
+                for team, roster in other_rosters.items()
+            },
+            current_pick=mark.current_pick,
+            picks_until_next=self._picks_until_next_from(mark.current_pick),
+            time_remaining=mark.time_remaining,
+            on_the_clock=mark.on_the_clock,
+            draft_status=mark.draft_status,
+            pick_history=tuple(picks)
+        )
+            
     def rollback_to_snapshot(self, index: int) -> bool:
         """
         Rollback state to a previous snapshot.
         
+        Picks logged after the snapshot mark are undone in reverse order.
+        
         Args:
             index: Snapshot index to rollback to
             
@@ -581,25 +712,21 @@ class DraftState:
             if index >= len(self._state_snapshots) or index < -len(self._state_snapshots):
                 return False
                 
-            snapshot = self._state_snapshots[index]
+            mark = self._state_snapshots[index]
             
-            # Restore state from snapshot
-            self._drafted_players = set(snapshot.drafted_players)
-            self._available_players = list(snapshot.available_players)
-            self._my_roster = {pos: list(players) for pos, players in snapshot.my_roster.items()}
-            self._other_rosters = {
-                team: {pos: list(players) for pos, players in roster.items()}
-                for team, roster in snapshot.other_rosters.items()
-            }
-            self._current_pick = snapshot.current_pick
-            self._picks_until_next = snapshot.picks_until_next
-            self._time_remaining = snapshot.time_remaining
-            self._on_the_clock = snapshot.on_the_clock
-            self._draft_status = snapshot.draft_status
-            self._pick_history = list(snapshot.pick_history)
+            while len(self._pick_history) > mark.pick_count:
+                self._undo_last_pick()
+                
+            self._current_pick = mark.current_pick
+            self._picks_dirty = True
+            self._time_remaining = mark.time_remaining
+            self._on_the_clock = mark.on_the_clock
+            self._set_draft_status(mark.draft_status)
             
             # Remove snapshots after rollback point
-            self._state_snapshots = self._state_snapshots[:index + 1]
+            if index < 0:
+                index += len(self._state_snapshots)
+            del self._state_snapshots[index + 1:]
             
             self.logger.info(f"Rolled back to snapshot {index}")
             return True
@@ -608,11 +735,43 @@ class DraftState:
             self.logger.error(f"Error rolling back: {e}")
             return False
             
+    def _undo_last_pick(self) -> None:
+        """Revert the most recent pick in the log."""
+        pick = self._pick_history.pop()
+        removed = self._pick_removed_from_pool.pop()
+        player_id, team_id = pick.player_id, pick.team_id
+        
+        self._drafted_players.discard(player_id)
+        if removed:
+            self._available_players[player_id] = None
+            
+        if team_id == self.my_team_id:
+            roster = self._my_roster
+            self._roster_version += 1
+        else:
+            roster = self._other_rosters[team_id]
+        players = roster[pick.position]
+        if players and players[-1] == player_id:
+            players.pop()
+        else:
+            players.remove(player_id)
+            
+        self._roster_sizes[team_id] -= 1
+        if self._roster_sizes[team_id] <= 0:
+            del self._roster_sizes[team_id]
+            if team_id != self.my_team_id:
+                del self._other_rosters[team_id]
+                
+        indices = self._team_pick_indices[team_id]
+        indices.pop()
+        if not indices:
+            del self._team_pick_indices[team_id]
+            
     def get_stats(self) -> Dict[str, Any]:
         """Get draft state statistics."""
         total_picks = len(self._pick_history)
         total_available = len(self._available_players)
-        my_picks = sum(1 for pick in self._pick_history if pick['team_id'] == self.my_team_id)
+        my_picks = self.team_pick_count(self.my_team_id)
         
         return {
             'league_id': self.league_id,
@@ -621,7 +780,7 @@ class DraftState:
             'current_pick': self._current_pick,
             'total_picks': total_picks,
             'my_picks': my_picks,
-            'picks_until_next': self._picks_until_next,
+            'picks_until_next': self.picks_until_next,
             'available_players': total_available,
             'time_remaining': self._time_remaining,
             'on_the_clock': self._on_the_clock,
@@ -7,9 +7,10 @@ Based on Sprint 0's protocol discovery showing text-based command structure.
 """
 
 import logging
-from typing import Dict, Any, Optional, Callable, List
+import sys
+from typing import Dict, Any, Optional, Callable, List, ClassVar, Union
 from datetime import datetime
-import re
+from dataclasses import dataclass, asdict
 
 from .draft_state import DraftState
 
@@ -19,6 +20,58 @@ class MessageParseError(Exception):
     pass
 
 
+@dataclass(slots=True)
+class ProcessorStats:
+    """Message counters for DraftEventProcessor."""
+    total_messages: int = 0
+    selected_messages: int = 0
+    selecting_messages: int = 0
+    clock_messages: int = 0
+    parse_errors: int = 0
+    state_update_errors: int = 0
+
+
+class _ParsedMessage:
+    """Base for parsed draft messages; item access kept for dict-style callers."""
+    __slots__ = ()
+    
+    def __getitem__(self, key: str) -> Any:
+        return getattr(self, key)
+
+
+@dataclass(slots=True)
+class SelectedMessage(_ParsedMessage):
+    """SELECTED {teamDraftPosition} {playerId} {teamId} {memberId}"""
+    type: ClassVar[str] = "SELECTED"
+    team_id: str
+    player_id: str
+    team_draft_position: int
+    member_id: str
+    raw: str
+
+
+@dataclass(slots=True)
+class SelectingMessage(_ParsedMessage):
+    """SELECTING {teamId} {timeMs}"""
+    type: ClassVar[str] = "SELECTING"
+    team_id: str
+    time_ms: int
+    raw: str
+
+
+@dataclass(slots=True)
+class ClockMessage(_ParsedMessage):
+    """CLOCK {teamId} {timeRemainingMs} {round?}"""
+    type: ClassVar[str] = "CLOCK"
+    team_id: str
+    time_remaining_ms: int
+    round: Optional[int]
+    raw: str
+
+
+ParsedMessage = Union[SelectedMessage, SelectingMessage, ClockMessage, Dict[str, Any]]
+
+
 class DraftEventProcessor:
     """
     Processes ESPN draft WebSocket messages and updates DraftState.
@@ -52,18 +105,21 @@ class DraftEventProcessor:
         self.on_autodraft_change: Optional[Callable] = None
         
         # Processing statistics
-        self.stats = {
-            'total_messages': 0,
-            'selected_messages': 0,
-            'selecting_messages': 0,
-            'clock_messages': 0,
-            'parse_errors': 0,
-            'state_update_errors': 0
+        self.stats = ProcessorStats()
+        
+        # Message parsers keyed by command (first token)
+        self._parsers: Dict[str, Callable[[List[str], str], ParsedMessage]] = {
+            "SELECTED": self._parse_selected,
+            "SELECTING": self._parse_selecting,
+            "CLOCK": self._parse_clock,
+            "AUTODRAFT": self._parse_autodraft,
+            "TOKEN": self._parse_session,
+            "JOINED": self._parse_session,
+            "LEFT": self._parse_session,
+            "PING": self._parse_session,
+            "PONG": self._parse_session,
         }
         
-        # Message validation patterns
-        self._member_id_pattern = re.compile(r'^\{[A-F0-9-]{36}\}$')
-        
     def process_websocket_message(self, message: str, websocket_url: str = "") -> bool:
         """
         Process a WebSocket message and update draft state.
@@ -75,31 +131,65 @@ class DraftEventProcessor:
         Returns:
             bool: True if message was processed successfully
         """
-        self.stats['total_messages'] += 1
+        self.stats.total_messages += 1
         
         try:
             # Parse the message
             parsed = self._parse_message(message)
             
             if parsed['type'] == 'UNKNOWN':
-                self.logger.debug(f"Unrecognized message: {message}")
+                self.logger.debug("Unrecognized message: %s", message)
                 return True  # Not an error, just not handled
                 
             # Route to appropriate handler
             success = self._route_message(parsed, message)
             
             if not success:
-                self.stats['state_update_errors'] += 1
+                self.stats.state_update_errors += 1
                 self.logger.error(f"Failed to update state for message: {message}")
                 
             return success
             
         except Exception as e:
-            self.stats['parse_errors'] += 1
+            self.stats.parse_errors += 1
             self.logger.error(f"Error processing message '{message}': {e}")
             return False
             
-    def _parse_message(self, message: str) -> Dict[str, Any]:
+    def process_batch(self, messages: List[str]) -> int:
+        """
+        Process a sequence of WebSocket messages, e.g. when replaying a HAR log.
+        
+        Same semantics as calling process_websocket_message for each message,
+        but binds the parse and route steps once and skips the per-message
+        debug logging for unrecognized messages.
+        
+        Args:
+            messages: Raw WebSocket message texts in arrival order
+            
+        Returns:
+            int: Number of messages processed successfully
+        """
+        parse = self._parse_message
+        route = self._route_message
+        stats = self.stats
+        processed = 0
+        
+        for message in messages:
+            stats.total_messages += 1
+            try:
+                parsed = parse(message)
+                if parsed['type'] == 'UNKNOWN' or route(parsed, message):
+                    processed += 1
+                else:
+                    stats.state_update_errors += 1
+                    self.logger.error(f"Failed to update state for message: {message}")
+            except Exception as e:
+                stats.parse_errors += 1
+                self.logger.error(f"Error processing message '{message}': {e}")
+                
+        return processed
+        
+    def _parse_message(self, message: str) -> ParsedMessage:
         """
         Parse WebSocket message text into structured data.
         
@@ -114,90 +204,91 @@ class DraftEventProcessor:
             message: Raw message text
             
         Returns:
-            Dictionary with parsed message data
+            Message dataclass for SELECTED/SELECTING/CLOCK, otherwise a
+            dictionary with parsed message data
         """
         try:
-            parts = message.strip().split()
-            if not parts:
+            # Look at the command alone first so unhandled messages
+            # (e.g. AUTOSUGGEST) are never tokenized
+            stripped = message.strip()
+            parser = self._parsers.get(stripped.partition(' ')[0].upper())
+            if parser is None:
                 return {"type": "UNKNOWN", "raw": message}
                 
-            command = parts[0].upper()
+            return parser(stripped.split(), message)
             
-            if command == "SELECTED" and len(parts) >= 4:
-                try:
-                    team_draft_position = int(parts[1])  # This is NOT the overall pick number!
-                    team_id = parts[3] 
-                    # Member ID is optional (some messages don't include it)
-                    member_id = parts[4] if len(parts) >= 5 else ""
-                    
-                    # LOG THE RAW MESSAGE TO SEE WHAT ESPN IS ACTUALLY SENDING
-                    self.logger.info(f"SELECTED MESSAGE PARSED: raw='{message}' -> team_draft_position={team_draft_position}, player_id={parts[2]}, team_id={team_id}")
-                    
-                except (ValueError, IndexError) as e:
-                    self.logger.warning(f"Invalid SELECTED message format: {message} - {e}")
-                    return {"type": "UNKNOWN", "raw": message}
-                    
-                return {
-                    "type": "SELECTED",
-                    "team_id": team_id,
-                    "player_id": parts[2],
-                    "team_draft_position": team_draft_position,
-                    "member_id": member_id,
-                    "raw": message
-                }
-                
-            elif command == "SELECTING" and len(parts) >= 3:
-                try:
-                    time_ms = int(parts[2])
-                except (ValueError, IndexError) as e:
-                    self.logger.warning(f"Invalid SELECTING message format: {message} - {e}")
-                    return {"type": "UNKNOWN", "raw": message}
-                    
-                return {
-                    "type": "SELECTING", 
-                    "team_id": parts[1],
-                    "time_ms": time_ms,
-                    "raw": message
-                }
-                
-            elif command == "CLOCK" and len(parts) >= 3:
-                try:
-                    time_remaining_ms = int(parts[2])
-                    round_num = int(parts[3]) if len(parts) > 3 and parts[3] else None
-                except (ValueError, IndexError) as e:
-                    self.logger.warning(f"Invalid CLOCK message format: {message} - {e}")
-                    return {"type": "UNKNOWN", "raw": message}
-                    
-                return {
-                    "type": "CLOCK",
-                    "team_id": parts[1], 
-                    "time_remaining_ms": time_remaining_ms,
-                    "round": round_num,
-                    "raw": message
-                }
-                
-            elif command == "AUTODRAFT" and len(parts) >= 3:
-                return {
-                    "type": "AUTODRAFT",
-                    "team_id": parts[1],
-                    "enabled": parts[2].lower() == "true",
-                    "raw": message
-                }
-                
-            elif command in ["TOKEN", "JOINED", "LEFT", "PING", "PONG"]:
-                return {
-                    "type": command,
-                    "raw": message,
-                    "parts": parts[1:]  # Additional data varies
-                }
-                
-            else:
-                return {"type": "UNKNOWN", "raw": message}
-                
         except (ValueError, IndexError) as e:
             raise MessageParseError(f"Failed to parse message '{message}': {e}")
             
-    def _route_message(self, parsed: Dict[str, Any], raw_message: str) -> bool:
+    def _parse_selected(self, parts: List[str], message: str) -> ParsedMessage:
+        """Parse SELECTED {teamDraftPosition} {playerId} {teamId} {memberId}."""
+        if len(parts) < 4:
+            return {"type": "UNKNOWN", "raw": message}
+            
+        try:
+            team_draft_position = int(parts[1])  # This is NOT the overall pick number!
+            team_id = sys.intern(parts[3])  # Few distinct team IDs; share one string each
+            # Member ID is optional (some messages don't include it)
+            member_id = parts[4] if len(parts) >= 5 else ""
+            
+            # LOG THE RAW MESSAGE TO SEE WHAT ESPN IS ACTUALLY SENDING
+            self.logger.info("SELECTED MESSAGE PARSED: raw='%s' -> team_draft_position=%s, player_id=%s, team_id=%s",
+                             message, team_draft_position, parts[2], team_id)
+            
+        except (ValueError, IndexError) as e:
+            self.logger.warning(f"Invalid SELECTED message format: {message} - {e}")
+            return {"type": "UNKNOWN", "raw": message}
+            
+        return SelectedMessage(team_id, parts[2], team_draft_position, member_id, message)
+        
+    def _parse_selecting(self, parts: List[str], message: str) -> ParsedMessage:
+        """Parse SELECTING {teamId} {timeMs}."""
+        if len(parts) < 3:
+            return {"type": "UNKNOWN", "raw": message}
+            
+        try:
+            time_ms = int(parts[2])
+        except (ValueError, IndexError) as e:
+            self.logger.warning(f"Invalid SELECTING message format: {message} - {e}")
+            return {"type": "UNKNOWN", "raw": message}
+            
+        return SelectingMessage(sys.intern(parts[1]), time_ms, message)
+        
+    def _parse_clock(self, parts: List[str], message: str) -> ParsedMessage:
+        """Parse CLOCK {teamId} {timeRemainingMs} {round?}."""
+        if len(parts) < 3:
+            return {"type": "UNKNOWN", "raw": message}
+            
+        try:
+            time_remaining_ms = int(parts[2])
+            round_num = int(parts[3]) if len(parts) > 3 and parts[3] else None
+        except (ValueError, IndexError) as e:
+            self.logger.warning(f"Invalid CLOCK message format: {message} - {e}")
+            return {"type": "UNKNOWN", "raw": message}
+            
+        return ClockMessage(sys.intern(parts[1]), time_remaining_ms, round_num, message)
+        
+    def _parse_autodraft(self, parts: List[str], message: str) -> Dict[str, Any]:
+        """Parse AUTODRAFT {teamId} {boolean}."""
+        if len(parts) < 3:
+            return {"type": "UNKNOWN", "raw": message}
+            
+        return {
+            "type": "AUTODRAFT",
+            "team_id": parts[1],
+            "enabled": parts[2].lower() == "true",
+            "raw": message
+        }
+        
+    def _parse_session(self, parts: List[str], message: str) -> Dict[str, Any]:
+        """Parse session messages (TOKEN, JOINED, LEFT, PING, PONG)."""
+        return {
+            "type": parts[0].upper(),
+            "raw": message,
+            "parts": parts[1:]  # Additional data varies
+        }
+        
+    def _route_message(self, parsed: ParsedMessage, raw_message: str) -> bool:
         """
         Route parsed message to appropriate handler.
         
@@ -228,7 +319,7 @@ class DraftEventProcessor:
             self.logger.error(f"Error in message handler for {message_type}: {e}")
             return False
             
-    def _handle_selected(self, parsed: Dict[str, Any]) -> bool:
+    def _handle_selected(self, parsed: SelectedMessage) -> bool:
         """
         Handle SELECTED message (pick made).
         
@@ -237,20 +328,20 @@ class DraftEventProcessor:
         The actual pick number is tracked independently via SELECTING messages.
         Updates: Add player to drafted list, remove from available, update rosters
         """
-        self.stats['selected_messages'] += 1
+        self.stats.selected_messages += 1
         
-        team_id = parsed['team_id']
-        player_id = parsed['player_id'] 
-        team_draft_position = parsed['team_draft_position']  # Team's draft position (1-10), NOT pick number
+        team_id = parsed.team_id
+        player_id = parsed.player_id
+        team_draft_position = parsed.team_draft_position  # Team's draft position (1-10), NOT pick number
         
         # Use our independent pick counter (the real pick number)
         pick_number = self.actual_pick_number
         
-        self.logger.info(f"Processing pick: Team {team_id} selected player {player_id} (pick {pick_number})")
-        self.logger.info(f"Team draft position: {team_draft_position} (not the actual pick number)")
+        self.logger.info("Processing pick: Team %s selected player %s (pick %s)", team_id, player_id, pick_number)
+        self.logger.info("Team draft position: %s (not the actual pick number)", team_draft_position)
         
         # Apply pick to draft state with position detection
-        position = self._resolve_position(player_id)
+        position = sys.intern(self._resolve_position(player_id))
         success = self.draft_state.apply_pick(
             player_id=player_id,
             team_id=team_id, 
@@ -265,30 +356,30 @@ class DraftEventProcessor:
                     'team_id': team_id,
                     'player_id': player_id,
                     'pick_number': pick_number,
-                    'member_id': parsed['member_id']
+                    'member_id': parsed.member_id
                 })
             except Exception as e:
                 self.logger.error(f"Error in pick_made callback: {e}")
                 
         return success
         
-    def _handle_selecting(self, parsed: Dict[str, Any]) -> bool:
+    def _handle_selecting(self, parsed: SelectingMessage) -> bool:
         """
         Handle SELECTING message (team on clock).
         
         Message: SELECTING {teamId} {timeMs}
         Updates: Set current pick, team on clock, reset timer
         """
-        self.stats['selecting_messages'] += 1
+        self.stats.selecting_messages += 1
         
-        team_id = parsed['team_id']
-        time_limit_ms = parsed['time_ms']
+        team_id = parsed.team_id
+        time_limit_ms = parsed.time_ms
         time_limit_seconds = time_limit_ms / 1000.0
         
         # Increment our pick counter - this is the actual pick number
         self.actual_pick_number += 1
         
-        self.logger.info(f"Team {team_id} now selecting (pick {self.actual_pick_number}, {time_limit_seconds}s)")
+        self.logger.info("Team %s now selecting (pick %s, %ss)", team_id, self.actual_pick_number, time_limit_seconds)
         
         # Update draft state
         success = self.draft_state.start_new_pick(
@@ -310,16 +401,16 @@ class DraftEventProcessor:
                 
         return success
         
-    def _handle_clock(self, parsed: Dict[str, Any]) -> bool:
+    def _handle_clock(self, parsed: ClockMessage) -> bool:
         """
         Handle CLOCK message (timer update).
         
         Message: CLOCK {teamId} {timeRemainingMs} {round?}
         Updates: Update countdown timer
         """
-        self.stats['clock_messages'] += 1
+        self.stats.clock_messages += 1
         
-        time_remaining_ms = parsed['time_remaining_ms']
+        time_remaining_ms = parsed.time_remaining_ms
         time_remaining_seconds = max(0, time_remaining_ms / 1000.0)
         
         # Update timer in draft state
@@ -329,9 +420,9 @@ class DraftEventProcessor:
         if self.on_clock_update and success:
             try:
                 self.on_clock_update({
-                    'team_id': parsed['team_id'],
+                    'team_id': parsed.team_id,
                     'time_remaining': time_remaining_seconds,
-                    'round': parsed.get('round')
+                    'round': parsed.round
                 })
             except Exception as e:
                 self.logger.error(f"Error in clock_update callback: {e}")
@@ -348,7 +439,7 @@ class DraftEventProcessor:
         team_id = parsed['team_id']
         enabled = parsed['enabled']
         
-        self.logger.info(f"Team {team_id} autodraft: {'enabled' if enabled else 'disabled'}")
+        self.logger.info("Team %s autodraft: %s", team_id, 'enabled' if enabled else 'disabled')
         
         # Trigger callback if registered
         if self.on_autodraft_change:
@@ -372,9 +463,9 @@ class DraftEventProcessor:
         message_type = parsed['type']
         
         if message_type in ["PING", "PONG"]:
-            self.logger.debug(f"Heartbeat: {message_type}")
+            self.logger.debug("Heartbeat: %s", message_type)
         else:
-            self.logger.info(f"Session message: {parsed['raw']}")
+            self.logger.info("Session message: %s", parsed['raw'])
             
         return True
         
@@ -407,25 +498,25 @@ class DraftEventProcessor:
         
     def get_stats(self) -> Dict[str, Any]:
         """Get event processing statistics."""
-        total = self.stats['total_messages']
+        stats = asdict(self.stats)
+        total = self.stats.total_messages
         
         # Prevent division by zero with proper guards
         if total == 0:
             return {
-                **self.stats,
+                **stats,
                 'success_rate': 1.0,
                 'parse_error_rate': 0.0,
                 'state_error_rate': 0.0
             }
         
         return {
-            **self.stats,
-            'success_rate': (total - self.stats['parse_errors'] - self.stats['state_update_errors']) / total,
-            'parse_error_rate': self.stats['parse_errors'] / total,
-            'state_error_rate': self.stats['state_update_errors'] / total
+            **stats,
+            'success_rate': (total - self.stats.parse_errors - self.stats.state_update_errors) / total,
+            'parse_error_rate': self.stats.parse_errors / total,
+            'state_error_rate': self.stats.state_update_errors / total
         }
         
     def reset_stats(self):
         """Reset processing statistics."""
-        for key in self.stats:
-            self.stats[key] = 0
\ No newline at end of file
+        self.stats = ProcessorStats()
\ No newline at end of file
@@ -8,7 +8,10 @@ and player resolution infrastructure from Sprint 0.
 
 import asyncio
 import logging
-from typing import Dict, Any, Optional, List, Callable
+import sys
+import time
+from dataclasses import dataclass, asdict
+from typing import Dict, Any, Optional, List, Callable, NamedTuple
 from datetime import datetime
 
 from ..monitor.espn_draft_monitor import ESPNDraftMonitor
@@ -18,6 +21,23 @@ from .event_processor import DraftEventProcessor
 from .state_handlers import StateUpdateHandlers
 
 
+@dataclass(slots=True)
+class PerformanceStats:
+    """Message processing counters for DraftStateManager."""
+    messages_processed: int = 0
+    state_updates: int = 0
+    player_resolutions: int = 0
+    errors: int = 0
+    avg_processing_time_ms: float = 0.0
+    last_message_time: Optional[str] = None
+
+
+class PlayerInfo(NamedTuple):
+    """Resolved name and roster position for a player ID."""
+    name: str
+    position: str
+
+
 class DraftStateManager:
     """
     Integrated draft state management system.
@@ -33,6 +53,17 @@ class DraftStateManager:
     - Event callbacks for external systems
     """
     
+    # Minimum interval between on_state_updated callbacks (seconds)
+    STATE_UPDATE_INTERVAL = 0.05
+    
+    # Window for coalescing adjacent picks into one batch resolution (seconds)
+    RESOLUTION_BATCH_WINDOW = 0.025
+    
+    # Attempts before an unresolved player is given up on, and the delay
+    # before a failed lookup is queued again (seconds)
+    MAX_RESOLUTION_ATTEMPTS = 3
+    RESOLUTION_RETRY_DELAY = 5.0
+    
     def __init__(self, league_id: str, team_id: str, 
                  team_count: int = 12, rounds: int = 16,
                  player_cache_db: Optional[str] = None,
@@ -64,17 +95,26 @@ class DraftStateManager:
         self.player_cache_db = player_cache_db or f"draft_cache_{league_id}.db"
         
         # Resolved player caches
-        self._player_names: Dict[str, str] = {}
-        self._player_positions: Dict[str, str] = {}
-        self._resolution_queue: List[str] = []
+        self._players: Dict[str, PlayerInfo] = {}
+        self._resolution_queue: Dict[str, None] = {}  # Insertion-ordered set of player IDs
+        self._resolution_needed = asyncio.Event()
+        self._known_missing: set[str] = set()  # IDs the resolver could not find
+        self._resolution_failures: Dict[str, int] = {}  # ID -> failed lookups so far
+        self._resolution_retries: Dict[str, None] = {}  # IDs waiting to be re-queued
+        self._resolution_retry_handle: Optional[asyncio.TimerHandle] = None
         
         # Draft order tracking for proper team numbering
         self._draft_order: List[str] = []  # ESPN team IDs in draft order
         self._espn_team_to_position: Dict[str, int] = {}  # ESPN ID -> draft position (1-based)
+        self._display_team_names: Dict[str, str] = {}  # ESPN ID -> "Team N"
         self._draft_order_established = False
         
-        # Pending picks for name resolution updates
-        self._pending_picks: List[Dict[str, Any]] = []
+        # Cached get_enriched_roster result, keyed by (roster version, resolved count)
+        self._enriched_roster_key: Optional[tuple] = None
+        self._enriched_roster: Dict[str, List[Dict[str, Any]]] = {}
+        
+        # Pending picks for name resolution updates, keyed by player ID
+        self._pending_picks: Dict[str, List[Dict[str, Any]]] = {}
         
         # Event callbacks
         self.on_pick_processed: Optional[Callable] = None
@@ -82,15 +122,15 @@ class DraftStateManager:
         self.on_draft_completed: Optional[Callable] = None
         self.on_error: Optional[Callable] = None
         
+        # Background tasks owned by the manager (cancelled in close())
+        self._bg_tasks: set[asyncio.Task] = set()
+        
+        # Debounced state update callback (coalesces bursts of messages)
+        self._state_dirty = False
+        self._state_flush_handle: Optional[asyncio.TimerHandle] = None
+        
         # Performance tracking
-        self.performance_stats = {
-            'messages_processed': 0,
-            'state_updates': 0,
-            'player_resolutions': 0,
-            'errors': 0,
-            'avg_processing_time_ms': 0.0,
-            'last_message_time': None
-        }
+        self.performance_stats = PerformanceStats()
         
         self.logger = logging.getLogger(__name__)
         self.logger.info(f"Initialized DraftStateManager for league {league_id}")
@@ -110,16 +150,16 @@ class DraftStateManager:
             except Exception as e:
                 self.logger.error(f"Failed to initialize player resolver: {e}")
                 # Ensure proper cleanup if __aenter__ partially succeeded
-                if hasattr(self.player_resolver, '__aexit__'):
-                    try:
-                        await self.player_resolver.__aexit__(type(e), e, e.__traceback__)
-                    except Exception as cleanup_error:
-                        self.logger.warning(f"Error during player resolver cleanup: {cleanup_error}")
+                try:
+                    await self.player_resolver.__aexit__(type(e), e, e.__traceback__)
+                except Exception as cleanup_error:
+                    self.logger.warning(f"Error during player resolver cleanup: {cleanup_error}")
                 self.player_resolver = None
                 raise
             
             # Initialize monitor
-            self.monitor = ESPNDraftMonitor(headless=self.headless)
+            # The manager never saves the frame log, so keep only recent frames
+            self.monitor = ESPNDraftMonitor(headless=self.headless, max_logged_messages=10_000)
             await self.monitor.start_browser()
             
             # Set up event processor callbacks
@@ -154,9 +194,11 @@ class DraftStateManager:
             if not success:
                 return False
                 
-            # Set up WebSocket message handler (wrap async method in task)
+            # Set up WebSocket message handler (wrap async method in task).
+            # Sent frames are dropped here so they never create a task.
             def sync_message_handler(direction, websocket, payload):
-                asyncio.create_task(self._handle_websocket_message(direction, websocket, payload))
+                if direction == 'received':
+                    self._spawn(self._handle_websocket_message(websocket, payload))
             
             self.monitor.on_message_received = sync_message_handler
             
@@ -214,63 +256,88 @@ class DraftStateManager:
         self.event_processor.on_team_selecting = self._handle_team_selecting
         self.event_processor.on_clock_update = self._handle_clock_update
         
-    async def _handle_websocket_message(self, direction: str, websocket, payload: str):
+    async def _handle_websocket_message(self, websocket, payload: str):
         """
-        Handle incoming WebSocket messages.
+        Handle incoming (received) WebSocket messages.
         
         Args:
-            direction: 'sent' or 'received'
             websocket: WebSocket instance
             payload: Message payload
         """
-        if direction != 'received':
-            return
-            
-        start_time = datetime.now()
-        self.performance_stats['messages_processed'] += 1
-        self.performance_stats['last_message_time'] = start_time.isoformat()
+        start_ns = time.perf_counter_ns()
+        self.performance_stats.messages_processed += 1
+        self.performance_stats.last_message_time = datetime.now().isoformat()
         
         try:
             # Process message through event processor
-            self.logger.debug(f"Processing message: {payload.strip()}")
+            # Lazy %-formatting: skipped entirely unless DEBUG is enabled
+            self.logger.debug("Processing message: %s", payload)
             success = self.event_processor.process_websocket_message(payload, websocket.url)
-            self.logger.debug(f"Message processing result: {success}")
+            self.logger.debug("Message processing result: %s", success)
             
             if success:
-                self.performance_stats['state_updates'] += 1
+                self.performance_stats.state_updates += 1
                 
-                # Trigger state updated callback
+                # Schedule a (debounced) state updated callback
                 if self.on_state_updated:
-                    self.on_state_updated(self.get_state_summary())
+                    self._schedule_state_update()
                     
-            # Calculate processing time
-            processing_time = (datetime.now() - start_time).total_seconds() * 1000
+            # Calculate processing time (integer ns, converted to ms once)
+            processing_time = (time.perf_counter_ns() - start_ns) / 1_000_000
             self._update_avg_processing_time(processing_time)
             
         except Exception as e:
-            self.performance_stats['errors'] += 1
+            self.performance_stats.errors += 1
             self.logger.error(f"Error handling WebSocket message: {e}")
             
             if self.on_error:
                 self.on_error(f"WebSocket message processing error: {e}")
                 
+    def _spawn(self, coro) -> asyncio.Task:
+        """Run a coroutine as a background task tracked for shutdown."""
+        task = asyncio.create_task(coro)
+        self._bg_tasks.add(task)
+        task.add_done_callback(self._bg_tasks.discard)
+        return task
+        
+    def _schedule_state_update(self):
+        """Mark state dirty and schedule a single coalesced state callback."""
+        self._state_dirty = True
+        if self._state_flush_handle is None:
+            self._state_flush_handle = asyncio.get_running_loop().call_later(
+                self.STATE_UPDATE_INTERVAL, self._flush_state_update
+            )
+            
+    def _flush_state_update(self):
+        """Deliver the pending state summary to on_state_updated."""
+        self._state_flush_handle = None
+        if not self._state_dirty or not self.on_state_updated:
+            return
+        self._state_dirty = False
+        
+        try:
+            self.on_state_updated(self.get_state_summary())
+        except Exception as e:
+            self.performance_stats.errors += 1
+            self.logger.error(f"Error in state_updated callback: {e}")
+            
     def _handle_pick_made(self, pick_data: Dict[str, Any]):
         """Handle pick made event with enhanced user experience."""
         player_id = pick_data['player_id']
         team_id = pick_data['team_id']
         
-        # Create enriched pick data with user-friendly team name
-        enriched_pick = {
-            **pick_data,
-            'display_team_name': self.get_display_team_name(team_id),
-            'player_name': self._player_names.get(player_id, f"Player #{player_id}")
-        }
+        # Enrich pick data in place (the event processor hands us a fresh dict)
+        enriched_pick = pick_data
+        enriched_pick['display_team_name'] = self.get_display_team_name(team_id)
+        player = self._players.get(player_id)
         
-        # Queue player for name resolution if not already resolved
-        if player_id not in self._player_names:
-            self._resolution_queue.append(player_id)
-            # Store pick for potential name update callback later
-            self._pending_picks.append(enriched_pick)
+        if player:
+            enriched_pick['player_name'] = player.name
+        else:
+            enriched_pick['player_name'] = f"Player #{player_id}"
+            # Queue player for name resolution and store pick for a name update later
+            if self._enqueue_resolution(player_id):
+                self._pending_picks.setdefault(player_id, []).append(enriched_pick)
             
         # Trigger callback with current data
         if self.on_pick_processed:
@@ -300,8 +367,9 @@ class DraftStateManager:
                 self._draft_order.append(team_id)
                 # Map ESPN team ID to draft position (1-based)
                 self._espn_team_to_position[team_id] = len(self._draft_order)
+                self._display_team_names[team_id] = f"Team {len(self._draft_order)}"
                 
-                self.logger.debug(f"Draft order updated: {team_id} -> position {len(self._draft_order)}")
+                self.logger.debug("Draft order updated: %s -> position %d", team_id, len(self._draft_order))
                 
                 # Mark draft order as established after first round
                 if len(self._draft_order) >= self.team_count:
@@ -333,17 +401,32 @@ class DraftStateManager:
             Position string (QB, RB, WR, TE, K, DST, FLEX, BENCH)
         """
         # Check position cache first for fast synchronous lookup
-        if player_id in self._player_positions:
-            return self._player_positions[player_id]
+        player = self._players.get(player_id)
+        if player:
+            return player.position
             
-        # Queue player for async resolution if not already queued
-        if player_id not in self._resolution_queue:
-            self._resolution_queue.append(player_id)
+        # Queue player for async resolution
+        self._enqueue_resolution(player_id)
             
         # Return default position to avoid blocking message processing
         # Position will be updated after async resolution completes
         return "BENCH"
         
+    def _enqueue_resolution(self, player_id: str) -> bool:
+        """
+        Queue a player ID for async resolution and wake the resolver.
+        
+        Returns:
+            bool: False if the resolver already failed to find this player
+        """
+        if player_id in self._known_missing:
+            return False
+            
+        # Dict keys dedupe in O(1) while preserving arrival order
+        self._resolution_queue[player_id] = None
+        self._resolution_needed.set()
+        return True
+        
     async def resolve_queued_players(self) -> int:
         """
         Resolve player names and positions from queue.
@@ -356,7 +439,7 @@ class DraftStateManager:
             
         try:
             # Batch resolve queued players
-            player_ids = self._resolution_queue.copy()
+            player_ids = list(self._resolution_queue)
             self._resolution_queue.clear()
             
             resolved_players = await self.player_resolver.batch_resolve_ids(player_ids)
@@ -367,23 +450,58 @@ class DraftStateManager:
             
             for player_id, player in resolved_players.items():
                 if player:
-                    self._player_names[player_id] = player.full_name
-                    self._player_positions[player_id] = player.position or "BENCH"
+                    self._players[player_id] = PlayerInfo(player.full_name, player.position or "BENCH")
                     resolved_count += 1
                     newly_resolved.append(player_id)
+                else:
+                    self._handle_unresolved(player_id)
                     
             # Trigger name updates for pending picks with newly resolved players
             if newly_resolved and self.on_pick_processed:
                 self._update_pending_pick_names(newly_resolved)
+            for player_id in newly_resolved:
+                self._resolution_failures.pop(player_id, None)
                     
-            self.performance_stats['player_resolutions'] += resolved_count
-            self.logger.debug(f"Resolved {resolved_count} player names and positions")
+            self.performance_stats.player_resolutions += resolved_count
+            self.logger.debug("Resolved %d player names and positions", resolved_count)
             return resolved_count
             
         except Exception as e:
             self.logger.error(f"Error resolving player names: {e}")
             return 0
             
+    def _handle_unresolved(self, player_id: str):
+        """
+        Give up on a player the API reported missing, otherwise retry later.
+        
+        A lookup can fail for temporary reasons (timeouts, server errors), so
+        such players keep their pending picks and are queued again after
+        RESOLUTION_RETRY_DELAY, up to MAX_RESOLUTION_ATTEMPTS lookups.
+        """
+        failures = self._resolution_failures.get(player_id, 0) + 1
+        if (self.player_resolver.was_not_found(player_id)
+                or failures >= self.MAX_RESOLUTION_ATTEMPTS):
+            # Don't re-queue (or keep pending picks for) unknown players
+            self._resolution_failures.pop(player_id, None)
+            self._known_missing.add(player_id)
+            self._pending_picks.pop(player_id, None)
+            return
+            
+        self._resolution_failures[player_id] = failures
+        self._resolution_retries[player_id] = None
+        if self._resolution_retry_handle is None:
+            self._resolution_retry_handle = asyncio.get_running_loop().call_later(
+                self.RESOLUTION_RETRY_DELAY, self._requeue_failed_resolutions
+            )
+            
+    def _requeue_failed_resolutions(self):
+        """Queue players whose last lookup failed for another attempt."""
+        self._resolution_retry_handle = None
+        retries = list(self._resolution_retries)
+        self._resolution_retries.clear()
+        for player_id in retries:
+            self._enqueue_resolution(player_id)
+            
     def get_player_name(self, player_id: str) -> str:
         """
         Get player name by ID.
@@ -394,7 +512,8 @@ class DraftStateManager:
         Returns:
             Player name or fallback
         """
-        return self._player_names.get(player_id, f"Player #{player_id}")
+        player = self._players.get(player_id)
+        return player.name if player else f"Player #{player_id}"
         
     def get_display_team_name(self, espn_team_id: str) -> str:
         """
@@ -406,13 +525,13 @@ class DraftStateManager:
         Returns:
             Team name like "Team 1", "Team 2", etc. based on draft order
         """
-        if espn_team_id in self._espn_team_to_position:
-            # Use proper draft order position
-            position = self._espn_team_to_position[espn_team_id]
-            return f"Team {position}"
-        else:
-            # Fallback for teams not yet in draft order (shouldn't happen in normal flow)
-            return f"Team {espn_team_id}"
+        # Use proper draft order position (formatted once when the team is seen)
+        display_name = self._display_team_names.get(espn_team_id)
+        if display_name is not None:
+            return display_name
+            
+        # Fallback for teams not yet in draft order (shouldn't happen in normal flow)
+        return f"Team {espn_team_id}"
     
     def _update_pending_pick_names(self, newly_resolved: List[str]):
         """
@@ -422,23 +541,13 @@ class DraftStateManager:
             newly_resolved: List of player IDs that were just resolved
         """
         updated_picks = []
-        remaining_picks = []
         
-        for pick in self._pending_picks:
-            player_id = pick['player_id']
-            if player_id in newly_resolved:
+        # Only visit picks for the resolved IDs; the rest stay pending
+        for player_id in newly_resolved:
+            for pick in self._pending_picks.pop(player_id, ()):
                 # Update pick with resolved name
-                updated_pick = {
-                    **pick,
-                    'player_name': self._player_names.get(player_id, f"Player #{player_id}")
-                }
-                updated_picks.append(updated_pick)
-            else:
-                # Keep pick in pending list
-                remaining_picks.append(pick)
-        
-        # Update pending picks list
-        self._pending_picks = remaining_picks
+                pick['player_name'] = self.get_player_name(player_id)
+                updated_picks.append(pick)
         
         # Trigger callbacks for updated picks
         for pick in updated_picks:
@@ -449,9 +558,16 @@ class DraftStateManager:
         """
         Get roster with player names resolved.
         
+        The result is cached until our roster changes or more players are
+        resolved, so callers should treat it as read-only.
+        
         Returns:
             Dictionary of positions to player info
         """
+        cache_key = (self.draft_state.roster_version, len(self._players))
+        if cache_key == self._enriched_roster_key:
+            return self._enriched_roster
+            
         enriched = {}
         for position, player_ids in self.draft_state.my_roster.items():
             enriched[position] = [
@@ -461,6 +577,9 @@ class DraftStateManager:
                 }
                 for pid in player_ids
             ]
+            
+        self._enriched_roster_key = cache_key
+        self._enriched_roster = enriched
         return enriched
         
     def validate_current_state(self) -> Dict[str, Any]:
@@ -487,22 +606,22 @@ class DraftStateManager:
         return {
             **base_summary,
             'actual_team_count': self.team_count,
-            'performance': self.performance_stats,
-            'resolved_players': len(self._player_names),
+            'performance': asdict(self.performance_stats),
+            'resolved_players': len(self._players),
             'resolution_queue_size': len(self._resolution_queue),
             'websocket_connections': len(self.monitor.websockets) if self.monitor else 0
         }
         
     def _update_avg_processing_time(self, processing_time_ms: float):
         """Update average processing time."""
-        current_avg = self.performance_stats['avg_processing_time_ms']
-        total_messages = self.performance_stats['messages_processed']
+        current_avg = self.performance_stats.avg_processing_time_ms
+        total_messages = self.performance_stats.messages_processed
         
         if total_messages == 1:
-            self.performance_stats['avg_processing_time_ms'] = processing_time_ms
+            self.performance_stats.avg_processing_time_ms = processing_time_ms
         else:
             # Running average
-            self.performance_stats['avg_processing_time_ms'] = (
+            self.performance_stats.avg_processing_time_ms = (
                 (current_avg * (total_messages - 1) + processing_time_ms) / total_messages
             )
             
@@ -522,10 +641,13 @@ class DraftStateManager:
             else:
                 # Monitor indefinitely - wait for draft completion or manual stop
                 while self.draft_state.draft_status.value != "COMPLETED":
-                    await asyncio.sleep(1)
+                    # Sleep until players are queued or the draft status changes
+                    await self._wait_for_draft_activity()
                     
-                    # Periodically resolve queued players
-                    if len(self._resolution_queue) > 0:
+                    if self._resolution_needed.is_set():
+                        # Let adjacent picks pile up so they share one batch call
+                        await asyncio.sleep(self.RESOLUTION_BATCH_WINDOW)
+                        self._resolution_needed.clear()
                         await self.resolve_queued_players()
                         
         except asyncio.CancelledError:
@@ -535,9 +657,35 @@ class DraftStateManager:
         finally:
             self.logger.info(f"Draft monitoring completed")
             
+    async def _wait_for_draft_activity(self):
+        """Wait until players are queued for resolution or the draft status changes."""
+        status_changed = self.draft_state.status_changed
+        waiters = [
+            asyncio.ensure_future(self._resolution_needed.wait()),
+            asyncio.ensure_future(status_changed.wait())
+        ]
+        try:
+            await asyncio.wait(waiters, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            for waiter in waiters:
+                waiter.cancel()
+        status_changed.clear()
+        
     async def close(self):
         """Clean up resources."""
         try:
+            if self._state_flush_handle:
+                self._state_flush_handle.cancel()
+                self._state_flush_handle = None
+            if self._resolution_retry_handle:
+                self._resolution_retry_handle.cancel()
+                self._resolution_retry_handle = None
+                
+            # Stop in-flight message handlers before tearing down their dependencies
+            for task in self._bg_tasks:
+                task.cancel()
+            await asyncio.gather(*self._bg_tasks, return_exceptions=True)
+                
             if self.player_resolver:
                 try:
                     await self.player_resolver.__aexit__(None, None, None)
@@ -556,6 +704,28 @@ class DraftStateManager:
             self.logger.error(f"Error during cleanup: {e}")
 
 
+def install_uvloop() -> bool:
+    """
+    Use uvloop's event loop policy if it is installed (not available on Windows).
+    
+    Must be called before asyncio.run(); the loop already running inside
+    create_draft_state_manager cannot be swapped.
+    
+    Returns:
+        bool: True if uvloop was installed
+    """
+    if sys.platform == "win32":
+        return False
+        
+    try:
+        import uvloop
+    except ImportError:
+        return False
+        
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    return True
+
+
 async def create_draft_state_manager(league_id: str, team_id: str, 
                                    team_count: int = 12, rounds: int = 16,
                                    player_cache_db: Optional[str] = None) -> DraftStateManager:
@@ -18,8 +18,10 @@ async def test_espn_api_client():
     async with ESPNApiClient() as client:
         print("\n1. Testing individual lookups:")
         print("-" * 40)
-        for player_id in test_player_ids:
-            player = await client.get_player_by_id(player_id)
+        players = await asyncio.gather(
+            *(client.get_player_by_id(player_id) for player_id in test_player_ids)
+        )
+        for player_id, player in zip(test_player_ids, players):
             if player:
                 print(f"  {player_id}: {player.full_name}")
                 print(f"    Position: {player.position}")
@@ -40,8 +42,10 @@ async def test_espn_api_client():
         print("\n3. Testing cache effectiveness:")
         print("-" * 40)
         # Request same players again to test cache
-        for player_id in test_player_ids:
-            player = await client.get_player_by_id(player_id)
+        players = await asyncio.gather(
+            *(client.get_player_by_id(player_id) for player_id in test_player_ids)
+        )
+        for player_id, player in zip(test_player_ids, players):
             if player:
                 print(f"  {player_id}: Retrieved from cache")
         
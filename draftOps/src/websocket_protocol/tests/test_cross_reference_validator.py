@@ -0,0 +1,318 @@
+#!/usr/bin/env python3
+"""
+Tests for CrossReferenceValidator using an in-memory API client.
+"""
+
+import json
+
+import pytest
+
+from ..api.espn_api_client import ESPNPlayer
+from ..utils.cross_reference_validator import CrossReferenceValidator, validate_websocket_extractions
+from ..utils.player_id_extractor import PlayerIdExtraction
+
+
+class FakeApiClient:
+    """Stands in for ESPNApiClient.batch_get_players without network access."""
+
+    def __init__(self, players):
+        self.players = players
+        self.batch_calls = []
+        self.max_concurrent = None
+
+    async def batch_get_players(self, player_ids, max_concurrent=5):
+        self.batch_calls.append(list(player_ids))
+        self.max_concurrent = max_concurrent
+        return {pid: self.players.get(pid) for pid in player_ids}
+
+
+def make_extraction(player_id, context_fields=None, confidence=0.9):
+    return PlayerIdExtraction(
+        player_id=player_id,
+        timestamp="2025-08-31T12:00:00",
+        message_type="PICK_MADE",
+        websocket_url="ws://test",
+        raw_message=f'{{"type":"PICK_MADE","playerId":{player_id}}}',
+        context_fields=context_fields or {},
+        confidence=confidence
+    )
+
+
+PLAYERS = {
+    "4241457": ESPNPlayer(player_id="4241457", full_name="Najee Harris",
+                          position="RB", nfl_team="PIT"),
+    "3916387": ESPNPlayer(player_id="3916387", full_name="Josh Allen",
+                          position="QB", nfl_team="BUF"),
+}
+
+
+class TestCrossReferenceValidator:
+    """Validation results against known API players."""
+
+    @pytest.mark.asyncio
+    async def test_matching_context_is_validated(self):
+        validator = CrossReferenceValidator()
+        extraction = make_extraction("4241457", {"name": " Najee Harris ", "pos": "rb"})
+
+        results = await validator.validate_extractions([extraction], FakeApiClient(PLAYERS))
+
+        assert results[0].validation_status == "VALIDATED"
+        assert results[0].discrepancies == []
+        assert results[0].confidence_score == pytest.approx(0.9)
+
+    @pytest.mark.asyncio
+    async def test_mismatches_reduce_confidence(self):
+        validator = CrossReferenceValidator()
+        extraction = make_extraction(
+            "3916387", {"fullName": "Josh Allen Jr", "position": "WR", "team": "NYJ"}, confidence=0.8
+        )
+
+        results = await validator.validate_extractions([extraction], FakeApiClient(PLAYERS))
+
+        assert results[0].validation_status == "MISMATCH"
+        assert len(results[0].discrepancies) == 3
+        assert results[0].confidence_score == pytest.approx(0.8 * 0.8 * 0.9 * 0.9)
+
+    @pytest.mark.asyncio
+    async def test_unknown_player_not_found(self):
+        validator = CrossReferenceValidator()
+
+        results = await validator.validate_extractions(
+            [make_extraction("9999999", {"name": "Nobody"})], FakeApiClient(PLAYERS)
+        )
+
+        assert results[0].validation_status == "NOT_FOUND"
+        assert results[0].confidence_score == 0.0
+
+    @pytest.mark.asyncio
+    async def test_repeated_ids_fetched_once(self):
+        validator = CrossReferenceValidator()
+        client = FakeApiClient(PLAYERS)
+        extractions = [make_extraction("4241457", {"name": "Najee Harris"}) for _ in range(5)]
+
+        results = await validator.validate_extractions(extractions, client)
+
+        assert client.batch_calls == [["4241457"]]
+        assert [r.validation_status for r in results] == ["VALIDATED"] * 5
+
+    def test_precomputed_norm_matches_direct_call(self):
+        validator = CrossReferenceValidator()
+        player = PLAYERS["3916387"]
+        extraction = make_extraction("3916387", {"name": "josh allen", "pos": "QB", "team": "buf"})
+
+        direct = validator._create_validation_result(extraction, player)
+        precomputed = validator._create_validation_result(
+            extraction, player, validator._normalize_api_player(player)
+        )
+
+        assert (direct.validation_status, direct.confidence_score, direct.discrepancies) == (
+            precomputed.validation_status, precomputed.confidence_score, precomputed.discrepancies
+        )
+
+    def test_single_field_penalties(self):
+        validator = CrossReferenceValidator()
+        player = PLAYERS["4241457"]
+        cases = [
+            ({"name": "Someone Else"}, 0.8),
+            ({"pos": "WR"}, 0.9),
+            ({"team": "NYJ"}, 0.9),
+            ({"name": "Someone Else", "team": "NYJ"}, 0.72),
+        ]
+
+        for context, penalty in cases:
+            result = validator._create_validation_result(
+                make_extraction("4241457", context, confidence=1.0), player
+            )
+            assert result.confidence_score == pytest.approx(penalty)
+
+    def test_results_use_slots(self):
+        validator = CrossReferenceValidator()
+        extraction = make_extraction("4241457")
+        result = validator._create_validation_result(extraction, PLAYERS["4241457"])
+
+        assert not hasattr(result, "__dict__")
+        assert not hasattr(extraction, "__dict__")
+
+    @pytest.mark.asyncio
+    async def test_duplicate_extractions_keep_their_own_result(self, monkeypatch):
+        validator = CrossReferenceValidator()
+        calls = []
+        original = validator._create_validation_result
+
+        def counting(*args, **kwargs):
+            calls.append(args[0])
+            return original(*args, **kwargs)
+
+        monkeypatch.setattr(validator, "_create_validation_result", counting)
+        extractions = [
+            make_extraction("3916387", {"name": "Josh Alen", "pickNumber": n}) for n in range(4)
+        ] + [make_extraction("3916387", {"name": "Josh Allen"})]
+
+        results = await validator.validate_extractions(extractions, FakeApiClient(PLAYERS))
+
+        assert len(calls) == 2
+        assert [r.websocket_extraction for r in results] == extractions
+        assert [r.validation_status for r in results] == ["VALIDATED"] * 5
+        assert results[0].discrepancies == results[3].discrepancies
+        assert results[0].discrepancies is not results[3].discrepancies
+        assert results[4].discrepancies == []
+
+    @pytest.mark.asyncio
+    async def test_validation_summary_counts(self):
+        validator = CrossReferenceValidator()
+        extractions = [
+            make_extraction("4241457", {"name": "Najee Harris"}, confidence=0.9),
+            make_extraction("3916387", {"name": "Josh Allen"}, confidence=0.6),
+            make_extraction("3916387", {"name": "Someone", "pos": "K", "team": "NYJ"}, confidence=0.9),
+            make_extraction("9999999"),
+        ]
+        await validator.validate_extractions(extractions, FakeApiClient(PLAYERS))
+
+        summary = validator.get_validation_summary()
+
+        assert summary["total_validations"] == 4
+        assert summary["validation_breakdown"] == {"validated": 2, "not_found": 1, "mismatch": 1}
+        assert summary["confidence_distribution"] == {
+            "high_confidence": 1, "medium_confidence": 2, "low_confidence": 1
+        }
+        assert summary["success_rate"] == 0.5
+        assert summary["total_validated_players"] == 2
+        assert [p["id"] for p in summary["validated_players"]] == ["4241457", "3916387"]
+
+    @pytest.mark.asyncio
+    async def test_save_validation_results_writes_valid_json(self, tmp_path):
+        validator = CrossReferenceValidator()
+        await validator.validate_extractions(
+            [make_extraction("4241457", {"name": "Najee Harris"}), make_extraction("9999999")],
+            FakeApiClient(PLAYERS)
+        )
+        output = tmp_path / "validation.json"
+
+        validator.save_validation_results(str(output))
+
+        data = json.loads(output.read_text())
+        assert data["summary"] == validator.get_validation_summary()
+        assert [p["player_id"] for p in data["problematic_ids"]] == ["9999999"]
+        assert [r["player_id"] for r in data["detailed_results"]] == ["4241457", "9999999"]
+        assert data["detailed_results"][0]["api_data"]["full_name"] == "Najee Harris"
+        assert data["detailed_results"][1]["api_data"] is None
+
+    @pytest.mark.asyncio
+    async def test_save_validation_results_writes_utf8(self, tmp_path):
+        validator = CrossReferenceValidator()
+        await validator.validate_extractions(
+            [make_extraction("4241457", {"name": "Łukasz"})],
+            FakeApiClient(PLAYERS)
+        )
+        output = tmp_path / "validation.json"
+
+        validator.save_validation_results(str(output))
+
+        data = json.loads(output.read_text(encoding="utf-8"))
+        assert data["detailed_results"][0]["websocket_data"]["context_fields"] == {"name": "Łukasz"}
+
+    def test_save_empty_validation_results(self, tmp_path):
+        output = tmp_path / "empty.json"
+
+        CrossReferenceValidator().save_validation_results(str(output))
+
+        data = json.loads(output.read_text())
+        assert data["summary"] == {"total_validations": 0}
+        assert data["detailed_results"] == []
+
+    @pytest.mark.asyncio
+    async def test_lookup_concurrency_forwarded_to_client(self):
+        validator = CrossReferenceValidator()
+        client = FakeApiClient(PLAYERS)
+
+        await validator.validate_extractions([make_extraction("4241457")], client)
+        assert client.max_concurrent == 8
+
+        await validator.validate_extractions([make_extraction("3916387")], client, max_concurrent=3)
+        assert client.max_concurrent == 3
+
+    @pytest.mark.asyncio
+    async def test_repeat_calls_reuse_earlier_results(self):
+        validator = CrossReferenceValidator()
+        client = FakeApiClient(PLAYERS)
+        first = make_extraction("4241457", {"name": "Najee Harris"})
+        await validator.validate_extractions([first, make_extraction("9999999")], client)
+
+        repeat = make_extraction("4241457", {"name": "Najee Harris"})
+        results = await validator.validate_extractions(
+            [repeat, make_extraction("9999999"), make_extraction("3916387")], client
+        )
+
+        assert sorted(client.batch_calls[-1]) == ["3916387", "9999999"]
+        assert results[0].websocket_extraction is repeat
+        assert [r.validation_status for r in results] == ["VALIDATED", "NOT_FOUND", "VALIDATED"]
+        assert validator.validated_ids == {"4241457", "3916387", "9999999"}
+
+    @pytest.mark.asyncio
+    async def test_fully_cached_call_skips_api(self):
+        validator = CrossReferenceValidator()
+        client = FakeApiClient(PLAYERS)
+        await validator.validate_extractions([make_extraction("4241457")], client)
+
+        results = await validator.validate_extractions([make_extraction("4241457")], client)
+
+        assert len(client.batch_calls) == 1
+        assert results[0].validation_status == "VALIDATED"
+
+    def test_alternate_context_keys_and_blank_api_team(self):
+        validator = CrossReferenceValidator()
+        player = ESPNPlayer(player_id="4362628", full_name="Justin Jefferson", position="WR")
+        extraction = make_extraction(
+            "4362628", {"fullName": "Justin Jefferson", "pos": "TE", "nflTeam": "MIN"}, confidence=1.0
+        )
+
+        result = validator._create_validation_result(extraction, player)
+
+        # Team is skipped because the API has none; position still mismatches
+        assert result.discrepancies == ["Position mismatch: 'TE' vs 'WR'"]
+        assert result.confidence_score == pytest.approx(0.9)
+
+    @pytest.mark.asyncio
+    async def test_batch_results_share_validated_at(self):
+        validator = CrossReferenceValidator()
+        client = FakeApiClient(PLAYERS)
+        first = await validator.validate_extractions([make_extraction("4241457")], client)
+
+        results = await validator.validate_extractions(
+            [make_extraction("4241457"), make_extraction("3916387"), make_extraction("9999999")], client
+        )
+
+        assert len({id(r.validated_at) for r in results}) == 1
+        assert results[0].validated_at >= first[0].validated_at
+
+    def test_context_without_compared_keys_skips_normalization(self, monkeypatch):
+        validator = CrossReferenceValidator()
+
+        def fail(player):
+            raise AssertionError("API player should not be normalized")
+
+        monkeypatch.setattr(validator, "_normalize_api_player", fail)
+        extraction = make_extraction("4241457", {"pickNumber": 12, "teamId": 3})
+
+        result = validator._create_validation_result(extraction, PLAYERS["4241457"])
+
+        assert result.validation_status == "VALIDATED"
+        assert result.discrepancies == []
+
+
+class TestValidateWebsocketExtractions:
+    """Log-file validation with a caller-supplied API client."""
+
+    @pytest.mark.asyncio
+    async def test_reuses_supplied_client(self, tmp_path):
+        log_file = tmp_path / "messages.json"
+        log_file.write_text(json.dumps([
+            {"payload": '{"type":"PICK_MADE","playerId":4241457}', "websocket_url": "ws://test"},
+            {"payload": '{"type":"PICK_MADE","playerId":3916387}', "websocket_url": "ws://test"},
+        ]))
+        client = FakeApiClient(PLAYERS)
+
+        summary = await validate_websocket_extractions(str(log_file), api_client=client)
+
+        assert len(client.batch_calls) == 1
+        assert summary["validation_breakdown"]["validated"] == 2
@@ -8,6 +8,7 @@ to ensure state tracking works correctly end-to-end.
 
 import pytest
 import asyncio
+import importlib.util
 import json
 import logging
 from pathlib import Path
@@ -16,21 +17,30 @@ from typing import List, Dict, Any
 from ..state.draft_state import DraftState, DraftStatus
 from ..state.event_processor import DraftEventProcessor
 from ..state.state_handlers import StateUpdateHandlers
-from ..state.integration import DraftStateManager, create_draft_state_manager
+from ..state.integration import DraftStateManager, PlayerInfo, create_draft_state_manager
+from data_loader import Player
+
+# pytest-benchmark is a dev extra; the benchmark test is skipped without it
+HAS_PYTEST_BENCHMARK = importlib.util.find_spec("pytest_benchmark") is not None
+
+
+@pytest.fixture(scope="session")
+def make_draft_state():
+    """Factory for fresh DraftState instances (default: league 262233108, team 1)."""
+    def _make(league_id: str = "262233108", team_id: str = "1",
+              team_count: int = 12, rounds: int = 16) -> DraftState:
+        return DraftState(league_id=league_id, team_id=team_id,
+                          team_count=team_count, rounds=rounds)
+    return _make
 
 
 class TestDraftStateIntegration:
     """Integration tests for complete draft state system."""
     
     @pytest.fixture
-    def draft_state(self):
+    def draft_state(self, make_draft_state):
         """Create test draft state."""
-        return DraftState(
-            league_id="262233108",
-            team_id="1", 
-            team_count=12,
-            rounds=16
-        )
+        return make_draft_state()
         
     @pytest.fixture
     def event_processor(self, draft_state):
@@ -173,6 +183,125 @@ class TestDraftStateIntegration:
         assert draft_state.current_pick == 2
         assert len(draft_state.drafted_players) == 2
         
+    def test_state_validation_reports_duplicate_players(self, state_handlers, draft_state):
+        """Test that a player on two rosters is reported once as a duplicate."""
+        
+        draft_state.apply_pick('1001', '2', 1, 'QB')
+        draft_state.apply_pick('1002', '3', 2, 'RB')
+        draft_state._other_rosters['3']['QB'].append('1001')
+        
+        validation = state_handlers.validate_draft_consistency()
+        
+        duplicates = [e for e in validation.errors if e.startswith('Duplicate player')]
+        assert duplicates == ["Duplicate player 1001 found in multiple rosters"]
+        assert not validation.is_valid
+        
+    def test_state_validation_reports_roster_count_mismatch(self, state_handlers, draft_state):
+        """Test that a roster that disagrees with the pick history is reported."""
+        
+        draft_state.apply_pick('1001', '2', 1, 'QB')
+        draft_state.apply_pick('1002', '2', 2, 'RB')
+        draft_state._other_rosters['2']['RB'].clear()
+        
+        validation = state_handlers.validate_draft_consistency()
+        
+        assert "Team 2 roster count mismatch: 1 vs 2" in validation.errors
+        assert not validation.is_valid
+        
+    def test_rejected_pick_returns_invalid_result(self, state_handlers, draft_state):
+        """Test that a failed pre-pick validation is reflected in the merged result."""
+        
+        draft_state.apply_pick('1001', '1', 1, 'QB')
+        
+        validation = state_handlers.handle_pick_with_validation('1001', '2', 2, 'QB')
+        
+        assert not validation.is_valid
+        assert "Player 1001 already drafted" in validation.errors
+        
+    def test_full_consistency_check_runs_once_per_round(self, state_handlers):
+        """Test that picks inside a round only get the cheap delta check."""
+        
+        for pick in range(1, 13):
+            validation = state_handlers.handle_pick_with_validation(
+                str(1000 + pick), str(pick), pick, 'RB'
+            )
+            assert validation.is_valid
+            
+        assert state_handlers.stats.validation_checks == 1
+        
+    @pytest.mark.asyncio
+    async def test_handle_picks_batch_applies_in_order(self, state_handlers, draft_state):
+        """Test batch pick handling for log replay."""
+        
+        picks = [
+            {'player_id': '1001', 'team_id': '1', 'pick_number': 1, 'position': 'QB'},
+            {'player_id': '1002', 'team_id': '2', 'pick_number': 2, 'position': 'RB'},
+            {'player_id': '1001', 'team_id': '3', 'pick_number': 3, 'position': 'QB'},
+        ]
+        
+        results = await state_handlers.handle_picks_batch(picks)
+        
+        assert [result.is_valid for result in results] == [True, True, False]
+        assert draft_state.current_pick == 2
+        
+    def test_batch_expected_teams_follows_snake_order(self, state_handlers, draft_state):
+        """Test bulk expected-team lookup against the single-pick calculation."""
+        
+        assert state_handlers.batch_expected_teams([1, 2]) == [None, None]
+        
+        draft_state.set_draft_order(['a', 'b', 'c'])
+        picks = list(range(1, 10))
+        
+        assert state_handlers.batch_expected_teams(picks) == [
+            'a', 'b', 'c', 'c', 'b', 'a', 'a', 'b', 'c'
+        ]
+        assert state_handlers.batch_expected_teams(picks) == [
+            state_handlers._calculate_expected_team(p) for p in picks
+        ]
+        
+    def test_team_pick_counts_follow_rollback(self, draft_state):
+        """Test that per-team pick and roster counts track picks and rollbacks."""
+        
+        draft_state.apply_pick('1001', '1', 1, 'QB')
+        draft_state.apply_pick('1002', '2', 2, 'RB')
+        draft_state.apply_pick('1003', '2', 3, 'WR')
+        
+        assert draft_state.team_pick_count('1') == 1
+        assert draft_state.team_pick_count('2') == 2
+        assert draft_state.team_pick_count('9') == 0
+        
+        assert draft_state.roster_size('2') == 2
+        assert [p['player_id'] for p in draft_state.team_picks('2')] == ['1002', '1003']
+        assert draft_state.pick_count == 3
+        
+        # Snapshot -1 was taken just before the third pick
+        assert draft_state.rollback_to_snapshot(-1)
+        assert draft_state.team_pick_count('2') == 1
+        assert draft_state.roster_size('2') == 1
+        assert draft_state.roster_size('1') == 1
+        assert [p['player_id'] for p in draft_state.team_picks('2')] == ['1002']
+        
+    def test_rollback_undoes_logged_picks(self, draft_state):
+        """Test that rollback reverts picks from the log back into the pool."""
+        
+        draft_state.initialize_player_pool(['1001', '1002', '1003'])
+        draft_state.apply_pick('1001', '1', 1, 'QB')
+        draft_state.apply_pick('1002', '2', 2, 'RB')
+        draft_state.apply_pick('1003', '3', 3, 'WR')
+        
+        # Snapshot 0 was taken before any pick
+        snapshot = draft_state.get_snapshot(0)
+        assert snapshot.drafted_players == frozenset()
+        assert set(snapshot.available_players) == {'1001', '1002', '1003'}
+        
+        assert draft_state.rollback_to_snapshot(0)
+        assert draft_state.pick_count == 0
+        assert draft_state.current_pick == 0
+        assert set(draft_state.available_players) == {'1001', '1002', '1003'}
+        assert draft_state.my_roster['QB'] == []
+        assert draft_state.other_rosters == {}
+        assert len(draft_state._state_snapshots) == 1
+        
     def test_snake_draft_calculation(self, draft_state):
         """Test snake draft position calculations."""
         
@@ -193,6 +322,22 @@ class TestDraftStateIntegration:
         draft_state._update_picks_until_next()
         assert draft_state.picks_until_next == 1  # 24 - 23
         
+    def test_picks_until_next_recomputed_on_read(self, draft_state):
+        """Test that picks only mark picks_until_next stale until it is read."""
+        
+        draft_state.set_draft_order([str(i) for i in range(1, 13)])
+        
+        draft_state.apply_pick('1001', '2', 2, 'QB')
+        draft_state.apply_pick('1002', '3', 3, 'RB')
+        assert draft_state._picks_dirty
+        
+        assert draft_state.picks_until_next == 21  # 24 - 3
+        assert not draft_state._picks_dirty
+        
+        # Rollback restores the pick number; the count follows it
+        assert draft_state.rollback_to_snapshot(-1)
+        assert draft_state.picks_until_next == 22  # 24 - 2
+        
     def test_error_handling(self, event_processor):
         """Test error handling for malformed messages."""
         
@@ -244,16 +389,35 @@ class TestDraftStateIntegration:
         # Test message processing speed
         test_message = "SELECTED 1 4362628 1 {MEMBER_ID}"
         
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
         for _ in range(100):  # Process 100 messages
             event_processor.process_websocket_message(test_message)
-        end_time = time.time()
+        end_ns = time.perf_counter_ns()
         
-        avg_time_per_message = (end_time - start_time) / 100
-        avg_time_ms = avg_time_per_message * 1000
+        avg_ns = (end_ns - start_ns) // 100
         
         # Should be well under 200ms per message
-        assert avg_time_ms < 200, f"Average processing time {avg_time_ms:.2f}ms exceeds 200ms requirement"
+        assert avg_ns < 200_000_000, f"Average processing time {avg_ns / 1e6:.2f}ms exceeds 200ms requirement"
+        
+    @pytest.mark.skipif(not HAS_PYTEST_BENCHMARK, reason="pytest-benchmark not installed")
+    def test_message_processing_benchmark(self, benchmark, make_draft_state):
+        """Benchmark message processing so regressions below the 200ms budget show up."""
+        test_message = "SELECTED 1 4362628 1 {MEMBER_ID}"
+        benchmark.extra_info['budget_us'] = 200_000
+        results = []
+        
+        # Each round gets a fresh state so the pick is applied, not rejected
+        # as a duplicate of the previous round's pick
+        def setup():
+            return (DraftEventProcessor(make_draft_state()),), {}
+            
+        def process(processor):
+            results.append(processor.process_websocket_message(test_message))
+            
+        benchmark.pedantic(process, setup=setup, rounds=1000, warmup_rounds=10)
+        
+        assert all(results)
+        assert benchmark.stats.stats.mean < 0.01
         
     def test_draft_completion(self, draft_state, state_handlers):
         """Test draft completion handling."""
@@ -292,38 +456,192 @@ class TestDraftStateIntegration:
         # Clean up
         await manager.close()
 
+    @pytest.mark.asyncio
+    async def test_state_updates_are_debounced(self):
+        """Test that a burst of state updates produces a single callback."""
+        manager = DraftStateManager("test_league", "test_team")
+        summaries = []
+        manager.on_state_updated = summaries.append
+
+        for _ in range(10):
+            manager._schedule_state_update()
+        assert summaries == []
+
+        await asyncio.sleep(manager.STATE_UPDATE_INTERVAL * 2)
+        assert len(summaries) == 1
+        assert summaries[0]['league_id'] == "test_league"
+
+        await manager.close()
+
+    @pytest.mark.asyncio
+    async def test_pending_picks_updated_after_resolution(self):
+        """Test that resolved names are pushed for pending picks only."""
+
+        class FakeResolvedPlayer:
+            def __init__(self, full_name, position):
+                self.full_name = full_name
+                self.position = position
+
+        class FakeResolver:
+            async def batch_resolve_ids(self, player_ids):
+                return {pid: FakeResolvedPlayer(f"Name {pid}", "RB") if pid != '3' else None
+                        for pid in player_ids}
+
+            def was_not_found(self, player_id):
+                return player_id == '3'
+
+        manager = DraftStateManager("test_league", "test_team")
+        manager.player_resolver = FakeResolver()
+        picks = []
+        manager.on_pick_processed = picks.append
+
+        for pid in ['1', '2', '3']:
+            manager._handle_pick_made({'player_id': pid, 'team_id': '5', 'pick_number': int(pid)})
+        assert [p['player_name'] for p in picks] == ['Player #1', 'Player #2', 'Player #3']
+
+        resolved = await manager.resolve_queued_players()
+        assert resolved == 2
+        assert [p['player_name'] for p in picks[3:]] == ['Name 1', 'Name 2']
+        assert manager._pending_picks == {}
+
+        # Unresolvable players are not queued again
+        assert manager._resolve_player_position('3') == "BENCH"
+        assert manager._resolution_queue == {}
+
+    @pytest.mark.asyncio
+    async def test_failed_lookups_retried_before_giving_up(self):
+        """Test that a transient lookup failure keeps the pick pending and retries."""
+
+        class FakeResolvedPlayer:
+            def __init__(self, full_name, position):
+                self.full_name = full_name
+                self.position = position
+
+        class FlakyResolver:
+            def __init__(self):
+                self.calls = []
+                self.online = False
+
+            async def batch_resolve_ids(self, player_ids):
+                self.calls.append(list(player_ids))
+                return {pid: FakeResolvedPlayer("Bijan Robinson", "RB")
+                        if self.online and pid == '1' else None for pid in player_ids}
+
+            def was_not_found(self, player_id):
+                return False
+
+        manager = DraftStateManager("test_league", "test_team")
+        manager.RESOLUTION_RETRY_DELAY = 0
+        resolver = manager.player_resolver = FlakyResolver()
+        picks = []
+        manager.on_pick_processed = picks.append
+        manager._handle_pick_made({'player_id': '1', 'team_id': '5', 'pick_number': 1})
+        manager._handle_pick_made({'player_id': '2', 'team_id': '5', 'pick_number': 2})
+
+        assert await manager.resolve_queued_players() == 0
+        assert set(manager._pending_picks) == {'1', '2'}
+        assert manager._resolution_queue == {}
+        await asyncio.sleep(0.01)
+        assert list(manager._resolution_queue) == ['1', '2']
+
+        resolver.online = True
+        assert await manager.resolve_queued_players() == 1
+        assert picks[-1]['player_name'] == "Bijan Robinson"
+        assert list(manager._pending_picks) == ['2']
+        await asyncio.sleep(0.01)
+
+        # Third failure for player 2 exhausts MAX_RESOLUTION_ATTEMPTS
+        assert await manager.resolve_queued_players() == 0
+        await asyncio.sleep(0.01)
+        assert resolver.calls == [['1', '2'], ['1', '2'], ['2']]
+        assert manager._known_missing == {'2'}
+        assert manager._pending_picks == {}
+        assert manager._resolution_queue == {}
+        await manager.close()
+
+    @pytest.mark.asyncio
+    async def test_monitor_draft_returns_on_completion(self):
+        """Test that indefinite monitoring wakes up when the draft completes."""
+        manager = DraftStateManager("test_league", "test_team")
+        monitor_task = asyncio.create_task(manager.monitor_draft())
+
+        await asyncio.sleep(0)
+        assert not monitor_task.done()
+
+        manager.draft_state.complete_draft()
+        await asyncio.wait_for(monitor_task, timeout=1)
+
+    def test_enriched_roster_cached_until_roster_changes(self):
+        """Test that get_enriched_roster is rebuilt only when inputs change."""
+        manager = DraftStateManager("test_league", "1")
+        manager.draft_state.apply_pick("1001", "1", 1, "QB")
+
+        roster = manager.get_enriched_roster()
+        assert roster['QB'] == [{'player_id': '1001', 'player_name': 'Player #1001'}]
+        assert manager.get_enriched_roster() is roster
+
+        manager._players["1001"] = PlayerInfo("Josh Allen", "QB")
+        assert manager.get_enriched_roster()['QB'][0]['player_name'] == "Josh Allen"
+
+        manager.draft_state.apply_pick("1002", "1", 24, "RB")
+        assert len(manager.get_enriched_roster()['RB']) == 1
+
+    def test_player_database_position_and_adp_queries(self, draft_state):
+        """Test that position and top-N queries come back in ADP order."""
+        def make_player(name, position, adp_rank):
+            return Player(name=name, team="BUF", position=position, adp_rank=adp_rank,
+                          position_rank=1, adp_avg=float(adp_rank), adp_std=0.0,
+                          fantasy_points=0.0)
+        draft_state.load_player_database([
+            make_player("James Cook", "RB", 30),
+            make_player("Josh Allen", "QB", 20),
+            make_player("Khalil Shakir", "WR", 90),
+            make_player("Bijan Robinson", "RB", 2),
+        ])
+
+        rbs = draft_state.get_available_players_by_position("RB")
+        assert [p.name for p in rbs] == ["Bijan Robinson", "James Cook"]
+        rbs.clear()
+        assert len(draft_state.get_available_players_by_position("RB")) == 2
+        assert draft_state.get_available_players_by_position("K") == []
+        assert [p.name for p in draft_state.get_top_available_players(3)] == [
+            "Bijan Robinson", "Josh Allen", "James Cook"
+        ]
+        assert draft_state.get_player("Josh Allen").adp_rank == 20
+
+
+@pytest.fixture(scope="module")
+def sample_har_messages():
+    """Sample WebSocket messages from Sprint 0 HAR files (read-only, shared)."""
+    return (
+        "TOKEN 1756607368924",
+        "JOINED 1 {MEMBER_ID}",
+        "CLOCK 0 76305",
+        "SELECTING 1 30000",
+        "CLOCK 1 30000 1",
+        "CLOCK 1 25000 1",
+        "CLOCK 1 20000 1",
+        "SELECTED 1 3918298 1 {MEMBER_ID}",
+        "AUTOSUGGEST 4262921",
+        "SELECTING 2 30000",
+        "CLOCK 2 30000 1",
+        "CLOCK 2 25000 1",
+        "SELECTED 2 4362238 2 {MEMBER_ID}",
+        "SELECTING 3 30000",
+        "SELECTED 3 4429795 3 {MEMBER_ID}",
+        "PING PING%201756607417674",
+        "PONG PING%201756607417674"
+    )
+
 
 class TestMessageReplay:
     """Test system with complete Sprint 0 message logs."""
     
-    @pytest.fixture
-    def sample_har_messages(self):
-        """Sample WebSocket messages from Sprint 0 HAR files."""
-        return [
-            "TOKEN 1756607368924",
-            "JOINED 1 {MEMBER_ID}",
-            "CLOCK 0 76305",
-            "SELECTING 1 30000",
-            "CLOCK 1 30000 1",
-            "CLOCK 1 25000 1",
-            "CLOCK 1 20000 1",
-            "SELECTED 1 3918298 1 {MEMBER_ID}",
-            "AUTOSUGGEST 4262921",
-            "SELECTING 2 30000",
-            "CLOCK 2 30000 1", 
-            "CLOCK 2 25000 1",
-            "SELECTED 2 4362238 2 {MEMBER_ID}",
-            "SELECTING 3 30000",
-            "SELECTED 3 4429795 3 {MEMBER_ID}",
-            "PING PING%201756607417674",
-            "PONG PING%201756607417674"
-        ]
-        
-    def test_complete_message_replay(self, sample_har_messages):
+    def test_complete_message_replay(self, sample_har_messages, make_draft_state):
         """Test complete message sequence from Sprint 0."""
         
         # Create system
-        draft_state = DraftState("262233108", "1", 12, 16)
+        draft_state = make_draft_state()
         processor = DraftEventProcessor(draft_state)
         
         # Initialize players from Sprint 0 discovery
@@ -355,6 +673,24 @@ class TestMessageReplay:
         assert stats['selected_messages'] == 3
         assert stats['selecting_messages'] == 3
         assert stats['parse_errors'] == 0
+        
+    def test_batch_message_replay(self, sample_har_messages, make_draft_state):
+        """Test replaying the message sequence through process_batch."""
+        
+        draft_state = make_draft_state()
+        processor = DraftEventProcessor(draft_state)
+        draft_state.initialize_player_pool(['3918298', '4362238', '4429795'])
+        
+        processed = processor.process_batch(sample_har_messages)
+        
+        assert processed == len(sample_har_messages)
+        assert draft_state.current_pick == 3
+        assert draft_state.drafted_players == {'3918298', '4362238', '4429795'}
+        
+        stats = processor.get_stats()
+        assert stats['total_messages'] == len(sample_har_messages)
+        assert stats['selected_messages'] == 3
+        assert stats['parse_errors'] == 0
 
 
 if __name__ == "__main__":
@@ -4,6 +4,11 @@ Test the Player ID Extractor functionality.
 """
 
 import json
+import sys
+
+import pytest
+
+from ..utils import player_id_extractor
 from ..utils.player_id_extractor import PlayerIdExtractor, analyze_draft_message_for_players
 
 
@@ -121,5 +126,236 @@ def test_player_id_extractor():
     print("\n[SUCCESS] Player ID Extractor test completed!")
 
 
+def test_espn_text_protocol_extraction():
+    """Test the ESPN draft text protocol fast path."""
+    extractor = PlayerIdExtractor()
+    
+    extractions = extractor.extract_from_message(
+        "SELECTED 2 4362628 4 {00000000-0000-4000-8000-000000000A02}", "test_ws"
+    )
+    assert [e.player_id for e in extractions] == ["4362628"]
+    assert extractions[0].message_type == "DRAFT_PICK"
+    assert extractions[0].context_fields["draft_protocol"] == "espn_text"
+    
+    # Other protocol commands carry no player IDs
+    for message in ["SELECTING 1 30000", "CLOCK 1 29000 1", "AUTODRAFT 1 true", "PING", "PONG 123"]:
+        assert extractor.extract_from_message(message, "test_ws") == []
+        
+    assert extractor.unique_player_ids == {"4362628"}
+    
+    summary = extractor.get_extraction_summary()
+    assert summary["total_extractions"] == 1
+    assert summary["by_message_type"] == {"DRAFT_PICK": 1}
+    assert sum(summary["confidence_breakdown"].values()) == 1
+
+
+
+def test_text_pattern_extraction():
+    """Test the regex fallback for socket.io envelopes and key=value text."""
+    extractor = PlayerIdExtractor()
+    
+    extractions = extractor.extract_from_message(
+        '42["pick",{"playerId": "4241457" "id":3916387}]', "test_ws"
+    )
+    assert [e.player_id for e in extractions] == ["4241457", "3916387"]
+    assert all(e.confidence == 0.7 for e in extractions)
+    
+    # Each ID in the text is reported once, in document order
+    extractions = extractor.extract_from_message("player_id: 3916387 playerId=4241457", "test_ws")
+    assert [e.player_id for e in extractions] == ["3916387", "4241457"]
+
+
+def test_context_fields_collected_from_player_node():
+    """Test that only known context fields are kept, in payload order."""
+    extractor = PlayerIdExtractor()
+    
+    extractions = extractor.extract_from_message(
+        '{"event":"draft_pick","player":{"pos":"QB","id":3916387,"rank":4,"name":"Josh Allen"}}',
+        "test_ws"
+    )
+    
+    assert len(extractions) == 1
+    assert extractions[0].context_fields == {"pos": "QB", "name": "Josh Allen"}
+    assert list(extractions[0].context_fields) == ["pos", "name"]
+
+
+def test_confidence_by_field_and_context():
+    """Test confidence scoring for ID field names and supporting context."""
+    extractor = PlayerIdExtractor()
+    
+    def confidence_of(message):
+        return [e.confidence for e in extractor.extract_from_message(message, "test_ws")]
+    
+    assert confidence_of('{"playerId":4241457}') == pytest.approx([0.8])
+    assert confidence_of('{"athleteId":4241457,"name":"Najee Harris"}') == pytest.approx([0.8])
+    assert confidence_of('{"id":4241457,"pos":"RB","team":"PIT"}') == pytest.approx([0.7])
+    assert confidence_of('{"selectedPlayerId":4241457}') == pytest.approx([0.5])
+    
+    assert extractor._is_valid_player_id("4241457") is True
+    assert extractor._is_valid_player_id("123") is False
+    assert extractor._is_valid_player_id("INVALID") is False
+
+
+def test_save_extractions_writes_json(tmp_path):
+    """Test that saved extractions round-trip through JSON."""
+    extractor = PlayerIdExtractor()
+    extractor.extract_from_message('{"type":"PICK_MADE","playerId":4241457,"pickNumber":12}', "test_ws")
+    output = tmp_path / "extractions.json"
+    
+    extractor.save_extractions(str(output))
+    
+    data = json.loads(output.read_text())
+    assert data["summary"]["total_extractions"] == 1
+    assert data["extractions"][0]["player_id"] == "4241457"
+    assert data["extractions"][0]["context_fields"] == {"pickNumber": 12}
+
+
+def test_save_extractions_writes_utf8(tmp_path):
+    """Test that non-ASCII context is saved as UTF-8 regardless of the locale."""
+    extractor = PlayerIdExtractor()
+    extractor.extract_from_message('{"playerId":4241457,"name":"Łukasz"}', "test_ws")
+    output = tmp_path / "extractions.json"
+    
+    extractor.save_extractions(str(output))
+    
+    data = json.loads(output.read_text(encoding="utf-8"))
+    assert data["extractions"][0]["context_fields"] == {"name": "Łukasz"}
+
+
+def test_failed_save_keeps_previous_extractions_file(tmp_path, monkeypatch):
+    """Test that a save failing partway leaves the old file and no temp file."""
+    extractor = PlayerIdExtractor()
+    output = tmp_path / "extractions.json"
+    output.write_text('{"previous": true}')
+    
+    def fail():
+        raise RuntimeError("boom")
+    monkeypatch.setattr(extractor, "get_extraction_summary", fail)
+    extractor.save_extractions(str(output))
+    
+    assert json.loads(output.read_text()) == {"previous": True}
+    assert list(tmp_path.iterdir()) == [output]
+
+
+def test_extract_batch_matches_per_message_extraction():
+    """Test that batch extraction yields the same IDs and summary as single calls."""
+    frames = [
+        ('{"type":"PICK_MADE","playerId":4241457}', "ws_a", "PICK_MADE"),
+        ("SELECTED 2 4362628 4", "ws_a", "unknown"),
+        ("PING", "ws_a", "unknown"),
+        ('42["pick",{"playerId":3916387}]', "ws_b", "unknown"),
+    ]
+    single = PlayerIdExtractor()
+    for payload, url, message_type in frames:
+        single.extract_from_message(payload, url, message_type)
+    batched = PlayerIdExtractor()
+    
+    extractions = batched.extract_batch(frames)
+    
+    assert [e.player_id for e in extractions] == ["4241457", "4362628", "3916387"]
+    assert len({e.timestamp for e in extractions}) == 1
+    assert batched.get_extraction_summary()["by_message_type"] == single.get_extraction_summary()["by_message_type"]
+    assert batched.unique_player_ids == single.unique_player_ids
+
+
+def test_large_payload_keeps_one_shared_excerpt():
+    """Test that extractions hold a single truncated excerpt of a large frame."""
+    extractor = PlayerIdExtractor()
+    picks = [{"playerId": 4241457 + n, "notes": "x" * 200} for n in range(10)]
+    payload = json.dumps({"type": "DRAFT_STATE", "picks": picks})
+    
+    extractions = extractor.extract_from_message(payload, "test_ws")
+    
+    assert len(extractions) == 10
+    assert extractions[0].raw_message == payload[:500]
+    assert all(e.raw_message is extractions[0].raw_message for e in extractions)
+    
+    short = extractor.extract_from_message("SELECTED 2 4362628 4", "test_ws")
+    assert short[0].raw_message == "SELECTED 2 4362628 4"
+
+
+def test_high_confidence_ids_tracked_incrementally():
+    """Test that high-confidence IDs accumulate across calls and are returned as a copy."""
+    extractor = PlayerIdExtractor()
+    extractor.extract_from_message('{"playerId":4241457}', "test_ws")
+    extractor.extract_from_message('{"id":3916387}', "test_ws")
+    extractor.extract_from_message("SELECTED 2 4362628 4", "test_ws")
+    
+    high = extractor.get_high_confidence_ids()
+    
+    assert high == {"4241457", "4362628"}
+    high.add("1234567")
+    assert extractor.get_high_confidence_ids() == {"4241457", "4362628"}
+
+
+
+def test_repeated_payload_reuses_extraction(monkeypatch):
+    """Test that an identical frame is not re-parsed but still recorded per frame."""
+    extractor = PlayerIdExtractor()
+    payload = '{"type":"PICK_MADE","player":{"playerId":4241457,"name":"Najee Harris"}}'
+    decoded = []
+    original = player_id_extractor._json_loads
+    monkeypatch.setattr(player_id_extractor, "_json_loads", lambda p: decoded.append(p) or original(p))
+    
+    first = extractor.extract_from_message(payload, "ws_a", "PICK_MADE")
+    second = extractor.extract_from_message(payload, "ws_b", "PICK_MADE")
+    third = extractor.extract_from_message(payload, "ws_a", "unknown")
+    
+    assert len(decoded) == 2
+    assert second[0] is not first[0]
+    assert second[0].websocket_url == "ws_b"
+    assert (second[0].player_id, second[0].confidence) == (first[0].player_id, first[0].confidence)
+    assert second[0].context_fields == first[0].context_fields
+    assert second[0].context_fields is not first[0].context_fields
+    assert third[0].message_type == "unknown"
+    assert extractor.get_extraction_summary()["total_extractions"] == 3
+
+
+def test_edits_to_returned_extractions_do_not_leak_into_cache():
+    """Test that mutating a returned extraction leaves later repeats untouched."""
+    extractor = PlayerIdExtractor()
+    payload = '{"type":"PICK_MADE","playerId":4241457,"name":"Najee Harris"}'
+    
+    first = extractor.extract_from_message(payload, "ws_a", "PICK_MADE")
+    original_confidence = first[0].confidence
+    first[0].context_fields["name"] = "EDITED"
+    first[0].confidence = 0.1
+    again = extractor.extract_from_message(payload, "ws_a", "PICK_MADE")
+    
+    assert again[0].context_fields == {"name": "Najee Harris"}
+    assert again[0].confidence == original_confidence
+
+
+def test_payload_cache_does_not_hold_large_frames():
+    """Test that the repeat-frame cache keeps only an excerpt of each payload."""
+    extractor = PlayerIdExtractor()
+    payload = json.dumps({"type": "DRAFT_STATE", "playerId": 4241457, "notes": "x" * 5000})
+    refs_before = sys.getrefcount(payload)
+    
+    first = extractor.extract_from_message(payload, "ws_a")
+    again = extractor.extract_from_message(payload, "ws_b")
+    
+    assert sys.getrefcount(payload) == refs_before
+    assert all(len(part) <= 500 for key in extractor._payload_cache for part in key if isinstance(part, str))
+    assert [e.player_id for e in again] == [e.player_id for e in first]
+    assert again[0].websocket_url == "ws_b"
+
+
+def test_flat_fast_path_matches_full_walk():
+    """Test that flat objects take the fast path and match the general walker."""
+    extractor = PlayerIdExtractor()
+    flat = {"type": "PICK_MADE", "id": 3916387, "playerId": "4241457", "name": "Najee Harris", "pickNumber": 12}
+    nested = {"type": "PICK_MADE", "playerId": 4241457, "player": {"id": 3916387}}
+    
+    fast = extractor._extract_from_flat_dict(flat, "raw", "ws", "PICK_MADE", "ts")
+    walked = extractor._extract_from_dict(flat, "raw", "ws", "PICK_MADE", "ts")
+    
+    assert fast == walked
+    assert [e.player_id for e in fast] == ["3916387", "4241457"]
+    assert extractor._extract_from_flat_dict(nested, "raw", "ws", "PICK_MADE", "ts") is None
+    assert [e.player_id for e in extractor._extract_from_json(nested, "raw", "ws", "PICK_MADE", "ts")] == [
+        "4241457", "3916387"
+    ]
+
 if __name__ == "__main__":
-    test_player_id_extractor()
\ No newline at end of file
+    test_player_id_extractor()
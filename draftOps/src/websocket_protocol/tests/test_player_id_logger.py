@@ -5,7 +5,12 @@ This will open a browser and monitor ESPN draft WebSocket traffic.
 """
 
 import asyncio
-from ..scripts.player_id_logger import PlayerIdDraftLogger
+import os
+import sys
+from ..scripts.player_id_logger import PlayerIdDraftLogger, close_shared_browsers
+
+# Full tracebacks on failure only when asked for
+_DEBUG = os.environ.get("LOGGER_TEST_DEBUG") == "1"
 
 
 async def run_logger_test():
@@ -25,16 +30,22 @@ async def run_logger_test():
     - Let a few picks happen to capture data
     - Press Ctrl+C to stop and save results
     
-    Starting in 3 seconds...
+    Starting in 3 seconds (immediately when not run interactively)...
     """)
     
-    await asyncio.sleep(3)
+    # The banner delay only matters to someone watching the terminal
+    await asyncio.sleep(3 if sys.stdin.isatty() else 0)
     
-    # Create logger with visible browser (headless=False)
-    logger = PlayerIdDraftLogger(headless=False)
+    # Visible browser for manual use; headless under CI
+    logger = PlayerIdDraftLogger(headless=os.environ.get("CI") == "true")
     
-    # Run for up to 20 minutes (or until Ctrl+C) to allow time for draft to start
-    await logger.run_player_id_analysis(duration=1200)
+    # Run for up to 20 minutes (or until Ctrl+C) to allow time for draft to start;
+    # LOGGER_TEST_DURATION lets CI cap the run
+    duration = int(os.environ.get("LOGGER_TEST_DURATION", "1200"))
+    try:
+        await logger.run_player_id_analysis(duration=duration)
+    finally:
+        await close_shared_browsers()
 
 
 if __name__ == "__main__":
@@ -43,6 +54,7 @@ if __name__ == "__main__":
     except KeyboardInterrupt:
         print("\n\nStopped by user. Check the 'reports' folder for results.")
     except Exception as e:
-        print(f"Error: {e}")
-        import traceback
-        traceback.print_exc()
\ No newline at end of file
+        print(f"Error: {type(e).__name__}: {e}")
+        if _DEBUG:
+            import traceback
+            traceback.print_exc()
\ No newline at end of file
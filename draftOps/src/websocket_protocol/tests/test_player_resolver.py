@@ -1,110 +1,172 @@
 #!/usr/bin/env python3
 """
 Test the Player Resolver functionality.
+
+All tests share one module-scoped resolver, so the SQLite connection (and
+its page cache) and the memory cache stay warm from one test to the next.
 """
 
-import asyncio
+import pytest
+import pytest_asyncio
+from datetime import datetime
 from pathlib import Path
-from ..scripts.player_resolver import PlayerResolver
+from ..scripts.player_resolver import PlayerResolver, ResolvedPlayer
 
+TEST_IDS = ["4241457", "3916387", "4362628"]
 
-async def test_player_resolver():
-    """Test the PlayerResolver with sample data."""
-    print("Testing ESPN Player Resolver...")
-    print("=" * 60)
-    
-    # Use a test database in the tests folder
+
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def resolver():
+    """Shared PlayerResolver backed by a test database in the tests folder."""
     test_db = Path(__file__).parent / "test_player_resolver.db"
     
-    async with PlayerResolver(cache_db_path=str(test_db)) as resolver:
-        # Test single ID resolution
-        print("\n1. Testing single ID resolution:")
-        print("-" * 40)
-        test_ids = ["4241457", "3916387", "4362628"]
-        
-        for player_id in test_ids:
-            player = await resolver.resolve_espn_id(player_id)
-            if player:
-                print(f"  {player_id}: {player.full_name}")
-                print(f"    Position: {player.position}")
-                print(f"    Team: {player.nfl_team}")
-                print(f"    Resolution: {player.resolution_method}")
-                print(f"    Confidence: {player.confidence_score}")
-            else:
-                print(f"  {player_id}: Not found")
-        
-        # Test batch resolution
-        print("\n2. Testing batch resolution:")
-        print("-" * 40)
-        batch_results = await resolver.batch_resolve_ids(test_ids)
-        for player_id, player in batch_results.items():
-            if player:
-                print(f"  {player_id}: {player.full_name} ({player.position}, {player.nfl_team})")
-            else:
-                print(f"  {player_id}: Not found")
-        
-        # Test WebSocket message extraction and resolution
-        print("\n3. Testing WebSocket message processing:")
-        print("-" * 40)
-        test_messages = [
-            '{"type":"PICK_MADE","playerId":4241457,"teamId":1}',
-            '{"event":"draft_pick","player":{"id":3916387,"name":"Josh Allen"}}',
-            '{"data":{"selectedPlayer":{"playerId":"4362628"}}}'
-        ]
-        
-        for i, msg in enumerate(test_messages, 1):
-            print(f"\nMessage {i}: {msg[:50]}...")
-            player_ids = resolver.extract_player_ids_from_message(msg)
-            if player_ids:
-                print(f"  Extracted IDs: {player_ids}")
-                players = await resolver.batch_resolve_ids(player_ids)
-                for pid, player in players.items():
-                    if player:
-                        print(f"  -> {player.full_name} ({player.position})")
-                    else:
-                        print(f"  -> Player ID {pid} not resolved")
-            else:
-                print("  No player IDs found")
-        
-        # Test fuzzy name search
-        print("\n4. Testing fuzzy name search:")
-        print("-" * 40)
-        test_names = ["Josh", "Harris", "Jefferson"]
-        
-        for name in test_names:
-            print(f"\nSearching for '{name}':")
-            search_results = resolver.fuzzy_match_name(name, limit=3)
-            if search_results:
-                for player in search_results:
-                    print(f"  - {player.full_name} ({player.position}, {player.nfl_team})")
-            else:
-                print(f"  No results found")
+    async with PlayerResolver(cache_db_path=str(test_db)) as shared:
+        yield shared
+
+
+# Async tests run on the module loop that owns the shared resolver
+@pytest.mark.asyncio(loop_scope="module")
+async def test_single_id_resolution(resolver):
+    """Test single ID resolution."""
+    print("\n1. Testing single ID resolution:")
+    print("-" * 40)
+    
+    for player_id in TEST_IDS:
+        player = await resolver.resolve_espn_id(player_id)
+        assert player is not None  # Falls back to a placeholder when unresolved
+        print(f"  {player_id}: {player.full_name}")
+        print(f"    Position: {player.position}")
+        print(f"    Team: {player.nfl_team}")
+        print(f"    Resolution: {player.resolution_method}")
+        print(f"    Confidence: {player.confidence_score}")
+
+
+@pytest.mark.asyncio(loop_scope="module")
+async def test_batch_resolution(resolver):
+    """Test batch resolution."""
+    print("\n2. Testing batch resolution:")
+    print("-" * 40)
+    
+    batch_results = await resolver.batch_resolve_ids(TEST_IDS)
+    assert set(batch_results) == set(TEST_IDS)
+    
+    for player_id, player in batch_results.items():
+        if player:
+            print(f"  {player_id}: {player.full_name} ({player.position}, {player.nfl_team})")
+        else:
+            print(f"  {player_id}: Not found")
+
+
+@pytest.mark.asyncio(loop_scope="module")
+async def test_websocket_message_processing(resolver):
+    """Test WebSocket message extraction and resolution."""
+    print("\n3. Testing WebSocket message processing:")
+    print("-" * 40)
+    test_messages = [
+        '{"type":"PICK_MADE","playerId":4241457,"teamId":1}',
+        '{"event":"draft_pick","player":{"id":3916387,"name":"Josh Allen"}}',
+        '{"data":{"selectedPlayer":{"playerId":"4362628"}}}'
+    ]
+    
+    # Extract from every message first, then resolve all IDs in one batch
+    per_message = []
+    all_ids = {}
+    for msg in test_messages:
+        player_ids = resolver.extract_player_ids_from_message(msg)
+        per_message.append((msg, player_ids))
+        all_ids.update(dict.fromkeys(player_ids))
         
-        # Test fallback name generation
-        print("\n5. Testing fallback name generation:")
-        print("-" * 40)
-        unknown_id = "9999999"
-        fallback_name = resolver.get_fallback_name(unknown_id)
-        print(f"  Fallback for ID {unknown_id}: {fallback_name}")
+    players = await resolver.batch_resolve_ids(list(all_ids))
+    assert set(players) == set(all_ids)
+    
+    for i, (msg, player_ids) in enumerate(per_message, 1):
+        print(f"\nMessage {i}: {msg[:50]}...")
+        if player_ids:
+            print(f"  Extracted IDs: {player_ids}")
+            for pid in player_ids:
+                player = players.get(pid)
+                if player:
+                    print(f"  -> {player.full_name} ({player.position})")
+                else:
+                    print(f"  -> Player ID {pid} not resolved")
+        else:
+            print("  No player IDs found")
+
+
+@pytest.mark.asyncio(loop_scope="module")
+async def test_batch_reads_database_in_one_pass(resolver):
+    """Test that memory-cache misses are answered from one database read."""
+    cached_ids = ["8000001", "8000002"]
+    for pid in cached_ids:
+        resolver._save_to_database(ResolvedPlayer(
+            player_id=pid, full_name=f"Cached {pid}", last_updated=datetime.now().isoformat()
+        ))
+        resolver.memory_cache.pop(pid, None)
         
-        # Print statistics
-        stats = resolver.get_stats()
-        print("\n6. Performance Statistics:")
-        print("-" * 40)
-        print(f"  Total resolutions: {stats['total_resolutions']}")
-        print(f"  Cache hits: {stats['cache_hits']}")
-        print(f"  API calls: {stats['api_calls']}")
-        print(f"  Failed resolutions: {stats['failed_resolutions']}")
-        print(f"  Cache hit rate: {stats['cache_hit_rate']:.2%}")
-        print(f"  Success rate: {stats['success_rate']:.2%}")
-        print(f"  Memory cache size: {stats['memory_cache_size']}")
-        print(f"  Database cache size: {resolver.get_cached_player_count()}")
+    hits_before = resolver.stats["cache_hits"]
+    players = await resolver.batch_resolve_ids(cached_ids + cached_ids[:1])
+    
+    assert [players[pid].full_name for pid in cached_ids] == ["Cached 8000001", "Cached 8000002"]
+    assert resolver.stats["cache_hits"] - hits_before == 2
+    assert all(pid in resolver.memory_cache for pid in cached_ids)
+
+
+def test_only_api_404s_count_as_not_found(resolver):
+    """Test that was_not_found trusts the API's 404 set, not every failed lookup."""
+    resolver.api_client.not_found_ids.add("9000001")
+    try:
+        assert resolver.was_not_found("9000001")
+        assert not resolver.was_not_found("9000002")
+    finally:
+        resolver.api_client.not_found_ids.discard("9000001")
         
-        print("\n[SUCCESS] Player Resolver test completed!")
+    assert not PlayerResolver(cache_db_path=":memory:").was_not_found("9000001")
+
+
+def test_fuzzy_name_search(resolver):
+    """Test fuzzy name search against the cached players."""
+    print("\n4. Testing fuzzy name search:")
+    print("-" * 40)
+    test_names = ["Josh", "Harris", "Jefferson"]
+    
+    for name in test_names:
+        print(f"\nSearching for '{name}':")
+        search_results = resolver.fuzzy_match_name(name, limit=3)
+        assert len(search_results) <= 3
+        if search_results:
+            for player in search_results:
+                print(f"  - {player.full_name} ({player.position}, {player.nfl_team})")
+        else:
+            print(f"  No results found")
+
+
+def test_fallback_name_generation(resolver):
+    """Test fallback name generation."""
+    print("\n5. Testing fallback name generation:")
+    print("-" * 40)
+    unknown_id = "9999999"
+    fallback_name = resolver.get_fallback_name(unknown_id)
+    assert fallback_name
+    print(f"  Fallback for ID {unknown_id}: {fallback_name}")
+
+
+def test_statistics(resolver):
+    """Print resolver statistics accumulated by the tests above."""
+    stats = resolver.get_stats()
+    print("\n6. Performance Statistics:")
+    print("-" * 40)
+    print(f"  Total resolutions: {stats['total_resolutions']}")
+    print(f"  Cache hits: {stats['cache_hits']}")
+    print(f"  API calls: {stats['api_calls']}")
+    print(f"  Failed resolutions: {stats['failed_resolutions']}")
+    print(f"  Cache hit rate: {stats['cache_hit_rate']:.2%}")
+    print(f"  Success rate: {stats['success_rate']:.2%}")
+    print(f"  Memory cache size: {stats['memory_cache_size']}")
+    print(f"  Database cache size: {resolver.get_cached_player_count()}")
 
 
 if __name__ == "__main__":
     import logging
     logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
     
-    asyncio.run(test_player_resolver())
\ No newline at end of file
+    pytest.main([__file__, "-v", "-s"])
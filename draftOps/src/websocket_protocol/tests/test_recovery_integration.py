@@ -7,14 +7,66 @@ state preservation, and real-world recovery patterns.
 """
 
 import asyncio
+import copy
 import json
 import pytest
-from datetime import datetime, timedelta
+from collections import deque
+from time import monotonic, perf_counter
 from unittest.mock import Mock, AsyncMock, patch
 
+from ..monitor import espn_draft_monitor
 from ..monitor.espn_draft_monitor import ESPNDraftMonitor, ConnectionState
 from ..state.draft_state import DraftState
 
+# Every test here is a coroutine
+pytestmark = pytest.mark.asyncio
+
+# Frame payloads built once at import; PICK_FIXTURES[n] is pick number n
+PICK_FIXTURES: tuple[str, ...] = tuple(
+    f'{{"type":"PICK_MADE","pickNumber":{n},"player":"Player{n}"}}' for n in range(64)
+)
+HEARTBEAT_FIXTURE = "PING PING%201756607417674"
+
+
+# Pool and draft order set up once; tests deep-copy this prototype
+_DRAFT_STATE_PROTO = DraftState(league_id="123", team_id="1", team_count=10)
+_DRAFT_STATE_PROTO.initialize_player_pool(["player1", "player2", "player3", "player4"])
+_DRAFT_STATE_PROTO.set_draft_order([str(i) for i in range(1, 11)])
+
+
+def _noop(*args, **kwargs):
+    pass
+
+
+class _NullLogger:
+    """Logger stand-in that discards every call (no Mock call recording)."""
+    __slots__ = ()
+    
+    def __getattr__(self, name):
+        return _noop
+
+
+class FakeMonotonic:
+    """Monotonic clock that runs ahead of the real one by `offset` seconds."""
+    offset = 0.0
+    
+    @classmethod
+    def now(cls) -> float:
+        return monotonic() + cls.offset
+
+
+async def _await_disconnect_handling(monitor: ESPNDraftMonitor) -> None:
+    """Wait for the recovery task a WebSocket close scheduled, if there is one."""
+    task = monitor._pending_disconnect_task
+    if task:
+        await task
+
+
+async def _yield_to_tasks(rounds: int = 5) -> None:
+    """Let pending tasks run a few loop iterations without a wall-clock sleep."""
+    for _ in range(rounds):
+        await asyncio.sleep(0)
+
 
 class MockWebSocket:
     """Mock WebSocket for testing."""
@@ -23,12 +75,12 @@ class MockWebSocket:
         self.url = url
         self.is_closed = False
         self.message_handlers = {}
-        self.close_handlers = []
+        self._close_handler = None  # The monitor installs a single close handler
         
     def on(self, event: str, handler):
         """Register event handler."""
         if event == "close":
-            self.close_handlers.append(handler)
+            self._close_handler = handler
         else:
             self.message_handlers[event] = handler
     
@@ -37,33 +89,78 @@ class MockWebSocket:
         if "framereceived" in self.message_handlers:
             self.message_handlers["framereceived"](message)
     
+    def simulate_messages(self, messages):
+        """Simulate receiving a batch of messages in one dispatch loop."""
+        handler = self.message_handlers.get("framereceived")
+        if handler:
+            deque(map(handler, messages), maxlen=0)
+    
     def simulate_close(self):
         """Simulate WebSocket close."""
         self.is_closed = True
-        for handler in self.close_handlers:
-            handler()
+        if self._close_handler:
+            self._close_handler()
+
+
+def _reset_monitor(monitor: ESPNDraftMonitor) -> ESPNDraftMonitor:
+    """Return a shared monitor to its freshly-constructed state with new page mocks."""
+    monitor.websockets = []
+    monitor.message_log = deque()
+    monitor._log_eviction_warned = False
+    monitor.pre_disconnect_state = {}
+    monitor.last_known_pick = 0
+    monitor.last_heartbeat_monotonic = None
+    monitor.heartbeat_monitor_task = None
+    monitor._pending_disconnect_task = None
+    monitor.connection_state = ConnectionState.DISCONNECTED
+    monitor.last_draft_url = None
+    monitor.reconnect_attempts = 0
+    monitor.max_reconnect_attempts = 5
+    monitor.reconnect_delays = [1, 2, 4, 8, 16]
+    monitor.reconnect_jitter = 0.5
+    monitor.heartbeat_timeout_seconds = 30
+    monitor.heartbeat_check_interval_seconds = 5
+    
+    # Drop per-test method overrides (e.g. a mocked handle_disconnection)
+    monitor.__dict__.pop('handle_disconnection', None)
+    monitor.__dict__.pop('resynchronize_state', None)
+    
+    # Mock browser setup
+    monitor.page = AsyncMock()
+    monitor.page.goto = AsyncMock()
+    monitor.page.wait_for_load_state = AsyncMock()
+    monitor.page.title = AsyncMock(return_value="ESPN Draft Room")
+    monitor.page.reload = AsyncMock()
+    monitor.wait_for_websockets = AsyncMock(return_value=True)
+    return monitor
+
+
+def _mark_connected(monitor: ESPNDraftMonitor, draft_url: str) -> None:
+    """Put the monitor in the state connect_to_draft leaves it in, without the heartbeat task."""
+    monitor.connection_state = ConnectionState.CONNECTED
+    monitor.last_draft_url = draft_url
+
+
+@pytest.fixture(scope="module")
+def shared_monitor():
+    """Build the recovery-enabled monitor once; monitor_with_state resets it per test."""
+    monitor = ESPNDraftMonitor(headless=True, enable_recovery=True)
+    monitor.logger = _NullLogger()  # Suppress log output during tests
+    return monitor
 
 
 class TestRecoveryIntegration:
     """Integration tests for WebSocket recovery."""
     
     @pytest.fixture
-    async def monitor_with_state(self):
-        """Create monitor with mock state tracking."""
-        monitor = ESPNDraftMonitor(headless=True, enable_recovery=True)
-        monitor.logger = Mock()  # Suppress log output during tests
-        
-        # Mock browser setup
-        monitor.page = AsyncMock()
-        monitor.page.goto = AsyncMock()
-        monitor.page.wait_for_load_state = AsyncMock()
-        monitor.page.title = AsyncMock(return_value="ESPN Draft Room")
-        monitor.page.reload = AsyncMock()
-        monitor.wait_for_websockets = AsyncMock(return_value=True)
+    async def monitor_with_state(self, shared_monitor):
+        """Reset the shared monitor and wire fresh page mocks for one test."""
+        monitor = _reset_monitor(shared_monitor)
         
         yield monitor
         
-        # Cleanup
+        # Cleanup; each test runs in its own event loop, so the task is
+        # cancelled here rather than when the monitor is next reset
         if monitor.heartbeat_monitor_task and not monitor.heartbeat_monitor_task.done():
             monitor.heartbeat_monitor_task.cancel()
             try:
@@ -71,7 +168,6 @@ class TestRecoveryIntegration:
             except asyncio.CancelledError:
                 pass
     
-    @pytest.mark.asyncio
     async def test_end_to_end_recovery_with_pick_sync(self, monitor_with_state):
         """Test complete recovery flow including pick synchronization."""
         monitor = monitor_with_state
@@ -83,27 +179,25 @@ class TestRecoveryIntegration:
         
         # Step 2: Simulate receiving some draft messages
         mock_ws = MockWebSocket("wss://draft.fantasy.espn.com/123")
-        monitor.websockets = [mock_ws]
+        monitor._on_websocket(mock_ws)
         
         # Simulate initial pick messages
-        mock_ws.simulate_message('{"type":"PICK_MADE","pickNumber":1,"player":"Josh Allen"}')
-        mock_ws.simulate_message('{"type":"PICK_MADE","pickNumber":2,"player":"CMC"}')
-        mock_ws.simulate_message('PING PING%201756607417674')
+        mock_ws.simulate_messages(PICK_FIXTURES[1:3] + (HEARTBEAT_FIXTURE,))
         
         assert monitor.last_known_pick == 2
-        assert monitor.last_heartbeat_time is not None
+        assert monitor.last_heartbeat_monotonic is not None
         
         # Step 3: Simulate disconnection
         original_state = {
             'last_pick': monitor.last_known_pick,
-            'heartbeat_time': monitor.last_heartbeat_time
+            'heartbeat_time': monitor.last_heartbeat_monotonic
         }
         
         # Simulate WebSocket close
         mock_ws.simulate_close()
         
         # Wait for disconnection handling to complete
-        await asyncio.sleep(0.1)
+        await _await_disconnect_handling(monitor)
         
         # Should have triggered recovery
         assert monitor.connection_state == ConnectionState.CONNECTED  # Successfully reconnected
@@ -113,59 +207,58 @@ class TestRecoveryIntegration:
         
         # Step 5: Simulate messages that occurred during disconnect
         new_mock_ws = MockWebSocket("wss://draft.fantasy.espn.com/123")
-        monitor.websockets = [new_mock_ws]
+        monitor._on_websocket(new_mock_ws)
         
         # Simulate pick that happened during disconnect
-        new_mock_ws.simulate_message('{"type":"PICK_MADE","pickNumber":5,"player":"Tyreek Hill"}')
+        new_mock_ws.simulate_message(PICK_FIXTURES[5])
         
         # Should detect missed picks
         assert monitor.last_known_pick == 5
     
-    @pytest.mark.asyncio
     async def test_recovery_during_rapid_picks(self, monitor_with_state):
         """Test recovery when disconnection occurs during rapid pick sequence."""
         monitor = monitor_with_state
         
-        await monitor.connect_to_draft("https://fantasy.espn.com/draft/456")
+        _mark_connected(monitor, "https://fantasy.espn.com/draft/456")
         
         # Simulate rapid picks before disconnect
         mock_ws = MockWebSocket("wss://draft.fantasy.espn.com/456")
-        monitor.websockets = [mock_ws]
+        monitor._on_websocket(mock_ws)
         
-        for pick_num in range(1, 6):  # Picks 1-5
-            mock_ws.simulate_message(f'{{"type":"PICK_MADE","pickNumber":{pick_num},"player":"Player{pick_num}"}}')
+        mock_ws.simulate_messages(PICK_FIXTURES[1:6])  # Picks 1-5
         
         assert monitor.last_known_pick == 5
         
         # Simulate disconnect during pick 6
         mock_ws.simulate_close()
-        await asyncio.sleep(0.1)
+        await _await_disconnect_handling(monitor)
         
         # After reconnect, simulate catching up on missed picks
         new_mock_ws = MockWebSocket("wss://draft.fantasy.espn.com/456")
-        monitor.websockets = [new_mock_ws]
+        monitor._on_websocket(new_mock_ws)
         
         # Multiple picks happened during disconnect
-        for pick_num in range(8, 11):  # Picks 8-10
-            new_mock_ws.simulate_message(f'{{"type":"PICK_MADE","pickNumber":{pick_num},"player":"Player{pick_num}"}}')
+        new_mock_ws.simulate_messages(PICK_FIXTURES[8:11])  # Picks 8-10
         
         # Should detect 5 missed picks (6, 7, 8, 9, 10)
         assert monitor.last_known_pick == 10
     
-    @pytest.mark.asyncio
-    async def test_heartbeat_timeout_recovery(self, monitor_with_state):
+    async def test_heartbeat_timeout_recovery(self, monitor_with_state, monkeypatch):
         """Test recovery triggered by heartbeat timeout."""
         monitor = monitor_with_state
         monitor.heartbeat_timeout_seconds = 1  # Very short timeout for testing
+        monitor.heartbeat_check_interval_seconds = 0
+        monkeypatch.setattr(espn_draft_monitor, "monotonic", FakeMonotonic.now)
+        monkeypatch.setattr(FakeMonotonic, "offset", 0.0)
         
-        await monitor.connect_to_draft("https://fantasy.espn.com/draft/789")
+        _mark_connected(monitor, "https://fantasy.espn.com/draft/789")
         
         # Establish initial heartbeat
         mock_ws = MockWebSocket("wss://draft.fantasy.espn.com/789")
-        monitor.websockets = [mock_ws]
-        mock_ws.simulate_message("PING PING%201756607417674")
+        monitor._on_websocket(mock_ws)
+        mock_ws.simulate_message(HEARTBEAT_FIXTURE)
         
-        initial_heartbeat = monitor.last_heartbeat_time
+        initial_heartbeat = monitor.last_heartbeat_monotonic
         assert initial_heartbeat is not None
         
         # Mock handle_disconnection to track if it's called
@@ -175,8 +268,9 @@ class TestRecoveryIntegration:
         # Start heartbeat monitoring and let timeout occur
         monitor.heartbeat_monitor_task = asyncio.create_task(monitor._monitor_heartbeat())
         
-        # Wait longer than timeout
-        await asyncio.sleep(2)
+        # Advance virtual time past the timeout and let the monitor observe it
+        FakeMonotonic.offset = 2.0
+        await _yield_to_tasks()
         
         # Should have detected timeout and triggered recovery
         monitor.handle_disconnection.assert_called_with("Heartbeat timeout")
@@ -189,12 +283,12 @@ class TestRecoveryIntegration:
         except asyncio.CancelledError:
             pass
     
-    @pytest.mark.asyncio
     async def test_multiple_reconnection_attempts(self, monitor_with_state):
         """Test multiple reconnection attempts with backoff."""
         monitor = monitor_with_state
         monitor.max_reconnect_attempts = 3
         monitor.reconnect_delays = [0.1, 0.2, 0.3]  # Short delays for testing
+        monitor.reconnect_jitter = 0  # Exact delays for the elapsed-time check
         
         # Mock page reload to fail initially, then succeed
         reload_attempts = []
@@ -205,39 +299,37 @@ class TestRecoveryIntegration:
                 raise Exception(f"Mock network error on attempt {len(reload_attempts)}")
         
         monitor.page.reload = mock_reload
+        # The full-reconnect fallback fails too, so each failure costs an attempt
+        monitor.page.goto = AsyncMock(side_effect=Exception("Mock network error"))
         
         # Start with connected state
         monitor.connection_state = ConnectionState.CONNECTED
         monitor.last_draft_url = "https://fantasy.espn.com/draft/reconnect"
         
         # Trigger disconnection
-        start_time = datetime.now()
+        start_time = perf_counter()
         success = await monitor.reconnect_with_backoff()
-        end_time = datetime.now()
+        elapsed = perf_counter() - start_time
         
         # Should have succeeded on 3rd attempt
         assert success is True
         assert len(reload_attempts) == 3
         
         # Should have taken at least 0.1 + 0.2 seconds (backoff delays)
-        elapsed = (end_time - start_time).total_seconds()
         assert elapsed >= 0.3
     
-    @pytest.mark.asyncio
     async def test_recovery_with_draft_state_integration(self, monitor_with_state):
         """Test recovery integration with DraftState object."""
         monitor = monitor_with_state
         
         # Create a draft state instance
-        draft_state = DraftState(league_id="123", team_id="1", team_count=10)
-        draft_state.initialize_player_pool(["player1", "player2", "player3", "player4"])
-        draft_state.set_draft_order(["1", "2", "3", "4", "5", "6", "7", "8", "9", "10"])
+        draft_state = copy.deepcopy(_DRAFT_STATE_PROTO)
         
         # Connect and start receiving messages
-        await monitor.connect_to_draft("https://fantasy.espn.com/draft/with-state")
+        _mark_connected(monitor, "https://fantasy.espn.com/draft/with-state")
         
         mock_ws = MockWebSocket("wss://draft.fantasy.espn.com/with-state")
-        monitor.websockets = [mock_ws]
+        monitor._on_websocket(mock_ws)
         
         # Simulate draft progression
         draft_state.apply_pick("player1", "2", 1)
@@ -255,11 +347,11 @@ class TestRecoveryIntegration:
         
         # Simulate disconnect
         mock_ws.simulate_close()
-        await asyncio.sleep(0.1)
+        await _await_disconnect_handling(monitor)
         
         # After reconnect, simulate additional picks that happened during disconnect
         new_mock_ws = MockWebSocket("wss://draft.fantasy.espn.com/with-state")
-        monitor.websockets = [new_mock_ws]
+        monitor._on_websocket(new_mock_ws)
         
         # Draft state would need to be updated with missed picks here
         # This simulates what would happen with API integration
@@ -270,38 +362,33 @@ class TestRecoveryIntegration:
         assert monitor.last_known_pick == 3
         assert len(draft_state.drafted_players) == 3
     
-    @pytest.mark.asyncio
     async def test_recovery_state_validation(self, monitor_with_state):
         """Test that recovery properly validates and logs state changes."""
         monitor = monitor_with_state
         
-        await monitor.connect_to_draft("https://fantasy.espn.com/draft/validation")
+        _mark_connected(monitor, "https://fantasy.espn.com/draft/validation")
         
         # Set up initial state
         mock_ws = MockWebSocket("wss://draft.fantasy.espn.com/validation")
-        monitor.websockets = [mock_ws]
+        monitor._on_websocket(mock_ws)
         monitor.last_known_pick = 3
-        monitor.message_log = [{"msg": f"message_{i}"} for i in range(50)]
+        monitor.message_log = deque({"msg": f"message_{i}"} for i in range(50))
+        # Keep the captured state; a real resync clears it after reconnecting
+        monitor.resynchronize_state = AsyncMock()
         
         # Simulate disconnection
         await monitor.handle_disconnection("Network timeout")
         
         # Verify pre-disconnect state was captured
-        expected_state = {
-            'last_pick': 3,
-            'message_count': 50,
-            'timestamp': monitor.pre_disconnect_state['timestamp']  # Dynamic timestamp
-        }
-        
+        monitor.resynchronize_state.assert_awaited_once()
         assert monitor.pre_disconnect_state['last_pick'] == 3
         assert monitor.pre_disconnect_state['message_count'] == 50
         assert 'timestamp' in monitor.pre_disconnect_state
     
-    @pytest.mark.asyncio
     async def test_disabled_recovery_mode(self):
         """Test monitor behavior when recovery is disabled."""
         monitor = ESPNDraftMonitor(headless=True, enable_recovery=False)
-        monitor.logger = Mock()
+        monitor.logger = _NullLogger()
         
         # Mock browser setup
         monitor.page = AsyncMock()
@@ -316,13 +403,13 @@ class TestRecoveryIntegration:
         
         # Simulate WebSocket close
         mock_ws = MockWebSocket("wss://draft.fantasy.espn.com/no-recovery")
-        monitor.websockets = [mock_ws]
+        monitor._on_websocket(mock_ws)
         
         # Mock handle_disconnection to verify it's not called
         monitor.handle_disconnection = AsyncMock()
         
         mock_ws.simulate_close()
-        await asyncio.sleep(0.1)
+        await _await_disconnect_handling(monitor)
         
         # Should not trigger recovery
         monitor.handle_disconnection.assert_not_called()
@@ -331,11 +418,10 @@ class TestRecoveryIntegration:
 class TestRecoveryPerformance:
     """Performance tests for recovery functionality."""
     
-    @pytest.mark.asyncio
     async def test_recovery_speed(self):
         """Test that recovery completes within acceptable time limits."""
         monitor = ESPNDraftMonitor(headless=True, enable_recovery=True)
-        monitor.logger = Mock()
+        monitor.logger = _NullLogger()
         
         # Mock fast reconnection
         monitor.page = AsyncMock()
@@ -346,11 +432,9 @@ class TestRecoveryPerformance:
         monitor.connection_state = ConnectionState.CONNECTED
         
         # Measure recovery time
-        start_time = datetime.now()
+        start_time = perf_counter()
         await monitor.handle_disconnection("Speed test")
-        end_time = datetime.now()
-        
-        recovery_time = (end_time - start_time).total_seconds()
+        recovery_time = perf_counter() - start_time
         
         # Should recover in under 2 seconds for immediate reconnect
         assert recovery_time < 2.0
@@ -363,19 +447,17 @@ class TestRecoveryPerformance:
             except asyncio.CancelledError:
                 pass
     
-    @pytest.mark.asyncio
     async def test_heartbeat_monitoring_overhead(self):
         """Test that heartbeat monitoring has minimal performance impact."""
         monitor = ESPNDraftMonitor(headless=True, enable_recovery=True)
-        monitor.logger = Mock()
+        monitor.logger = _NullLogger()
         monitor.connection_state = ConnectionState.CONNECTED
-        monitor.last_heartbeat_time = datetime.now()
+        monitor.last_heartbeat_monotonic = monotonic()
         
         # Start heartbeat monitoring
         monitor.heartbeat_monitor_task = asyncio.create_task(monitor._monitor_heartbeat())
         
         # Let it run for a short time
-        start_time = datetime.now()
         await asyncio.sleep(1)
         
         # Should still be running efficiently
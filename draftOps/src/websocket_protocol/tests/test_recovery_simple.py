@@ -4,12 +4,17 @@ Simple validation tests for WebSocket recovery functionality.
 
 These tests validate the basic recovery components work as expected
 without complex async fixtures.
+
+Each test builds its own monitor and shares no module state, so the file
+can be spread across workers with pytest-xdist:
+
+    pytest -n auto draftOps/src/websocket_protocol/tests/test_recovery_simple.py
 """
 
-import asyncio
 import pytest
 from unittest.mock import Mock, AsyncMock
 from datetime import datetime, timedelta
+from time import monotonic
 
 # Adjust import to work with the current project structure
 import sys
@@ -18,6 +23,18 @@ import os
 from ..monitor.espn_draft_monitor import ESPNDraftMonitor, ConnectionState
 
 
+def _noop(*args, **kwargs):
+    pass
+
+
+class _NullLogger:
+    """Logger stand-in that discards every call (no Mock call recording)."""
+    __slots__ = ()
+    
+    def __getattr__(self, name):
+        return _noop
+
+
 @pytest.mark.asyncio
 async def test_connection_state_initialization():
     """Test that monitor initializes with correct state."""
@@ -34,7 +51,7 @@ async def test_connection_state_initialization():
 async def test_heartbeat_update():
     """Test that heartbeat time updates correctly."""
     monitor = ESPNDraftMonitor(headless=True, enable_recovery=True)
-    monitor.logger = Mock()
+    monitor.logger = _NullLogger()
     monitor.on_message_received = Mock()
     
     # Mock WebSocket
@@ -42,18 +59,18 @@ async def test_heartbeat_update():
     websocket.url = "wss://test.espn.com"
     
     # Test heartbeat update
-    before_time = datetime.now()
+    before_time = monotonic()
     monitor._on_frame_received(websocket, "PING PING%201756607417674")
     
-    assert monitor.last_heartbeat_time is not None
-    assert monitor.last_heartbeat_time >= before_time
+    assert monitor.last_heartbeat_monotonic is not None
+    assert monitor.last_heartbeat_monotonic >= before_time
 
 
 @pytest.mark.asyncio
 async def test_pick_number_tracking():
     """Test that pick numbers are tracked correctly."""
     monitor = ESPNDraftMonitor(headless=True, enable_recovery=True)
-    monitor.logger = Mock()
+    monitor.logger = _NullLogger()
     monitor.on_message_received = Mock()
     
     websocket = Mock()
@@ -63,6 +80,11 @@ async def test_pick_number_tracking():
     monitor._on_frame_received(websocket, '{"type":"PICK_MADE","pickNumber":5,"player":"Test"}')
     
     assert monitor.last_known_pick == 5
+    
+    # Whitespace around the colon is still matched without decoding the JSON
+    monitor._on_frame_received(websocket, '{"type": "PICK_MADE", "pickNumber" : 6}')
+    
+    assert monitor.last_known_pick == 6
 
 
 @pytest.mark.asyncio
@@ -72,13 +94,13 @@ async def test_connection_health_validation():
     monitor.connection_state = ConnectionState.CONNECTED
     
     # Test with recent heartbeat
-    monitor.last_heartbeat_time = datetime.now() - timedelta(seconds=10)
+    monitor.last_heartbeat_monotonic = monotonic() - 10
     monitor.heartbeat_timeout_seconds = 30
     is_healthy = await monitor.validate_connection_health()
     assert is_healthy is True
     
     # Test with old heartbeat
-    monitor.last_heartbeat_time = datetime.now() - timedelta(seconds=40)
+    monitor.last_heartbeat_monotonic = monotonic() - 40
     is_healthy = await monitor.validate_connection_health()
     assert is_healthy is False
 
@@ -87,7 +109,7 @@ async def test_connection_health_validation():
 async def test_disconnection_state_storage():
     """Test that disconnection properly stores state."""
     monitor = ESPNDraftMonitor(headless=True, enable_recovery=True)
-    monitor.logger = Mock()
+    monitor.logger = _NullLogger()
     monitor.reconnect_with_backoff = AsyncMock(return_value=True)
     monitor.resynchronize_state = AsyncMock()
     
@@ -108,7 +130,7 @@ async def test_disconnection_state_storage():
 async def test_reconnect_without_url():
     """Test reconnection fails gracefully without stored URL."""
     monitor = ESPNDraftMonitor(headless=True, enable_recovery=True)
-    monitor.logger = Mock()
+    monitor.logger = _NullLogger()
     monitor.last_draft_url = None
     
     success = await monitor.reconnect_with_backoff()
@@ -119,7 +141,7 @@ async def test_reconnect_without_url():
 async def test_state_resync_no_missed_picks():
     """Test state resynchronization with no missed picks."""
     monitor = ESPNDraftMonitor(headless=True, enable_recovery=True)
-    monitor.logger = Mock()
+    monitor.logger = _NullLogger()
     
     # Set up pre-disconnect state
     monitor.pre_disconnect_state = {
@@ -139,7 +161,7 @@ async def test_state_resync_no_missed_picks():
 async def test_state_resync_with_missed_picks():
     """Test state resynchronization detects missed picks."""
     monitor = ESPNDraftMonitor(headless=True, enable_recovery=True)
-    monitor.logger = Mock()
+    monitor.logger = _NullLogger()
     
     # Set up scenario with missed picks
     monitor.pre_disconnect_state = {
@@ -159,7 +181,7 @@ async def test_state_resync_with_missed_picks():
 async def test_websocket_close_triggers_recovery():
     """Test that WebSocket close triggers recovery when enabled."""
     monitor = ESPNDraftMonitor(headless=True, enable_recovery=True)
-    monitor.logger = Mock()
+    monitor.logger = _NullLogger()
     monitor.connection_state = ConnectionState.CONNECTED
     monitor.on_websocket_closed = Mock()
     
@@ -171,14 +193,13 @@ async def test_websocket_close_triggers_recovery():
     websocket.url = "wss://test.espn.com"
     monitor.websockets = [websocket]
     
-    # Simulate close
+    # Simulate close and wait for the recovery task it schedules
     monitor._on_websocket_close(websocket)
-    
-    # Give async task a moment to start
-    await asyncio.sleep(0.01)
+    await monitor._pending_disconnect_task
     
     # Should have removed WebSocket and triggered recovery
     assert websocket not in monitor.websockets
+    monitor.handle_disconnection.assert_awaited_once_with("WebSocket closed")
 
 
 def test_recovery_disabled():
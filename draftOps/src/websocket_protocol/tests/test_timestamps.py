@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+"""
+Tests for the per-second memoized ISO timestamp helper.
+"""
+
+from datetime import datetime
+
+from ..utils import timestamps
+from ..utils.timestamps import iso_now
+
+
+def test_matches_datetime_isoformat(monkeypatch):
+    now = datetime(2025, 8, 31, 12, 0, 5, 250000).timestamp()
+    monkeypatch.setattr(timestamps, "time", lambda: now)
+
+    assert iso_now() == datetime.fromtimestamp(now).isoformat()
+
+
+def test_whole_second_has_no_fraction(monkeypatch):
+    now = datetime(2025, 8, 31, 12, 0, 6).timestamp()
+    monkeypatch.setattr(timestamps, "time", lambda: now)
+
+    assert iso_now() == "2025-08-31T12:00:06"
+
+
+def test_prefix_formatted_once_per_second(monkeypatch):
+    base = datetime(2025, 8, 31, 12, 0, 7).timestamp()
+    clock = iter([base + 0.1, base + 0.5, base + 1.25])
+    monkeypatch.setattr(timestamps, "time", lambda: next(clock))
+    formatted = []
+    original = timestamps.datetime
+
+    class CountingDatetime:
+        @staticmethod
+        def fromtimestamp(second):
+            formatted.append(second)
+            return original.fromtimestamp(second)
+
+    monkeypatch.setattr(timestamps, "datetime", CountingDatetime)
+
+    stamps = [iso_now(), iso_now(), iso_now()]
+
+    assert formatted == [int(base), int(base) + 1]
+    assert stamps == sorted(stamps)
+    assert datetime.fromisoformat(stamps[2]) == datetime(2025, 8, 31, 12, 0, 8, 250000)
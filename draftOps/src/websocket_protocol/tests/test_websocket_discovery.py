@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""
+Tests for WebSocketDiscovery message categorization and summaries.
+"""
+
+import json
+
+from ..utils.websocket_discovery import WebSocketDiscovery
+
+
+class TestCategorizeMessage:
+    """categorize_message on JSON and non-JSON frames."""
+    
+    def test_json_object_with_type_and_keywords(self):
+        analysis = WebSocketDiscovery().categorize_message(
+            '{"type":"PICK_MADE","playerId":4241457,"teamId":1}'
+        )
+        
+        assert analysis["is_json"] is True
+        assert analysis["message_type"] == "PICK_MADE"
+        assert analysis["contains_draft_keywords"] is True
+        assert analysis["draft_keywords_found"] == ["pick", "player", "team"]
+        
+    def test_keywords_matched_case_insensitively_on_raw_payload(self):
+        discovery = WebSocketDiscovery()
+        
+        analysis = discovery.categorize_message('{"type": "ON_THE_CLOCK", "Roster": {"slots": 16}}')
+        assert analysis["draft_keywords_found"] == ["clock", "roster"]
+        
+        analysis = discovery.categorize_message('{"type":"HEARTBEAT","seq":7}')
+        assert analysis["contains_draft_keywords"] is False
+        assert "draft_keywords_found" not in analysis
+        
+    def test_json_array_is_parsed(self):
+        analysis = WebSocketDiscovery().categorize_message('  [{"event":"draft"}]')
+        
+        assert analysis["is_json"] is True
+        assert analysis["parsed_json"] == [{"event": "draft"}]
+        assert analysis["message_type"] == "unknown"
+        
+    def test_non_json_protocols(self):
+        discovery = WebSocketDiscovery()
+        
+        assert discovery.categorize_message('42["pick",{"id":1}]')["likely_protocol"] == "socket.io"
+        assert discovery.categorize_message('{"truncated":')["likely_protocol"] == "json"
+        assert discovery.categorize_message("ping 123")["likely_protocol"] == "websocket_ping_pong"
+        
+        analysis = discovery.categorize_message("SELECTED 2 4362628 4")
+        assert analysis["is_json"] is False
+        assert "likely_protocol" not in analysis
+
+
+class TestDiscoverySummary:
+    """Summaries over recorded connections and messages."""
+    
+    def test_summary_and_draft_websockets(self):
+        discovery = WebSocketDiscovery()
+        draft_url = "wss://fantasy.espn.com/draft/123"
+        other_url = "wss://example.com/feed"
+        discovery.record_connection(draft_url)
+        discovery.record_connection(other_url)
+        discovery.record_message_pattern(draft_url, '{"type":"PICK_MADE","pick":1}')
+        discovery.record_message_pattern(draft_url, "ping")
+        discovery.record_message_pattern(other_url, '{"type":"QUOTE","price":1}')
+        
+        summary = discovery.get_discovery_summary()
+        
+        assert summary["total_endpoints"] == 2
+        draft_summary = summary["message_summary"][draft_url]
+        assert draft_summary["total_messages"] == 2
+        assert draft_summary["json_messages"] == 1
+        assert draft_summary["draft_related_messages"] == 1
+        assert draft_summary["unique_message_types"] == ["PICK_MADE"]
+        assert draft_summary["protocols_detected"] == ["websocket_ping_pong"]
+        assert discovery.identify_draft_websockets() == [draft_url]
+        
+    def test_url_keywords_and_espn_purpose(self):
+        discovery = WebSocketDiscovery()
+        for url in ("wss://FANTASY.ESPN.com/DRAFT/1", "wss://espn.com/fantasy/feed",
+                    "wss://cdn.example.com/LiveUpdates", "wss://example.com/feed"):
+            discovery.record_connection(url)
+            
+        assert sorted(discovery.identify_draft_websockets()) == [
+            "wss://FANTASY.ESPN.com/DRAFT/1", "wss://cdn.example.com/LiveUpdates"
+        ]
+        purposes = {m["full_url"]: m.get("purpose") for m in discovery.connection_metadata}
+        assert purposes["wss://FANTASY.ESPN.com/DRAFT/1"] == "draft"
+        assert purposes["wss://espn.com/fantasy/feed"] == "fantasy"
+        assert purposes["wss://example.com/feed"] is None
+        
+    def test_draft_ratio_uses_running_counts(self):
+        discovery = WebSocketDiscovery()
+        url = "wss://example.com/feed"
+        discovery.record_connection(url)
+        for n in range(10):
+            discovery.record_message_pattern(url, f'{{"type":"QUOTE","seq":{n}}}')
+        assert discovery.identify_draft_websockets() == []
+        
+        discovery.record_message_pattern(url, '{"type":"QUOTE","roster":[]}')
+        discovery.record_message_pattern(url, '{"type":"QUOTE","roster":[]}')
+        
+        assert discovery.get_discovery_summary()["message_summary"][url]["total_messages"] == 12
+        assert discovery.identify_draft_websockets() == [url]
+        
+    def test_message_history_is_bounded(self):
+        discovery = WebSocketDiscovery(max_messages_per_endpoint=3, max_connections=2)
+        url = "wss://fantasy.espn.com/draft/123"
+        for n in range(3):
+            discovery.record_connection(f"wss://example.com/{n}")
+        discovery.record_message_pattern(url, '{"type":"PICK_MADE","pick":1,"playerId":4241457}')
+        for n in range(4):
+            discovery.record_message_pattern(url, f'{{"type":"CLOCK","seconds":{n}}}')
+            
+        assert [m["parsed_json"]["seconds"] for m in discovery.message_patterns[url]] == [1, 2, 3]
+        assert [m["full_url"] for m in discovery.connection_metadata] == [
+            "wss://example.com/1", "wss://example.com/2"
+        ]
+        summary = discovery.get_discovery_summary()
+        assert summary["message_summary"][url]["total_messages"] == 5
+        assert len(summary["connection_metadata"]) == 2
+        
+        schemas = discovery.extract_message_schemas()
+        assert schemas["PICK_MADE"]["sample_count"] == 1
+        assert sorted(schemas["PICK_MADE"]["common_fields"]) == ["pick", "playerId", "type"]
+        assert schemas["CLOCK"]["sample_count"] == 4
+        assert [e["seconds"] for e in schemas["CLOCK"]["examples"]] == [0, 1, 2]
+        
+    def test_save_discovery_report(self, tmp_path):
+        discovery = WebSocketDiscovery()
+        url = "wss://fantasy.espn.com/draft/123"
+        discovery.record_connection(url)
+        discovery.record_message_pattern(url, '{"type":"PICK_MADE","pick":1}')
+        output = tmp_path / "report.json"
+        
+        discovery.save_discovery_report(str(output))
+        
+        report = json.loads(output.read_text())
+        assert report["draft_websockets"] == [url]
+        assert report["message_schemas"]["PICK_MADE"]["sample_count"] == 1
+        assert report["raw_message_patterns"][url][0]["parsed_json"] == {"type": "PICK_MADE", "pick": 1}
+        
+    def test_save_discovery_report_writes_utf8(self, tmp_path):
+        discovery = WebSocketDiscovery()
+        url = "wss://fantasy.espn.com/draft/123"
+        discovery.record_message_pattern(url, '{"type":"PICK_MADE","name":"Łukasz"}')
+        output = tmp_path / "report.json"
+        
+        discovery.save_discovery_report(str(output))
+        
+        report = json.loads(output.read_text(encoding="utf-8"))
+        assert report["raw_message_patterns"][url][0]["parsed_json"]["name"] == "Łukasz"
+        assert list(tmp_path.iterdir()) == [output]
+        
+    def test_save_empty_discovery_report(self, tmp_path):
+        output = tmp_path / "empty.json"
+        
+        WebSocketDiscovery().save_discovery_report(str(output))
+        
+        report = json.loads(output.read_text())
+        assert report["raw_message_patterns"] == {}
+        assert report["draft_websockets"] == []
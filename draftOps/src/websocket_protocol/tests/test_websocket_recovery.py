@@ -7,23 +7,41 @@ and resynchronize_state methods of ESPNDraftMonitor.
 """
 
 import asyncio
+import json
+import threading
 import pytest
 from unittest.mock import Mock, AsyncMock, patch, MagicMock
 from datetime import datetime, timedelta
+from time import monotonic
 
 from ..monitor.espn_draft_monitor import ESPNDraftMonitor, ConnectionState
 
 
+@pytest.fixture
+def monitor():
+    """Create a test monitor instance."""
+    monitor = ESPNDraftMonitor(headless=True, enable_recovery=True)
+    monitor.logger = Mock()  # Mock logger to avoid output during tests
+    return monitor
+
+
+@pytest.fixture
+def mock_page(monitor):
+    """
+    Give the monitor a page whose async methods all succeed.
+    
+    Child attributes of an AsyncMock are AsyncMocks, so reload() and
+    wait_for_load_state() need no setup; tests override only what differs.
+    wait_for_websockets reports a connection straight away.
+    """
+    monitor.page = AsyncMock()
+    monitor.wait_for_websockets = AsyncMock(return_value=True)
+    return monitor.page
+
+
 class TestWebSocketRecovery:
     """Test suite for WebSocket recovery features."""
     
-    @pytest.fixture
-    def monitor(self):
-        """Create a test monitor instance."""
-        monitor = ESPNDraftMonitor(headless=True, enable_recovery=True)
-        monitor.logger = Mock()  # Mock logger to avoid output during tests
-        return monitor
-    
     @pytest.mark.asyncio
     async def test_handle_disconnection_stores_state(self, monitor):
         """Test that handle_disconnection properly stores pre-disconnect state."""
@@ -52,17 +70,13 @@ class TestWebSocketRecovery:
         monitor.reconnect_with_backoff.assert_not_called()
     
     @pytest.mark.asyncio
-    async def test_reconnect_with_backoff_immediate_success(self, monitor):
+    async def test_reconnect_with_backoff_immediate_success(self, monitor, mock_page):
         """Test immediate reconnection success (no delay on first attempt)."""
         monitor.last_draft_url = "https://fantasy.espn.com/draft/test"
-        monitor.page = AsyncMock()
-        monitor.page.reload = AsyncMock()
-        monitor.page.wait_for_load_state = AsyncMock()
-        monitor.wait_for_websockets = AsyncMock(return_value=True)
         
-        start_time = datetime.now()
+        start_time = monotonic()
         success = await monitor.reconnect_with_backoff()
-        elapsed = (datetime.now() - start_time).total_seconds()
+        elapsed = monotonic() - start_time
         
         assert success is True
         assert elapsed < 1  # Should be immediate (no delay on first attempt)
@@ -70,41 +84,54 @@ class TestWebSocketRecovery:
         assert monitor.reconnect_attempts == 0
     
     @pytest.mark.asyncio
-    async def test_reconnect_with_backoff_exponential_delays(self, monitor):
+    async def test_reconnect_with_backoff_exponential_delays(self, monitor, mock_page):
         """Test exponential backoff delays on reconnection failures."""
         monitor.last_draft_url = "https://fantasy.espn.com/draft/test"
         monitor.max_reconnect_attempts = 3
         monitor.reconnect_delays = [1, 2, 4]
         
         # Mock page refresh to fail
-        monitor.page = AsyncMock()
-        monitor.page.reload = AsyncMock(side_effect=Exception("Network error"))
+        mock_page.reload.side_effect = Exception("Network error")
         monitor.connect_to_draft = AsyncMock(return_value=False)
         
-        # Track sleep calls
+        # Record sleep calls without waiting; only the delay sequence matters
         sleep_delays = []
-        original_sleep = asyncio.sleep
         
         async def mock_sleep(delay):
             sleep_delays.append(delay)
-            if delay > 0.1:  # Only track backoff delays, not small internal delays
-                return await original_sleep(0.01)  # Speed up test
-            return await original_sleep(delay)
         
         with patch('asyncio.sleep', mock_sleep):
             success = await monitor.reconnect_with_backoff()
         
         assert success is False
-        # First attempt has no delay, then 1s, 2s
+        # First attempt has no delay, then 1s, 2s, each jittered by +/- 50%
         expected_delays = [1, 2]
-        actual_backoff_delays = [d for d in sleep_delays if d >= 1]
-        assert actual_backoff_delays == expected_delays
+        jitter = monitor.reconnect_jitter
+        actual_backoff_delays = [d for d in sleep_delays if d > 0.1]
+        assert len(actual_backoff_delays) == len(expected_delays)
+        for actual, expected in zip(actual_backoff_delays, expected_delays):
+            assert expected * (1 - jitter) <= actual <= expected * (1 + jitter)
+    
+    @pytest.mark.asyncio
+    async def test_reconnect_backoff_capped_at_max_delay(self, monitor):
+        """Test that a single backoff delay never exceeds the configured cap."""
+        monitor.last_draft_url = "https://fantasy.espn.com/draft/test"
+        monitor.max_reconnect_attempts = 2
+        monitor.reconnect_delays = [120]
+        monitor.reconnect_jitter = 0
+        monitor.connect_to_draft = AsyncMock(return_value=False)
+        
+        sleep_mock = AsyncMock()
+        with patch('asyncio.sleep', sleep_mock):
+            await monitor.reconnect_with_backoff()
+        
+        sleep_mock.assert_awaited_once_with(monitor.max_reconnect_delay)
     
     @pytest.mark.asyncio
     async def test_validate_connection_health_with_recent_heartbeat(self, monitor):
         """Test connection health validation with recent heartbeat."""
         monitor.connection_state = ConnectionState.CONNECTED
-        monitor.last_heartbeat_time = datetime.now() - timedelta(seconds=10)
+        monitor.last_heartbeat_monotonic = monotonic() - 10
         monitor.heartbeat_timeout_seconds = 30
         
         is_healthy = await monitor.validate_connection_health()
@@ -115,7 +142,7 @@ class TestWebSocketRecovery:
     async def test_validate_connection_health_timeout(self, monitor):
         """Test connection health validation detects timeout."""
         monitor.connection_state = ConnectionState.CONNECTED
-        monitor.last_heartbeat_time = datetime.now() - timedelta(seconds=35)
+        monitor.last_heartbeat_monotonic = monotonic() - 35
         monitor.heartbeat_timeout_seconds = 30
         
         is_healthy = await monitor.validate_connection_health()
@@ -126,7 +153,7 @@ class TestWebSocketRecovery:
     async def test_validate_connection_health_no_heartbeat(self, monitor):
         """Test connection health with no heartbeat recorded."""
         monitor.connection_state = ConnectionState.CONNECTED
-        monitor.last_heartbeat_time = None
+        monitor.last_heartbeat_monotonic = None
         
         is_healthy = await monitor.validate_connection_health()
         
@@ -136,13 +163,15 @@ class TestWebSocketRecovery:
     async def test_heartbeat_monitoring_triggers_recovery(self, monitor):
         """Test that heartbeat monitor triggers recovery on timeout."""
         monitor.connection_state = ConnectionState.CONNECTED
-        monitor.last_heartbeat_time = datetime.now() - timedelta(seconds=35)
+        monitor.last_heartbeat_monotonic = monotonic() - 35
         monitor.heartbeat_timeout_seconds = 30
-        monitor.handle_disconnection = AsyncMock()
+        monitor.heartbeat_check_interval_seconds = 0  # Check on the next loop turn
+        recovery_triggered = asyncio.Event()
+        monitor.handle_disconnection = AsyncMock(side_effect=lambda reason: recovery_triggered.set())
         
-        # Run one iteration of heartbeat monitor
+        # Run the heartbeat monitor until its first check triggers recovery
         monitor._monitor_heartbeat_task = asyncio.create_task(monitor._monitor_heartbeat())
-        await asyncio.sleep(6)  # Let it run one check cycle
+        await asyncio.wait_for(recovery_triggered.wait(), timeout=1)
         monitor._monitor_heartbeat_task.cancel()
         try:
             await monitor._monitor_heartbeat_task
@@ -159,18 +188,107 @@ class TestWebSocketRecovery:
         websocket.url = "wss://test.espn.com"
         
         # Test PING message
-        before_time = datetime.now()
+        before_time = monotonic()
         monitor._on_frame_received(websocket, "PING PING%201756607417674")
         
-        assert monitor.last_heartbeat_time is not None
-        assert monitor.last_heartbeat_time >= before_time
+        assert monitor.last_heartbeat_monotonic is not None
+        assert monitor.last_heartbeat_monotonic >= before_time
         
         # Test PONG message
         await asyncio.sleep(0.01)
-        before_time = datetime.now()
+        before_time = monotonic()
         monitor._on_frame_received(websocket, "PONG PING%201756607417674")
         
-        assert monitor.last_heartbeat_time >= before_time
+        assert monitor.last_heartbeat_monotonic >= before_time
+    
+    def test_message_log_keeps_most_recent_frames(self):
+        """Test that the message log drops the oldest frames once full."""
+        monitor = ESPNDraftMonitor(headless=True, enable_recovery=True, max_logged_messages=3)
+        monitor.logger = Mock()
+        websocket = Mock()
+        websocket.url = "wss://test.espn.com"
+        
+        for n in range(5):
+            monitor._on_frame_received(websocket, f"FRAME {n}")
+        
+        assert [m["payload"] for m in monitor.get_message_log()] == ["FRAME 2", "FRAME 3", "FRAME 4"]
+        monitor.logger.warning.assert_called_once()
+    
+    def test_message_log_unbounded_by_default(self):
+        """Test that a default monitor keeps every frame for save_message_log."""
+        monitor = ESPNDraftMonitor(headless=True)
+        monitor.logger = Mock()
+        websocket = Mock()
+        websocket.url = "wss://test.espn.com"
+        
+        for n in range(20_001):
+            monitor._on_frame_received(websocket, "PING")
+        
+        assert len(monitor.get_message_log()) == 20_001
+        monitor.logger.warning.assert_not_called()
+    
+    @pytest.mark.asyncio
+    async def test_frames_streamed_to_disk_as_json_lines(self, tmp_path):
+        """Test that the frame writer appends every frame, including ones the ring buffer evicted."""
+        path = tmp_path / "frames.jsonl"
+        monitor = ESPNDraftMonitor(headless=True, max_logged_messages=2, frame_log_path=str(path))
+        monitor.logger = Mock()
+        websocket = Mock()
+        websocket.url = "wss://test.espn.com"
+        monitor.start_frame_writer()
+        
+        for n in range(3):
+            monitor._on_frame_received(websocket, f"FRAME {n}")
+        await asyncio.sleep(0)
+        monitor._on_frame_sent(websocket, "PING")
+        await monitor.close()
+        
+        records = [json.loads(line) for line in path.read_text().splitlines()]
+        assert [(r["direction"], r["payload"]) for r in records] == [
+            ("received", "FRAME 0"), ("received", "FRAME 1"), ("received", "FRAME 2"), ("sent", "PING")
+        ]
+        assert len(monitor.get_message_log()) == 2
+        assert monitor._frame_writer_task is None
+    
+    @pytest.mark.asyncio
+    async def test_frame_writes_run_off_the_event_loop_thread(self, tmp_path):
+        """Test that frame log writes happen in an executor thread, not on the loop."""
+        monitor = ESPNDraftMonitor(headless=True, frame_log_path=str(tmp_path / "frames.jsonl"))
+        websocket = Mock()
+        websocket.url = "wss://test.espn.com"
+        write_threads = []
+        append_lines = monitor._append_lines
+        
+        def recording_append(f, lines):
+            write_threads.append(threading.get_ident())
+            append_lines(f, lines)
+        monitor._append_lines = recording_append
+        monitor.start_frame_writer()
+        
+        monitor._on_frame_received(websocket, "FRAME 0")
+        await monitor.stop_frame_writer()
+        
+        assert write_threads and threading.get_ident() not in write_threads
+    
+    @pytest.mark.asyncio
+    async def test_full_frame_queue_drops_instead_of_blocking(self, tmp_path):
+        """Test that a full writer queue drops frames and counts them."""
+        path = tmp_path / "frames.jsonl"
+        monitor = ESPNDraftMonitor(headless=True, frame_log_path=str(path), frame_queue_size=2)
+        monitor.logger = Mock()
+        websocket = Mock()
+        websocket.url = "wss://test.espn.com"
+        monitor.start_frame_writer()
+        
+        # The writer task has not run yet, so only two frames fit
+        for n in range(5):
+            monitor._on_frame_received(websocket, f"FRAME {n}")
+        await monitor.stop_frame_writer()
+        
+        assert monitor.dropped_frames == 3
+        assert len(monitor.get_message_log()) == 5
+        assert len(path.read_text().splitlines()) == 2
+        monitor.logger.warning.assert_called_once()
     
     @pytest.mark.asyncio
     async def test_frame_received_tracks_pick_number(self, monitor):
@@ -214,6 +332,25 @@ class TestWebSocketRecovery:
         # Should detect 3 missed picks (6, 7, 8)
         assert monitor.pre_disconnect_state == {}  # State should be cleared
     
+    @pytest.mark.asyncio
+    async def test_resynchronize_state_uses_monotonic_disconnect_time(self, monitor):
+        """Test disconnect duration comes from the monotonic stamp when present."""
+        monitor.pre_disconnect_state = {
+            'last_pick': 5,
+            'message_count': 100,
+            'timestamp': (datetime.now() - timedelta(hours=1)).isoformat(),  # Clock moved
+            'monotonic': monotonic() - 10
+        }
+        monitor.last_known_pick = 5
+        
+        await monitor.resynchronize_state()
+        
+        logged = [call.args[0] for call in monitor.logger.info.call_args_list]
+        durations = [msg for msg in logged if msg.startswith("Was disconnected for")]
+        assert len(durations) == 1
+        assert float(durations[0].split()[3]) < 60
+        assert monitor.pre_disconnect_state == {}
+    
     @pytest.mark.asyncio
     async def test_websocket_close_triggers_recovery(self, monitor):
         """Test that WebSocket close event triggers recovery."""
@@ -228,33 +365,27 @@ class TestWebSocketRecovery:
         monitor._on_websocket_close(websocket)
         
         # Should trigger recovery
-        await asyncio.sleep(0.01)  # Let async task start
+        await monitor._pending_disconnect_task
         monitor.handle_disconnection.assert_called()
     
     @pytest.mark.asyncio
-    async def test_reconnect_clears_old_websockets(self, monitor):
+    async def test_reconnect_clears_old_websockets(self, monitor, mock_page):
         """Test that reconnection clears old WebSocket connections."""
         monitor.last_draft_url = "https://fantasy.espn.com/draft/test"
         old_ws = Mock()
         monitor.websockets = [old_ws]
         
-        monitor.page = AsyncMock()
-        monitor.page.reload = AsyncMock()
-        monitor.page.wait_for_load_state = AsyncMock()
-        monitor.wait_for_websockets = AsyncMock(return_value=True)
-        
         await monitor.reconnect_with_backoff()
         
         assert old_ws not in monitor.websockets  # Old WebSocket should be cleared
     
     @pytest.mark.asyncio
-    async def test_reconnect_fallback_to_full_connection(self, monitor):
+    async def test_reconnect_fallback_to_full_connection(self, monitor, mock_page):
         """Test fallback from page refresh to full reconnection."""
         monitor.last_draft_url = "https://fantasy.espn.com/draft/test"
         
         # Mock page refresh to fail
-        monitor.page = AsyncMock()
-        monitor.page.reload = AsyncMock(side_effect=Exception("Refresh failed"))
+        mock_page.reload.side_effect = Exception("Refresh failed")
         
         # Mock full reconnection to succeed
         monitor.connect_to_draft = AsyncMock(return_value=True)
@@ -265,15 +396,14 @@ class TestWebSocketRecovery:
         monitor.connect_to_draft.assert_called_with(monitor.last_draft_url)
     
     @pytest.mark.asyncio
-    async def test_max_reconnect_attempts_respected(self, monitor):
+    async def test_max_reconnect_attempts_respected(self, monitor, mock_page):
         """Test that maximum reconnection attempts limit is respected."""
         monitor.last_draft_url = "https://fantasy.espn.com/draft/test"
         monitor.max_reconnect_attempts = 2
         monitor.reconnect_delays = [0.01, 0.01]  # Short delays for testing
         
         # Mock all reconnection attempts to fail
-        monitor.page = AsyncMock()
-        monitor.page.reload = AsyncMock(side_effect=Exception("Failed"))
+        mock_page.reload.side_effect = Exception("Failed")
         monitor.connect_to_draft = AsyncMock(return_value=False)
         
         success = await monitor.reconnect_with_backoff()
@@ -282,7 +412,7 @@ class TestWebSocketRecovery:
         assert monitor.connect_to_draft.call_count == 2  # Should try exactly max attempts
     
     @pytest.mark.asyncio
-    async def test_heartbeat_monitor_restarts_after_reconnection(self, monitor):
+    async def test_heartbeat_monitor_restarts_after_reconnection(self, monitor, mock_page):
         """Test that heartbeat monitor task is restarted after successful reconnection."""
         try:
             monitor.last_draft_url = "https://fantasy.espn.com/draft/test"
@@ -292,12 +422,6 @@ class TestWebSocketRecovery:
             original_task = asyncio.create_task(monitor._monitor_heartbeat())
             monitor.heartbeat_monitor_task = original_task
             
-            # Mock successful page refresh
-            monitor.page = AsyncMock()
-            monitor.page.reload = AsyncMock()
-            monitor.page.wait_for_load_state = AsyncMock()
-            monitor.wait_for_websockets = AsyncMock(return_value=True)
-            
             # The original task should exit when state changes to RECONNECTING
             # during reconnection process
             monitor.connection_state = ConnectionState.RECONNECTING
@@ -387,21 +511,16 @@ class TestConnectionStateTransitions:
         assert monitor.connection_state == ConnectionState.FAILED
     
     @pytest.mark.asyncio
-    async def test_reconnect_with_empty_delays_array(self, monitor):
+    async def test_reconnect_with_empty_delays_array(self, monitor, mock_page):
         """Test that reconnection handles empty reconnect_delays array without crashing."""
         monitor.last_draft_url = "https://fantasy.espn.com/draft/test"
         monitor.reconnect_delays = []  # Empty array that would cause IndexError
         
-        monitor.page = AsyncMock()
-        monitor.page.reload = AsyncMock()
-        monitor.page.wait_for_load_state = AsyncMock()
-        monitor.wait_for_websockets = AsyncMock(return_value=True)
-        
         # Should not crash and should use default 1-second delay
         result = await monitor.reconnect_with_backoff()
         
         assert result is True
-        monitor.page.reload.assert_called()
+        mock_page.reload.assert_called()
 
 
 if __name__ == "__main__":
@@ -13,13 +13,51 @@ import json
 import logging
 from typing import Dict, List, Set, Optional, Tuple, Any
 from datetime import datetime
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 
 from .player_id_extractor import PlayerIdExtractor, PlayerIdExtraction
 from ..api.espn_api_client import ESPNApiClient, ESPNPlayer
 
+try:
+    # Optional faster encoder (pip install .[fast])
+    import orjson
+    
+    def _json_dumps(obj: Any) -> str:
+        return orjson.dumps(obj).decode()
+except ImportError:
+    def _json_dumps(obj: Any) -> str:
+        return json.dumps(obj)
+
+
+# Confidence penalties per mismatched field, combined up front so a result
+# applies one multiply looked up by its mismatch bitmask
+_NAME_MISMATCH = 1
+_POSITION_MISMATCH = 2
+_TEAM_MISMATCH = 4
+_MISMATCH_PENALTY: Tuple[float, ...] = tuple(
+    (0.8 if mask & _NAME_MISMATCH else 1.0)
+    * (0.9 if mask & _POSITION_MISMATCH else 1.0)
+    * (0.9 if mask & _TEAM_MISMATCH else 1.0)
+    for mask in range(8)
+)
+
+# Context checks in _normalize_api_player order: (context key, alternate key,
+# case normalizer, mismatch bit, label, skip when the API value is blank)
+_CONTEXT_CHECKS = (
+    ('name', 'fullName', str.lower, _NAME_MISMATCH, 'Name', False),
+    ('position', 'pos', str.upper, _POSITION_MISMATCH, 'Position', False),
+    ('team', 'nflTeam', str.upper, _TEAM_MISMATCH, 'Team', True),
+)
+_CONTEXT_KEYS = frozenset(key for check in _CONTEXT_CHECKS for key in check[:2])
+
+
+def _context_value(context: Dict[str, Any], key: str, alternate: str) -> Any:
+    """Return context[key], falling back to context[alternate], or None."""
+    value = context.get(key)
+    return context.get(alternate) if value is None else value
 
-@dataclass
+
+@dataclass(slots=True)
 class CrossReferenceResult:
     """Result of cross-referencing a WebSocket player ID with API data."""
     player_id: str
@@ -45,16 +83,21 @@ class CrossReferenceValidator:
         self.validation_results: List[CrossReferenceResult] = []
         self.validated_ids: Set[str] = set()
         
+        # _comparison_key -> first result for that key with an API player
+        self._result_cache: Dict[Tuple, CrossReferenceResult] = {}
+        
         self.logger = logging.getLogger(__name__)
         
     async def validate_extractions(self, extractions: List[PlayerIdExtraction],
-                                 api_client: Optional[ESPNApiClient] = None) -> List[CrossReferenceResult]:
+                                 api_client: Optional[ESPNApiClient] = None,
+                                 max_concurrent: int = 8) -> List[CrossReferenceResult]:
         """
         Validate a list of player ID extractions against API data.
         
         Args:
             extractions: List of player ID extractions from WebSocket messages
             api_client: ESPN API client (uses self.api_client if not provided)
+            max_concurrent: Maximum player lookups in flight at once
             
         Returns:
             List of cross-reference results
@@ -63,29 +106,110 @@ class CrossReferenceValidator:
         if not client:
             raise ValueError("No API client available for validation")
             
-        # Get unique player IDs from extractions
-        unique_ids = list(set(e.player_id for e in extractions))
+        # Results for (player, context) pairs resolved by an earlier call
+        # are reused, so only IDs with a new pair go to the API
+        keys = [self._comparison_key(e) for e in extractions]
+        all_ids = {e.player_id for e in extractions}
+        unique_ids = list({
+            e.player_id for e, key in zip(extractions, keys) if key not in self._result_cache
+        })
+        
+        self.logger.info(
+            f"Validating {len(unique_ids)} unique player IDs from {len(extractions)} extractions "
+            f"({len(all_ids) - len(unique_ids)} IDs answered from earlier results)"
+        )
         
-        self.logger.info(f"Validating {len(unique_ids)} unique player IDs from {len(extractions)} extractions")
+        # Batch fetch from API; lookups overlap up to max_concurrent at a time
+        api_results = {}
+        if unique_ids:
+            api_results = await client.batch_get_players(unique_ids, max_concurrent=max_concurrent)
         
-        # Batch fetch from API
-        api_results = await client.batch_get_players(unique_ids)
+        # Normalize each API player once; many extractions share an ID
+        api_norm = {
+            pid: self._normalize_api_player(player)
+            for pid, player in api_results.items() if player is not None
+        }
         
-        # Create validation results
+        # Create validation results, comparing each distinct (player, context)
+        # once and re-pointing copies of that result at repeat extractions.
+        # All results of one call share a single validated_at string.
+        validated_at = datetime.now().isoformat()
         results = []
-        for extraction in extractions:
-            api_player = api_results.get(extraction.player_id)
-            result = self._create_validation_result(extraction, api_player)
+        validated_by_key: Dict[Tuple, CrossReferenceResult] = {}
+        for extraction, key in zip(extractions, keys):
+            template = None
+            if key is not None:
+                template = self._result_cache.get(key) or validated_by_key.get(key)
+            if template is not None:
+                result = replace(template, websocket_extraction=extraction,
+                                 discrepancies=list(template.discrepancies),
+                                 validated_at=validated_at)
+            else:
+                player_id = extraction.player_id
+                result = self._create_validation_result(
+                    extraction, api_results.get(player_id), api_norm.get(player_id), validated_at
+                )
+                if key is not None:
+                    validated_by_key[key] = result
+                    # NOT_FOUND may be a transient API failure, so only
+                    # results backed by an API player outlive this call
+                    if result.api_player is not None:
+                        self._result_cache[key] = result
             results.append(result)
             
         self.validation_results.extend(results)
-        self.validated_ids.update(unique_ids)
+        self.validated_ids.update(all_ids)
         
         return results
         
+    @staticmethod
+    def _comparison_key(extraction: PlayerIdExtraction) -> Optional[Tuple]:
+        """
+        Key everything _create_validation_result reads from an extraction.
+        
+        Extractions with equal keys produce the same status, confidence and
+        discrepancies. Only the compared context values are part of the key,
+        so fields such as pickNumber do not defeat the reuse.
+        
+        Returns:
+            Hashable key, or None if a compared context value is unhashable
+        """
+        context = extraction.context_fields
+        key = (extraction.player_id, extraction.confidence) + tuple(
+            _context_value(context, k, alt) for k, alt, *_ in _CONTEXT_CHECKS
+        )
+        try:
+            hash(key)
+        except TypeError:
+            return None
+        return key
+        
+    @staticmethod
+    def _normalize_api_player(api_player: ESPNPlayer) -> Tuple[str, str, str]:
+        """Return the API player's (name, position, team) in comparison form."""
+        return (
+            api_player.full_name.strip().lower(),
+            api_player.position.strip().upper(),
+            api_player.nfl_team.strip().upper()
+        )
+        
     def _create_validation_result(self, extraction: PlayerIdExtraction, 
-                                api_player: Optional[ESPNPlayer]) -> CrossReferenceResult:
-        """Create a cross-reference result from extraction and API data."""
+                                api_player: Optional[ESPNPlayer],
+                                api_norm: Optional[Tuple[str, str, str]] = None,
+                                validated_at: Optional[str] = None) -> CrossReferenceResult:
+        """
+        Create a cross-reference result from extraction and API data.
+        
+        Args:
+            extraction: Player ID extraction from a WebSocket message
+            api_player: Matching ESPN API player, or None if not found
+            api_norm: Precomputed _normalize_api_player() tuple for api_player;
+                derived here when not supplied
+            validated_at: ISO timestamp shared by a batch; now if not supplied
+            
+        Returns:
+            Cross-reference result for the extraction
+        """
         discrepancies = []
         
         if api_player is None:
@@ -96,43 +220,32 @@ class CrossReferenceValidator:
             
         else:
             # Player found - check for consistency
-            status = "VALIDATED"
             confidence = extraction.confidence
+            mismatches = 0
             
-            # Check if context data matches API data
-            if extraction.context_fields:
-                context = extraction.context_fields
+            # Check if context data matches API data; contexts without any
+            # compared key (e.g. regex-only extractions) skip the checks
+            context = extraction.context_fields
+            if context and not _CONTEXT_KEYS.isdisjoint(context):
+                if api_norm is None:
+                    api_norm = self._normalize_api_player(api_player)
                 
-                # Check name consistency
-                if 'name' in context or 'fullName' in context:
-                    context_name = context.get('name', context.get('fullName', '')).strip().lower()
-                    api_name = api_player.full_name.strip().lower()
-                    
-                    if context_name and context_name != api_name:
-                        discrepancies.append(f"Name mismatch: '{context_name}' vs '{api_name}'")
-                        confidence *= 0.8
-                        
-                # Check position consistency
-                if 'position' in context or 'pos' in context:
-                    context_pos = context.get('position', context.get('pos', '')).strip().upper()
-                    api_pos = api_player.position.strip().upper()
-                    
-                    if context_pos and context_pos != api_pos:
-                        discrepancies.append(f"Position mismatch: '{context_pos}' vs '{api_pos}'")
-                        confidence *= 0.9
-                        
-                # Check team consistency
-                if 'team' in context or 'nflTeam' in context:
-                    context_team = context.get('team', context.get('nflTeam', '')).strip().upper()
-                    api_team = api_player.nfl_team.strip().upper()
-                    
-                    if context_team and api_team and context_team != api_team:
-                        discrepancies.append(f"Team mismatch: '{context_team}' vs '{api_team}'")
-                        confidence *= 0.9
+                # Check name, position and team consistency
+                for (key, alternate, normalize, bit, label, skip_blank_api), api_value in zip(
+                    _CONTEXT_CHECKS, api_norm
+                ):
+                    value = _context_value(context, key, alternate)
+                    if value is None or (skip_blank_api and not api_value):
+                        continue
+                    context_value = normalize(value.strip())
+                    if context_value and context_value != api_value:
+                        discrepancies.append(f"{label} mismatch: '{context_value}' vs '{api_value}'")
+                        mismatches |= bit
                         
-            # Determine final status
-            if discrepancies:
-                status = "MISMATCH" if confidence < 0.6 else "VALIDATED"
+            # Determine final status; only penalized results can mismatch
+            if mismatches:
+                confidence *= _MISMATCH_PENALTY[mismatches]
+            status = "MISMATCH" if mismatches and confidence < 0.6 else "VALIDATED"
                 
         return CrossReferenceResult(
             player_id=extraction.player_id,
@@ -140,7 +253,8 @@ class CrossReferenceValidator:
             api_player=api_player,
             validation_status=status,
             confidence_score=confidence,
-            discrepancies=discrepancies
+            discrepancies=discrepancies,
+            validated_at=validated_at or datetime.now().isoformat()
         )
         
     def get_validation_summary(self) -> Dict[str, Any]:
@@ -149,27 +263,35 @@ class CrossReferenceValidator:
             return {"total_validations": 0}
             
         total = len(self.validation_results)
-        validated = len([r for r in self.validation_results if r.validation_status == "VALIDATED"])
-        not_found = len([r for r in self.validation_results if r.validation_status == "NOT_FOUND"])
-        mismatch = len([r for r in self.validation_results if r.validation_status == "MISMATCH"])
-        
-        # Calculate confidence distribution
-        confidences = [r.confidence_score for r in self.validation_results]
-        high_conf = len([c for c in confidences if c >= 0.8])
-        medium_conf = len([c for c in confidences if 0.5 <= c < 0.8])
-        low_conf = len([c for c in confidences if c < 0.5])
-        
-        # Get successfully validated players
+        validated = not_found = mismatch = 0
+        high_conf = medium_conf = low_conf = 0
         validated_players = []
+        
+        # One pass for status counts, confidence distribution and players
         for result in self.validation_results:
-            if result.validation_status == "VALIDATED" and result.api_player:
-                validated_players.append({
-                    "id": result.player_id,
-                    "name": result.api_player.full_name,
-                    "position": result.api_player.position,
-                    "team": result.api_player.nfl_team,
-                    "confidence": result.confidence_score
-                })
+            status = result.validation_status
+            if status == "VALIDATED":
+                validated += 1
+                if result.api_player:
+                    validated_players.append({
+                        "id": result.player_id,
+                        "name": result.api_player.full_name,
+                        "position": result.api_player.position,
+                        "team": result.api_player.nfl_team,
+                        "confidence": result.confidence_score
+                    })
+            elif status == "NOT_FOUND":
+                not_found += 1
+            elif status == "MISMATCH":
+                mismatch += 1
+                
+            confidence = result.confidence_score
+            if confidence >= 0.8:
+                high_conf += 1
+            elif confidence >= 0.5:
+                medium_conf += 1
+            else:
+                low_conf += 1
                 
         return {
             "total_validations": total,
@@ -204,51 +326,68 @@ class CrossReferenceValidator:
                 
         return problematic
         
-    def save_validation_results(self, filename: str):
-        """Save all validation results to a JSON file."""
-        data = {
-            "validation_timestamp": datetime.now().isoformat(),
-            "summary": self.get_validation_summary(),
-            "problematic_ids": self.get_problematic_ids(),
-            "detailed_results": [
-                {
-                    "player_id": r.player_id,
-                    "validation_status": r.validation_status,
-                    "confidence_score": r.confidence_score,
-                    "discrepancies": r.discrepancies,
-                    "websocket_data": {
-                        "timestamp": r.websocket_extraction.timestamp,
-                        "message_type": r.websocket_extraction.message_type,
-                        "context_fields": r.websocket_extraction.context_fields,
-                        "original_confidence": r.websocket_extraction.confidence
-                    },
-                    "api_data": {
-                        "full_name": r.api_player.full_name if r.api_player else None,
-                        "position": r.api_player.position if r.api_player else None,
-                        "nfl_team": r.api_player.nfl_team if r.api_player else None,
-                        "status": r.api_player.status if r.api_player else None
-                    } if r.api_player else None
-                }
-                for r in self.validation_results
-            ]
+    @staticmethod
+    def _detailed_result(r: CrossReferenceResult) -> Dict[str, Any]:
+        """Serializable form of one result for save_validation_results."""
+        return {
+            "player_id": r.player_id,
+            "validation_status": r.validation_status,
+            "confidence_score": r.confidence_score,
+            "discrepancies": r.discrepancies,
+            "websocket_data": {
+                "timestamp": r.websocket_extraction.timestamp,
+                "message_type": r.websocket_extraction.message_type,
+                "context_fields": r.websocket_extraction.context_fields,
+                "original_confidence": r.websocket_extraction.confidence
+            },
+            "api_data": {
+                "full_name": r.api_player.full_name,
+                "position": r.api_player.position,
+                "nfl_team": r.api_player.nfl_team,
+                "status": r.api_player.status
+            } if r.api_player else None
         }
         
+    def save_validation_results(self, filename: str):
+        """
+        Save all validation results to a JSON file.
+        
+        Detailed results are encoded and written one entry at a time, so the
+        whole results tree is never built in memory before writing. The file
+        is always UTF-8, since player names are written unescaped.
+        
+        Args:
+            filename: Path of the JSON file to write
+        """
         try:
-            with open(filename, 'w') as f:
-                json.dump(data, f, indent=2)
+            with open(filename, 'w', encoding='utf-8') as f:
+                f.write('{\n')
+                f.write(f'  "validation_timestamp": {_json_dumps(datetime.now().isoformat())},\n')
+                f.write(f'  "summary": {_json_dumps(self.get_validation_summary())},\n')
+                f.write(f'  "problematic_ids": {_json_dumps(self.get_problematic_ids())},\n')
+                f.write('  "detailed_results": [')
+                separator = '\n    '
+                for result in self.validation_results:
+                    f.write(separator)
+                    f.write(_json_dumps(self._detailed_result(result)))
+                    separator = ',\n    '
+                f.write('\n  ]\n}\n')
             self.logger.info(f"Validation results saved to {filename}")
         except Exception as e:
             self.logger.error(f"Failed to save validation results: {e}")
 
 
 async def validate_websocket_extractions(websocket_log_file: str, 
-                                       output_file: Optional[str] = None) -> Dict[str, Any]:
+                                       output_file: Optional[str] = None,
+                                       api_client: Optional[ESPNApiClient] = None) -> Dict[str, Any]:
     """
     Utility function to validate player IDs from a WebSocket log file.
     
     Args:
         websocket_log_file: Path to file containing WebSocket message log
         output_file: Optional path to save validation results
+        api_client: Open ESPN API client to reuse; a temporary one is
+            opened and closed here if not provided
         
     Returns:
         Validation summary dictionary
@@ -281,9 +420,12 @@ async def validate_websocket_extractions(websocket_log_file: str,
         
     # Validate against API
     print("Validating against ESPN API...")
-    async with ESPNApiClient() as api_client:
-        validator = CrossReferenceValidator()
-        results = await validator.validate_extractions(all_extractions, api_client)
+    validator = CrossReferenceValidator(api_client)
+    if api_client:
+        results = await validator.validate_extractions(all_extractions)
+    else:
+        async with ESPNApiClient() as owned_client:
+            results = await validator.validate_extractions(all_extractions, owned_client)
         
     print(f"Validation complete. Processed {len(results)} extractions.")
     
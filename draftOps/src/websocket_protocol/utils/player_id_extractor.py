@@ -8,20 +8,70 @@ Part of Sprint 0 Player ID System Reverse Engineering.
 
 import json
 import logging
+import os
 import re
-from typing import Dict, List, Any, Optional, Set
+from collections import Counter, OrderedDict
+from functools import lru_cache
+from typing import Dict, Iterable, List, Any, Optional, Set, Tuple
 from datetime import datetime
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 
+from .timestamps import iso_now
 
-@dataclass
+try:
+    # Optional faster codec (pip install .[fast]); its JSONDecodeError
+    # subclasses json.JSONDecodeError, so error handling is unchanged
+    import orjson
+    
+    _json_loads = orjson.loads
+    
+    def _json_dumps(obj: Any) -> str:
+        return orjson.dumps(obj).decode()
+except ImportError:
+    _json_loads = json.loads
+    
+    def _json_dumps(obj: Any) -> str:
+        return json.dumps(obj)
+
+
+# Patterns for numeric IDs in non-JSON text (common ESPN format), joined into
+# one alternation so a payload is scanned once. Each branch has exactly one
+# capture group, read back through match.lastindex.
+_NUMERIC_ID_PATTERN = re.compile('|'.join((
+    r'"playerId["\s]*:\s*["\s]*(\d+)',
+    r'"player_id["\s]*:\s*["\s]*(\d+)',
+    r'"id["\s]*:\s*["\s]*(\d+)',
+    r'playerId[=:]\s*(\d+)',
+    r'player[_\s]*id[=:]\s*(\d+)'
+)), re.IGNORECASE)
+
+# Starting confidence by lower-cased ID field name: explicit player ID fields
+# are more certain than ESPN/athlete IDs, and a generic "id" least of all
+_FIELD_BASE_CONFIDENCE = {
+    "playerid": 0.8, "player_id": 0.8,
+    "espnid": 0.7, "espn_id": 0.7, "athleteid": 0.7, "athlete_id": 0.7,
+    "id": 0.6,
+}
+
+# Characters of the source payload kept on each extraction. Frames can be
+# large, and keeping only an excerpt lets the full payload be freed once it
+# has been parsed.
+_RAW_MESSAGE_LIMIT = 500
+
+# Recently seen payloads whose extraction results are reused; ESPN
+# rebroadcasts identical frames across topics and subscribers. Entries are
+# keyed by a digest, not the payload, so cached frames can still be freed.
+_PAYLOAD_CACHE_SIZE = 1024
+
+
+@dataclass(slots=True)
 class PlayerIdExtraction:
     """Represents an extracted player ID from a WebSocket message."""
     player_id: str
     timestamp: str
     message_type: str
     websocket_url: str
-    raw_message: str
+    raw_message: str  # Leading excerpt of the payload, shared per message
     context_fields: Dict[str, Any] = field(default_factory=dict)
     confidence: float = 1.0  # How confident we are this is a valid player ID
 
@@ -41,11 +91,18 @@ class PlayerIdExtractor:
         self.unique_player_ids: Set[str] = set()
         self.message_patterns: Dict[str, int] = {}
         
+        # Running summary counters, updated as extractions are stored
+        self._by_message_type: Counter = Counter()
+        self._confidence_counts = [0, 0, 0]  # high (>=0.8), medium (>=0.5), low
+        self._high_confidence_ids: Set[str] = set()
+        self._payload_cache: 'OrderedDict[Tuple[int, int, str, str], Tuple[PlayerIdExtraction, ...]]' = OrderedDict()
+        
         # Known field patterns that likely contain player IDs
         self.player_id_fields = [
             "playerId", "player_id", "playerID", "id", "espnId", "espn_id",
             "athleteId", "athlete_id", "selectedPlayerId", "draftedPlayerId"
         ]
+        self._player_id_field_set = frozenset(self.player_id_fields)
         
         # Context fields that help understand the player selection
         self.context_fields = [
@@ -53,6 +110,23 @@ class PlayerIdExtractor:
             "position", "pos", "name", "fullName", "firstName", "lastName",
             "team", "nflTeam", "status", "injuryStatus"
         ]
+        self._context_field_set = frozenset(self.context_fields)
+        
+        # ESPN draft text protocol commands, keyed by first token. Only
+        # SELECTED carries a player ID; the rest are recognized and skipped
+        # so they never reach the JSON or regex extraction paths.
+        self._text_command_handlers = {
+            'SELECTED': self._extract_from_espn_draft_text,
+            'SELECTING': None,
+            'CLOCK': None,
+            'ONTHECLOCK': None,
+            'AUTODRAFT': None,
+            'TOKEN': None,
+            'JOINED': None,
+            'LEFT': None,
+            'PING': None,
+            'PONG': None,
+        }
         
     def extract_from_message(self, payload: str, websocket_url: str, 
                            message_type: str = "unknown") -> List[PlayerIdExtraction]:
@@ -67,139 +141,237 @@ class PlayerIdExtractor:
         Returns:
             List of extracted player ID information
         """
+        timestamp = iso_now()
+        extractions = self._extract_payload(payload, websocket_url, message_type, timestamp)
+        self._store_extractions(extractions)
+        return extractions
+        
+    def extract_batch(self, items: Iterable[Tuple[str, str, str]]) -> List[PlayerIdExtraction]:
+        """
+        Extract player IDs from many WebSocket messages in one call.
+        
+        Lets a caller drain queued frames once per event-loop tick; the whole
+        batch shares one timestamp and one pass over the summary counters.
+        
+        Args:
+            items: (payload, websocket_url, message_type) tuples
+            
+        Returns:
+            Extracted player ID information for all messages, in input order
+        """
+        timestamp = iso_now()
+        extract = self._extract_payload
         extractions = []
-        timestamp = datetime.now().isoformat()
+        for payload, websocket_url, message_type in items:
+            extractions.extend(extract(payload, websocket_url, message_type, timestamp))
+        self._store_extractions(extractions)
+        return extractions
+        
+    def _extract_payload(self, payload: str, websocket_url: str, message_type: str,
+                        timestamp: str) -> List[PlayerIdExtraction]:
+        """
+        Extract player IDs from one payload, reusing results for repeated frames.
+        
+        A payload seen recently with the same message type is not parsed or
+        scanned again; its earlier extractions are copied with this frame's
+        timestamp and URL. The cache key is the payload's hash and length
+        plus its leading excerpt (already kept on extractions) as a
+        tie-break, so at most _RAW_MESSAGE_LIMIT characters of each frame
+        stay referenced. Two distinct payloads agreeing on all of these
+        would share results; that needs a hash collision between frames of
+        equal length and identical leading excerpt, which is accepted.
+        
+        The cache holds detached copies, so callers may edit the returned
+        extractions without affecting later repeats of the payload.
+        """
+        key = (hash(payload), len(payload), message_type, payload[:_RAW_MESSAGE_LIMIT])
+        cache = self._payload_cache
+        templates = cache.get(key)
+        if templates is None:
+            extractions = self._dispatch_payload(payload, websocket_url, message_type, timestamp)
+            cache[key] = tuple(
+                replace(e, context_fields=dict(e.context_fields)) for e in extractions
+            )
+            if len(cache) > _PAYLOAD_CACHE_SIZE:
+                cache.popitem(last=False)
+            return extractions
+            
+        cache.move_to_end(key)
+        return [
+            replace(t, timestamp=timestamp, websocket_url=websocket_url,
+                    context_fields=dict(t.context_fields))
+            for t in templates
+        ]
+        
+    def _dispatch_payload(self, payload: str, websocket_url: str, message_type: str,
+                         timestamp: str) -> List[PlayerIdExtraction]:
+        """Dispatch one payload to the text-protocol, JSON or pattern extractor."""
+        payload_stripped = payload.strip()
+        command = payload_stripped.partition(' ')[0]
         
         # Check for ESPN draft text protocol first (discovered from live test)
-        if self._is_espn_draft_text(payload):
-            extractions.extend(self._extract_from_espn_draft_text(
-                payload, websocket_url, message_type, timestamp
-            ))
-        else:
+        if command in self._text_command_handlers:
+            handler = self._text_command_handlers[command]
+            if handler:
+                return handler(payload, websocket_url, message_type, timestamp)
+            return []
+        if payload_stripped[:1] in ('{', '['):
             try:
                 # Try to parse as JSON
-                data = json.loads(payload)
-                extractions.extend(self._extract_from_json(
-                    data, payload, websocket_url, message_type, timestamp
-                ))
+                data = _json_loads(payload)
             except json.JSONDecodeError:
-                # Try pattern-based extraction for non-JSON messages
-                extractions.extend(self._extract_from_text(
-                    payload, websocket_url, message_type, timestamp
-                ))
-            
-        # Store extractions
+                # Try pattern-based extraction for malformed JSON
+                return self._extract_from_text(payload, websocket_url, message_type, timestamp)
+            return self._extract_from_json(
+                data, payload[:_RAW_MESSAGE_LIMIT], websocket_url, message_type, timestamp
+            )
+        # Pattern-based extraction for other non-JSON messages
+        return self._extract_from_text(payload, websocket_url, message_type, timestamp)
+        
+    def _store_extractions(self, extractions: List[PlayerIdExtraction]) -> None:
+        """Record extractions and update the running summary counters."""
+        # Most frames (pings, acks, clock ticks) carry no player IDs
+        if not extractions:
+            return
         self.extracted_ids.extend(extractions)
+        self.unique_player_ids.update([e.player_id for e in extractions])
         for extraction in extractions:
-            self.unique_player_ids.add(extraction.player_id)
+            self._by_message_type[extraction.message_type] += 1
+            confidence = extraction.confidence
+            if confidence >= 0.8:
+                self._confidence_counts[0] += 1
+                self._high_confidence_ids.add(extraction.player_id)
+            else:
+                self._confidence_counts[1 if confidence >= 0.5 else 2] += 1
             
-        return extractions
-        
     def _extract_from_json(self, data: Any, raw_message: str, websocket_url: str,
                           message_type: str, timestamp: str) -> List[PlayerIdExtraction]:
         """Extract player IDs from parsed JSON data."""
-        extractions = []
-        
         if isinstance(data, dict):
-            extractions.extend(self._extract_from_dict(
+            # Most draft frames are flat objects (type, playerId, teamId, ...);
+            # only those with nested objects or arrays need the full walk
+            extractions = self._extract_from_flat_dict(
                 data, raw_message, websocket_url, message_type, timestamp
-            ))
-        elif isinstance(data, list):
+            )
+            if extractions is None:
+                extractions = self._extract_from_dict(
+                    data, raw_message, websocket_url, message_type, timestamp
+                )
+            return extractions
+            
+        extractions = []
+        if isinstance(data, list):
+            extend = extractions.extend
+            extract_from_dict = self._extract_from_dict
             for item in data:
                 if isinstance(item, dict):
-                    extractions.extend(self._extract_from_dict(
-                        item, raw_message, websocket_url, message_type, timestamp
-                    ))
+                    extend(extract_from_dict(item, raw_message, websocket_url, message_type, timestamp))
                     
         return extractions
         
+    def _extract_from_flat_dict(self, data: Dict[str, Any], raw_message: str,
+                               websocket_url: str, message_type: str,
+                               timestamp: str) -> Optional[List[PlayerIdExtraction]]:
+        """
+        Extract player IDs from a dictionary with no nested dicts or lists.
+        
+        Returns the same extractions _extract_from_dict would, without its
+        stack and child bookkeeping, or None as soon as a nested container
+        is seen so the caller can fall back to the full walk.
+        """
+        player_id_fields = self._player_id_field_set
+        found = []
+        for key, value in data.items():
+            if isinstance(value, (dict, list)):
+                return None
+            if key in player_id_fields:
+                found.append((key, str(value)))
+                
+        extractions = []
+        for key, player_id in found:
+            if self._is_valid_player_id(player_id):
+                context = self._extract_context(data)
+                extractions.append(PlayerIdExtraction(
+                    player_id=player_id,
+                    timestamp=timestamp,
+                    message_type=message_type,
+                    websocket_url=websocket_url,
+                    raw_message=raw_message,
+                    context_fields=context,
+                    confidence=self._calculate_confidence(key, context)
+                ))
+        return extractions
+        
     def _extract_from_dict(self, data: Dict[str, Any], raw_message: str,
                           websocket_url: str, message_type: str, 
                           timestamp: str) -> List[PlayerIdExtraction]:
-        """Extract player IDs from a dictionary, recursively searching nested structures."""
+        """Extract player IDs from a dictionary, searching nested structures."""
         extractions = []
+        # Loop-invariant lookups bound once per call rather than per key
+        append = extractions.append
+        player_id_fields = self._player_id_field_set
+        is_valid = self._is_valid_player_id
+        extract_context = self._extract_context
+        calculate_confidence = self._calculate_confidence
         
-        # Direct field matching
-        for field in self.player_id_fields:
-            if field in data:
-                player_id = str(data[field])
-                if self._is_valid_player_id(player_id):
-                    context = self._extract_context(data)
-                    
-                    extraction = PlayerIdExtraction(
-                        player_id=player_id,
-                        timestamp=timestamp,
-                        message_type=message_type,
-                        websocket_url=websocket_url,
-                        raw_message=raw_message,
-                        context_fields=context,
-                        confidence=self._calculate_confidence(field, context)
-                    )
-                    extractions.append(extraction)
-                    
-        # Recursive search in nested structures
-        for key, value in data.items():
-            if isinstance(value, dict):
-                extractions.extend(self._extract_from_dict(
-                    value, raw_message, websocket_url, message_type, timestamp
-                ))
-            elif isinstance(value, list):
-                for item in value:
-                    if isinstance(item, dict):
-                        extractions.extend(self._extract_from_dict(
-                            item, raw_message, websocket_url, message_type, timestamp
+        # Iterative depth-first walk over nested dicts (directly or inside lists).
+        # Children are pushed in reverse so they are visited in document order.
+        stack = [data]
+        pop = stack.pop
+        while stack:
+            current = pop()
+            children = []
+            
+            for key, value in current.items():
+                # Direct field matching
+                if key in player_id_fields:
+                    player_id = str(value)
+                    if is_valid(player_id):
+                        context = extract_context(current)
+                        
+                        append(PlayerIdExtraction(
+                            player_id=player_id,
+                            timestamp=timestamp,
+                            message_type=message_type,
+                            websocket_url=websocket_url,
+                            raw_message=raw_message,
+                            context_fields=context,
+                            confidence=calculate_confidence(key, context)
                         ))
                         
+                # Collect nested structures
+                if isinstance(value, dict):
+                    children.append(value)
+                elif isinstance(value, list):
+                    children.extend(item for item in value if isinstance(item, dict))
+                    
+            stack.extend(reversed(children))
+            
         return extractions
         
     def _extract_from_text(self, payload: str, websocket_url: str,
                           message_type: str, timestamp: str) -> List[PlayerIdExtraction]:
         """Extract player IDs from non-JSON text using pattern matching."""
         extractions = []
+        append = extractions.append
+        is_valid = self._is_valid_player_id
+        raw_message = payload[:_RAW_MESSAGE_LIMIT]
         
-        # Pattern for numeric IDs (common ESPN format)
-        numeric_patterns = [
-            r'"playerId["\s]*:\s*["\s]*(\d+)["\s]*',
-            r'"player_id["\s]*:\s*["\s]*(\d+)["\s]*',
-            r'"id["\s]*:\s*["\s]*(\d+)["\s]*',
-            r'playerId[=:]\s*(\d+)',
-            r'player[_\s]*id[=:]\s*(\d+)'
-        ]
-        
-        for pattern in numeric_patterns:
-            matches = re.finditer(pattern, payload, re.IGNORECASE)
-            for match in matches:
-                player_id = match.group(1)
-                if self._is_valid_player_id(player_id):
-                    extraction = PlayerIdExtraction(
-                        player_id=player_id,
-                        timestamp=timestamp,
-                        message_type=message_type,
-                        websocket_url=websocket_url,
-                        raw_message=payload,
-                        context_fields={},
-                        confidence=0.7  # Lower confidence for pattern matching
-                    )
-                    extractions.append(extraction)
+        for match in _NUMERIC_ID_PATTERN.finditer(payload):
+            player_id = match.group(match.lastindex)
+            if is_valid(player_id):
+                append(PlayerIdExtraction(
+                    player_id=player_id,
+                    timestamp=timestamp,
+                    message_type=message_type,
+                    websocket_url=websocket_url,
+                    raw_message=raw_message,
+                    context_fields={},
+                    confidence=0.7  # Lower confidence for pattern matching
+                ))
                     
         return extractions
         
-    def _is_espn_draft_text(self, payload: str) -> bool:
-        """
-        Check if payload is ESPN draft text protocol.
-        
-        Based on live test discovery:
-        - SELECTED [pick] [player_id] [position] [team_guid]
-        - AUTODRAFT [team] [enabled]
-        """
-        payload_stripped = payload.strip()
-        return (
-            payload_stripped.startswith('SELECTED ') or 
-            payload_stripped.startswith('AUTODRAFT ') or
-            payload_stripped.startswith('CLOCK ') or
-            payload_stripped.startswith('ONTHECLOCK ')
-        )
-        
     def _extract_from_espn_draft_text(self, payload: str, websocket_url: str,
                                     message_type: str, timestamp: str) -> List[PlayerIdExtraction]:
         """
@@ -210,52 +382,53 @@ class PlayerIdExtractor:
         Example: "SELECTED 2 4362628 4 {00000000-0000-4000-8000-000000000A02}"
         """
         extractions = []
-        payload_stripped = payload.strip()
         
-        if payload_stripped.startswith('SELECTED '):
-            # Parse SELECTED command
-            # Pattern: SELECTED [pick] [PLAYER_ID] [position] [optional_team_guid]
-            parts = payload_stripped.split()
-            
-            if len(parts) >= 4:  # SELECTED pick_num player_id position [team_guid]
-                try:
-                    pick_number = int(parts[1])
-                    player_id = parts[2]
-                    position_code = int(parts[3])
-                    team_guid = parts[4] if len(parts) > 4 else ""
+        # Parse SELECTED command
+        # Pattern: SELECTED [pick] [PLAYER_ID] [position] [optional_team_guid]
+        parts = payload.split()
+        
+        if len(parts) >= 4:  # SELECTED pick_num player_id position [team_guid]
+            try:
+                pick_number = int(parts[1])
+                player_id = parts[2]
+                position_code = int(parts[3])
+                team_guid = parts[4] if len(parts) > 4 else ""
+                
+                if self._is_valid_player_id(player_id):
+                    # Build context with raw position code (API will resolve actual position)
+                    context = {
+                        "pick_number": pick_number,
+                        "position_code": position_code,
+                        "team_guid": team_guid,
+                        "draft_protocol": "espn_text"
+                    }
                     
-                    if self._is_valid_player_id(player_id):
-                        # Build context with raw position code (API will resolve actual position)
-                        context = {
-                            "pick_number": pick_number,
-                            "position_code": position_code,
-                            "team_guid": team_guid,
-                            "draft_protocol": "espn_text"
-                        }
-                        
-                        extraction = PlayerIdExtraction(
-                            player_id=player_id,
-                            timestamp=timestamp,
-                            message_type="DRAFT_PICK",
-                            websocket_url=websocket_url,
-                            raw_message=payload,
-                            context_fields=context,
-                            confidence=0.95  # High confidence for ESPN text protocol
-                        )
-                        extractions.append(extraction)
-                        
-                except (ValueError, IndexError):
-                    # Invalid format, ignore
-                    pass
+                    extraction = PlayerIdExtraction(
+                        player_id=player_id,
+                        timestamp=timestamp,
+                        message_type="DRAFT_PICK",
+                        websocket_url=websocket_url,
+                        raw_message=payload[:_RAW_MESSAGE_LIMIT],
+                        context_fields=context,
+                        confidence=0.95  # High confidence for ESPN text protocol
+                    )
+                    extractions.append(extraction)
                     
+            except (ValueError, IndexError):
+                # Invalid format, ignore
+                pass
+                
         return extractions
         
-    def _is_valid_player_id(self, candidate: str) -> bool:
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _is_valid_player_id(candidate: str) -> bool:
         """
         Validate whether a candidate string looks like a valid ESPN player ID.
         
         Based on research findings, ESPN player IDs appear to be numeric
-        and typically 6-7 digits long.
+        and typically 6-7 digits long. Results are memoized because the same
+        drafted players' IDs recur across many frames.
         """
         try:
             # Must be numeric
@@ -273,25 +446,14 @@ class PlayerIdExtractor:
         
     def _extract_context(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """Extract contextual information that helps understand the player."""
-        context = {}
-        
-        for field in self.context_fields:
-            if field in data:
-                context[field] = data[field]
-                
-        return context
+        # One set probe per key the node actually has, in the node's key order
+        context_fields = self._context_field_set
+        return {key: value for key, value in data.items() if key in context_fields}
         
     def _calculate_confidence(self, field_name: str, context: Dict[str, Any]) -> float:
         """Calculate confidence score for a player ID extraction."""
-        confidence = 0.5  # Base confidence
-        
-        # Higher confidence for explicit player ID fields
-        if field_name.lower() in ["playerid", "player_id"]:
-            confidence += 0.3
-        elif field_name.lower() in ["espnid", "espn_id", "athleteid", "athlete_id"]:
-            confidence += 0.2
-        elif field_name.lower() == "id":
-            confidence += 0.1  # Generic "id" field is less certain
+        # Base confidence of 0.5, raised for recognized player ID fields
+        confidence = _FIELD_BASE_CONFIDENCE.get(field_name.lower(), 0.5)
             
         # Boost confidence if we have supporting context
         if context.get("name") or context.get("fullName"):
@@ -308,63 +470,66 @@ class PlayerIdExtractor:
         if not self.extracted_ids:
             return {"total_extractions": 0, "unique_players": 0}
             
-        # Group by confidence levels
-        high_confidence = [e for e in self.extracted_ids if e.confidence >= 0.8]
-        medium_confidence = [e for e in self.extracted_ids if 0.5 <= e.confidence < 0.8]
-        low_confidence = [e for e in self.extracted_ids if e.confidence < 0.5]
-        
-        # Group by message type
-        by_message_type = {}
-        for extraction in self.extracted_ids:
-            msg_type = extraction.message_type
-            if msg_type not in by_message_type:
-                by_message_type[msg_type] = 0
-            by_message_type[msg_type] += 1
+        # Counters are maintained in extract_from_message, so no rescan here
+        high_confidence, medium_confidence, low_confidence = self._confidence_counts
             
         return {
             "total_extractions": len(self.extracted_ids),
             "unique_players": len(self.unique_player_ids),
             "confidence_breakdown": {
-                "high_confidence": len(high_confidence),
-                "medium_confidence": len(medium_confidence), 
-                "low_confidence": len(low_confidence)
+                "high_confidence": high_confidence,
+                "medium_confidence": medium_confidence, 
+                "low_confidence": low_confidence
             },
-            "by_message_type": by_message_type,
+            "by_message_type": dict(self._by_message_type),
             "unique_player_ids": list(self.unique_player_ids)
         }
         
     def get_high_confidence_ids(self) -> Set[str]:
         """Get player IDs with high confidence scores."""
-        return {
-            e.player_id for e in self.extracted_ids 
-            if e.confidence >= 0.8
-        }
+        # Maintained alongside the summary counters; copied so callers
+        # cannot mutate the running set
+        return set(self._high_confidence_ids)
         
     def save_extractions(self, filename: str):
-        """Save all extractions to a JSON file for analysis."""
-        data = {
-            "extraction_timestamp": datetime.now().isoformat(),
-            "summary": self.get_extraction_summary(),
-            "extractions": [
-                {
-                    "player_id": e.player_id,
-                    "timestamp": e.timestamp,
-                    "message_type": e.message_type,
-                    "websocket_url": e.websocket_url,
-                    "context_fields": e.context_fields,
-                    "confidence": e.confidence,
-                    "raw_message": e.raw_message[:500]  # Truncate for readability
-                }
-                for e in self.extracted_ids
-            ]
-        }
+        """
+        Save all extractions to a JSON file for analysis.
         
+        Extractions are encoded and written one per line, so the full list
+        is never built as one structure before writing. The file is written
+        as UTF-8 to a temporary path and renamed over the target, so a failed
+        save never leaves a truncated file behind.
+        
+        Args:
+            filename: Path of the JSON file to write
+        """
+        tmp_filename = f"{filename}.tmp"
         try:
-            with open(filename, 'w') as f:
-                json.dump(data, f, indent=2)
+            with open(tmp_filename, 'w', encoding='utf-8') as f:
+                f.write('{\n')
+                f.write(f'  "extraction_timestamp": {_json_dumps(datetime.now().isoformat())},\n')
+                f.write(f'  "summary": {_json_dumps(self.get_extraction_summary())},\n')
+                f.write('  "extractions": [')
+                separator = '\n    '
+                for e in self.extracted_ids:
+                    f.write(separator)
+                    f.write(_json_dumps({
+                        "player_id": e.player_id,
+                        "timestamp": e.timestamp,
+                        "message_type": e.message_type,
+                        "websocket_url": e.websocket_url,
+                        "context_fields": e.context_fields,
+                        "confidence": e.confidence,
+                        "raw_message": e.raw_message
+                    }))
+                    separator = ',\n    '
+                f.write('\n  ]\n}\n')
+            os.replace(tmp_filename, filename)
             self.logger.info(f"Player ID extractions saved to {filename}")
         except Exception as e:
             self.logger.error(f"Failed to save extractions: {e}")
+            if os.path.exists(tmp_filename):
+                os.remove(tmp_filename)
 
 
 def analyze_draft_message_for_players(payload: str, websocket_url: str = "") -> List[str]:
@@ -0,0 +1,37 @@
+#!/usr/bin/env python3
+"""
+Timestamp helpers for per-frame WebSocket bookkeeping.
+
+Frames, discovery records and extractions are stamped with local ISO 8601
+strings. Building a datetime and formatting it for every frame is a
+noticeable share of the per-frame cost on busy draft sockets, so the
+date-and-seconds prefix is formatted once per second and reused.
+"""
+
+from datetime import datetime
+from time import time
+from typing import Tuple
+
+# (whole second, its isoformat() prefix); one tuple so it is swapped atomically
+_second_cache: Tuple[int, str] = (-1, "")
+
+
+def iso_now() -> str:
+    """
+    Return the current local time as an ISO 8601 string.
+
+    Matches datetime.now().isoformat(), including dropping the fractional
+    part when the microseconds are zero.
+
+    Returns:
+        ISO 8601 timestamp string
+    """
+    global _second_cache
+    now = time()
+    second = int(now)
+    cached_second, prefix = _second_cache
+    if second != cached_second:
+        prefix = datetime.fromtimestamp(second).isoformat()
+        _second_cache = (second, prefix)
+    micros = int((now - second) * 1_000_000)
+    return f"{prefix}.{micros:06d}" if micros else prefix
@@ -1,20 +1,65 @@
 import asyncio
 import json
+import os
 import re
+from collections import deque
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Dict, List, Any, Set
+from typing import Deque, Dict, List, Any, Optional, Set
 from urllib.parse import urlparse
 
+from .timestamps import iso_now
+
+try:
+    # Optional faster codec (pip install .[fast]); its JSONDecodeError
+    # subclasses json.JSONDecodeError, so error handling is unchanged
+    import orjson
+    
+    _json_loads = orjson.loads
+    
+    def _json_dumps(obj: Any) -> str:
+        return orjson.dumps(obj, default=str).decode()
+except ImportError:
+    _json_loads = json.loads
+    
+    def _json_dumps(obj: Any) -> str:
+        return json.dumps(obj, default=str)
+
+
+# Substrings that mark a JSON frame as draft-related
+_DRAFT_KEYWORDS = ("pick", "draft", "player", "team", "clock", "roster", "turn")
+
+# URL fragments that mark an endpoint as draft-related, matched in one scan
+_DRAFT_URL_PATTERN = re.compile(r'draft|live|room|socket', re.IGNORECASE)
+
+
+@dataclass(slots=True)
+class _MessageStats:
+    """Running per-endpoint message counts, updated as messages are recorded."""
+    total: int = 0
+    json_count: int = 0
+    draft_related: int = 0
+    message_types: Set[str] = field(default_factory=set)
+    protocols: Set[str] = field(default_factory=set)
+
+
 class WebSocketDiscovery:
     """
     Utility for analyzing and categorizing discovered WebSocket connections
     during ESPN draft room monitoring.
     """
     
-    def __init__(self):
+    def __init__(self, max_messages_per_endpoint: Optional[int] = 10_000,
+                 max_connections: Optional[int] = 1_000):
         self.discovered_endpoints: Set[str] = set()
-        self.message_patterns: Dict[str, List[Dict]] = {}
-        self.connection_metadata: List[Dict[str, Any]] = []
+        # Ring buffers of the most recent analyses per endpoint and of the most
+        # recent connections; None keeps everything. Summaries and schemas are
+        # maintained as messages arrive, so they still cover evicted entries.
+        self.max_messages_per_endpoint = max_messages_per_endpoint
+        self.message_patterns: Dict[str, Deque[Dict]] = {}
+        self.connection_metadata: Deque[Dict[str, Any]] = deque(maxlen=max_connections)
+        self._message_stats: Dict[str, _MessageStats] = {}
+        self._schemas: Dict[str, Dict[str, Any]] = {}
         
     def analyze_websocket_url(self, url: str) -> Dict[str, str]:
         """
@@ -39,13 +84,14 @@ class WebSocketDiscovery:
         }
         
         # Extract ESPN-specific patterns
-        if "espn" in url.lower():
+        lowered = url.lower()
+        if "espn" in lowered:
             analysis["service"] = "ESPN"
             
             # Look for draft-related paths
-            if "draft" in url.lower():
+            if "draft" in lowered:
                 analysis["purpose"] = "draft"
-            elif "fantasy" in url.lower():
+            elif "fantasy" in lowered:
                 analysis["purpose"] = "fantasy"
                 
         return analysis
@@ -53,7 +99,7 @@ class WebSocketDiscovery:
     def record_connection(self, url: str, timestamp: str = None):
         """Record a new WebSocket connection."""
         if not timestamp:
-            timestamp = datetime.now().isoformat()
+            timestamp = iso_now()
             
         self.discovered_endpoints.add(url)
         
@@ -74,16 +120,24 @@ class WebSocketDiscovery:
         """
         analysis = {
             "raw_payload": payload,
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": iso_now(),
             "size_bytes": len(payload),
             "is_json": False,
             "message_type": "unknown",
             "contains_draft_keywords": False
         }
         
-        # Try to parse as JSON
-        try:
-            parsed = json.loads(payload)
+        # Only frames opening with { or [ can hold a JSON object or array;
+        # socket.io envelopes, pings and other text skip the decode attempt
+        is_json = False
+        if payload.lstrip()[:1] in ('{', '['):
+            try:
+                parsed = _json_loads(payload)
+                is_json = True
+            except json.JSONDecodeError:
+                pass
+                
+        if is_json:
             analysis["is_json"] = True
             analysis["parsed_json"] = parsed
             
@@ -95,21 +149,16 @@ class WebSocketDiscovery:
                         analysis["message_type"] = parsed[type_field]
                         break
                         
-                # Look for draft-related content
-                draft_keywords = ["pick", "draft", "player", "team", "clock", "roster", "turn"]
-                message_str = json.dumps(parsed).lower()
-                
-                for keyword in draft_keywords:
-                    if keyword in message_str:
-                        analysis["contains_draft_keywords"] = True
-                        analysis["draft_keywords_found"] = [k for k in draft_keywords if k in message_str]
-                        break
+                # Look for draft-related content in the raw text we already
+                # have rather than re-serializing the parsed object
+                lowered = payload.lower()
+                found = [k for k in _DRAFT_KEYWORDS if k in lowered]
+                if found:
+                    analysis["contains_draft_keywords"] = True
+                    analysis["draft_keywords_found"] = found
                         
-        except json.JSONDecodeError:
-            # Try to find patterns in non-JSON messages
-            analysis["is_json"] = False
-            
-            # Look for common patterns
+        else:
+            # Look for common patterns in non-JSON messages
             if payload.startswith("42"):  # Socket.IO pattern
                 analysis["likely_protocol"] = "socket.io"
             elif payload.startswith("{") or payload.startswith("["):
@@ -122,28 +171,62 @@ class WebSocketDiscovery:
     def record_message_pattern(self, websocket_url: str, payload: str):
         """Record and categorize a message for pattern analysis."""
         if websocket_url not in self.message_patterns:
-            self.message_patterns[websocket_url] = []
+            self.message_patterns[websocket_url] = deque(maxlen=self.max_messages_per_endpoint)
+            self._message_stats[websocket_url] = _MessageStats()
             
         analysis = self.categorize_message(payload)
         self.message_patterns[websocket_url].append(analysis)
         
+        stats = self._message_stats[websocket_url]
+        stats.total += 1
+        if analysis["is_json"]:
+            stats.json_count += 1
+        if analysis["contains_draft_keywords"]:
+            stats.draft_related += 1
+        if analysis["message_type"] != "unknown":
+            stats.message_types.add(analysis["message_type"])
+            if analysis["is_json"]:
+                self._update_schema(analysis)
+        if analysis.get("likely_protocol"):
+            stats.protocols.add(analysis["likely_protocol"])
+            
+    def _update_schema(self, analysis: Dict[str, Any]):
+        """Fold one typed JSON message into the running schema for its type."""
+        msg_type = analysis["message_type"]
+        schema = self._schemas.get(msg_type)
+        if schema is None:
+            schema = self._schemas[msg_type] = {
+                "sample_count": 0,
+                "common_fields": set(),
+                "examples": []
+            }
+            
+        schema["sample_count"] += 1
+        
+        parsed = analysis.get("parsed_json")
+        if isinstance(parsed, dict):
+            schema["common_fields"].update(parsed.keys())
+            
+            if len(schema["examples"]) < 3:  # Keep up to 3 examples
+                schema["examples"].append(parsed)
+        
     def get_discovery_summary(self) -> Dict[str, Any]:
         """Get a summary of all discovered WebSocket activity."""
         summary = {
             "total_endpoints": len(self.discovered_endpoints),
             "endpoints": list(self.discovered_endpoints),
-            "connection_metadata": self.connection_metadata,
+            "connection_metadata": list(self.connection_metadata),
             "message_summary": {}
         }
         
-        # Summarize message patterns by endpoint
-        for url, messages in self.message_patterns.items():
+        # Summarize message patterns by endpoint from the running counts
+        for url, stats in self._message_stats.items():
             url_summary = {
-                "total_messages": len(messages),
-                "json_messages": len([m for m in messages if m["is_json"]]),
-                "draft_related_messages": len([m for m in messages if m["contains_draft_keywords"]]),
-                "unique_message_types": list(set([m["message_type"] for m in messages if m["message_type"] != "unknown"])),
-                "protocols_detected": list(set([m.get("likely_protocol", "") for m in messages if m.get("likely_protocol")]))
+                "total_messages": stats.total,
+                "json_messages": stats.json_count,
+                "draft_related_messages": stats.draft_related,
+                "unique_message_types": list(stats.message_types),
+                "protocols_detected": list(stats.protocols)
             }
             summary["message_summary"][url] = url_summary
             
@@ -160,14 +243,14 @@ class WebSocketDiscovery:
         
         for url in self.discovered_endpoints:
             # Check URL patterns
-            if any(keyword in url.lower() for keyword in ["draft", "live", "room", "socket"]):
+            if _DRAFT_URL_PATTERN.search(url):
                 draft_urls.append(url)
                 continue
                 
             # Check message content
-            if url in self.message_patterns:
-                messages = self.message_patterns[url]
-                draft_message_ratio = len([m for m in messages if m["contains_draft_keywords"]]) / len(messages)
+            stats = self._message_stats.get(url)
+            if stats:
+                draft_message_ratio = stats.draft_related / stats.total
                 
                 if draft_message_ratio > 0.1:  # More than 10% of messages are draft-related
                     draft_urls.append(url)
@@ -181,50 +264,52 @@ class WebSocketDiscovery:
         Returns:
             Dict mapping message types to their common schema patterns
         """
-        schemas = {}
-        
-        for url, messages in self.message_patterns.items():
-            json_messages = [m for m in messages if m["is_json"]]
-            
-            for message in json_messages:
-                msg_type = message["message_type"]
-                if msg_type == "unknown":
-                    continue
-                    
-                if msg_type not in schemas:
-                    schemas[msg_type] = {
-                        "sample_count": 0,
-                        "common_fields": set(),
-                        "examples": []
-                    }
-                    
-                schemas[msg_type]["sample_count"] += 1
-                
-                if "parsed_json" in message and isinstance(message["parsed_json"], dict):
-                    schemas[msg_type]["common_fields"].update(message["parsed_json"].keys())
-                    
-                    if len(schemas[msg_type]["examples"]) < 3:  # Keep up to 3 examples
-                        schemas[msg_type]["examples"].append(message["parsed_json"])
-                        
-        # Convert sets to lists for JSON serialization
-        for schema in schemas.values():
-            schema["common_fields"] = list(schema["common_fields"])
-            
-        return schemas
+        # Schemas are folded in by record_message_pattern; copy them out with
+        # sets converted to lists for JSON serialization
+        return {
+            msg_type: {
+                "sample_count": schema["sample_count"],
+                "common_fields": list(schema["common_fields"]),
+                "examples": list(schema["examples"])
+            }
+            for msg_type, schema in self._schemas.items()
+        }
         
     def save_discovery_report(self, filename: str):
-        """Save a comprehensive discovery report to file."""
-        report = {
-            "discovery_timestamp": datetime.now().isoformat(),
-            "summary": self.get_discovery_summary(),
-            "draft_websockets": self.identify_draft_websockets(),
-            "message_schemas": self.extract_message_schemas(),
-            "raw_message_patterns": self.message_patterns
-        }
+        """
+        Save a comprehensive discovery report to file.
+        
+        The summary sections are written first; recorded messages then follow
+        one per line, so the raw patterns are never re-encoded as one block.
+        The report is written as UTF-8 to a temporary path and renamed over
+        the target, so a failed save never leaves a truncated report behind.
         
+        Args:
+            filename: Path of the JSON report to write
+        """
+        tmp_filename = f"{filename}.tmp"
         try:
-            with open(filename, 'w') as f:
-                json.dump(report, f, indent=2, default=str)
+            with open(tmp_filename, 'w', encoding='utf-8') as f:
+                f.write('{\n')
+                f.write(f'  "discovery_timestamp": {_json_dumps(datetime.now().isoformat())},\n')
+                f.write(f'  "summary": {_json_dumps(self.get_discovery_summary())},\n')
+                f.write(f'  "draft_websockets": {_json_dumps(self.identify_draft_websockets())},\n')
+                f.write(f'  "message_schemas": {_json_dumps(self.extract_message_schemas())},\n')
+                f.write('  "raw_message_patterns": {')
+                url_separator = '\n    '
+                for url, messages in self.message_patterns.items():
+                    f.write(f'{url_separator}{_json_dumps(url)}: [')
+                    separator = '\n      '
+                    for message in messages:
+                        f.write(separator)
+                        f.write(_json_dumps(message))
+                        separator = ',\n      '
+                    f.write('\n    ]')
+                    url_separator = ',\n    '
+                f.write('\n  }\n}\n')
+            os.replace(tmp_filename, filename)
             print(f"Discovery report saved to {filename}")
         except Exception as e:
-            print(f"Failed to save discovery report: {e}")
\ No newline at end of file
+            print(f"Failed to save discovery report: {e}")
+            if os.path.exists(tmp_filename):
+                os.remove(tmp_filename)
\ No newline at end of file